@@ -1,3 +1,25 @@
-from .badges import CoverageBadge
-from .colors import ShieldIO6Color, BadgeColor
-from .coverage import JestCoverageJsonSummaryParser
+from importlib import import_module
+
+# public classes are imported on first access (PEP 562), so entry points
+# only load the modules they actually use
+LAZY_ATTRIBUTES = {
+    "CoverageBadge": ".badges",
+    "ShieldIO6Color": ".colors",
+    "BadgeColor": ".colors",
+    "JestCoverageJsonSummaryParser": ".coverage",
+}
+
+__all__ = list(LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -10,78 +10,364 @@ Copyright (c) 2021 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
 main procedure of action
 """
 from argparse import ArgumentError, ArgumentParser
-from github.MainClass import Github
+from glob import glob
 from json import load as jsonload
 from os import environ
-from re import search as research, MULTILINE
+from pathlib import Path
 
-from .reports import JESTJunitXML, PytestJunitXML
 from .coverage import JestCoverageJsonSummaryParser, PythonCoverageParser
+from .coverage_merge import read_coverage
+from .diff_coverage import ChangedLines, DiffCoverage
+from .durations import DurationAnalysis, DurationBaseline
+from .flaky import FlakyAnalysis
+from .formats import FORMATS, get_junit_class
+from .history import History
+from .payloads import Payloads
+from .summary import SORT_KEYS, CoverageSummary
+from .timing import StageTimer, run_profiled
 
-SUPPORTED_LANGUAGES = [
-    "python",
-    "javascript"
-]
+# JUnit XML format, coverage parser and default coverage report
+LANGUAGES = {
+    "python": ("pytest", PythonCoverageParser, "coverage.json"),
+    "javascript": (
+        "jest", JestCoverageJsonSummaryParser,
+        "coverage/coverage-summary.json"
+    ),
+    # test results of any other producer, e.g. go, java or rust, without
+    # coverage
+    "other": ("auto", None, None),
+}
+SUPPORTED_LANGUAGES = list(LANGUAGES)
 
 
-def main(language, github_token):
+# the network stack is imported on demand, so parsing and rendering paths
+# start without loading PyGithub and asyncio
+
+
+async def publish(github_token, check_runs, issue_number, comment):
+    from .async_publisher import AsyncPublisher
+    from .transport import GITHUB_API_URL, PooledHTTPTransport
+    async with PooledHTTPTransport(
+        github_token, environ.get("GITHUB_API_URL", GITHUB_API_URL)
+    ) as transport:
+        publisher = AsyncPublisher(transport, environ["GITHUB_REPOSITORY"])
+        await publisher.publish(check_runs, issue_number, comment)
+
+
+def publish_sync(github_token, check_runs, issue_number, comment):
+    from github.MainClass import Github
+    from .publisher import CheckRunPublisher
     github = Github(github_token)
     repo = github.get_repo(environ["GITHUB_REPOSITORY"])
-    with open(environ["GITHUB_EVENT_PATH"]) as filehandler:
-        event_dict = jsonload(filehandler)
+    publisher = CheckRunPublisher(github, repo)
+    for check_run in check_runs:
+        publisher.publish(check_run)
+    if issue_number is not None:
+        repo.get_issue(issue_number).create_comment(comment)
+
+
+def read_junit(junit_format, pattern):
+    paths = sorted(glob(pattern, recursive=True))
+    if not paths:
+        raise FileNotFoundError(f"No JUnit XML file matches '{pattern}'.")
+    junit_class = get_junit_class(junit_format, paths)
+    if len(paths) == 1:
+        with open(paths[0]) as junit_file:
+            return junit_class.from_file(junit_file, stream=True)
+    # sharded test jobs, parsed in parallel and merged into one check run
+    return junit_class.from_files(paths)
+
+
+def read_coverage_reports(coverage_class, pattern):
+    paths = sorted(glob(pattern, recursive=True))
+    if not paths:
+        raise FileNotFoundError(f"No coverage report matches '{pattern}'.")
+    # reports of sharded test jobs are merged line by line
+    return read_coverage(coverage_class, paths)
+
+
+def read_changed_lines(diff, diff_coverage, event_dict, commit_hash):
+    if diff is not None:
+        with open(diff) as diff_file:
+            return ChangedLines.from_diff(diff_file)
+    if diff_coverage and "pull_request" in event_dict:
+        return ChangedLines.from_git(
+            event_dict["pull_request"]["base"]["sha"], commit_hash
+        )
+    return None
+
+
+def get_branches(event_dict):
     if "pull_request" in event_dict:
-        commit_hash = event_dict["pull_request"]["head"]["sha"]
-    else:
-        commit_hash = environ["GITHUB_SHA"]
-
-    if language == "javascript":
-        with open("junit.xml") as junit_file:
-            junit = JESTJunitXML.from_file(junit_file)
-        with open("coverage/coverage-summary.json") as cov_file:
-            coverage = JestCoverageJsonSummaryParser()
-            coverage.parse(cov_file)
-        with open("jest.txt") as rawfile:
-            coverage_lines = research(
-                r"(^-+\|[\w\W]*\|-+$)", rawfile.read(), MULTILINE
-            )[1].split("\n")
-            summary = "\n".join(coverage_lines[:4])
-            details = "\n".join(coverage_lines[4:])
-
-    elif language == "python":
-        with open("junit.xml") as junit_file:
-            junit = PytestJunitXML.from_file(junit_file)
-        with open("coverage.json") as cov_file:
-            coverage = PythonCoverageParser()
-            coverage.parse(cov_file)
-        with open("coverage.txt") as cov_file:
-            coverage_lines = cov_file.read().split("\n")
-            summary = "\n".join(coverage_lines[:2] + coverage_lines[-2:-1])
-            details = "\n".join(coverage_lines[2:-2])
-    else:
-        raise ArgumentError("Unknown language.")
+        return (
+            event_dict["pull_request"]["head"]["ref"],
+            event_dict["pull_request"]["base"]["ref"]
+        )
+    return environ.get("GITHUB_REF_NAME"), None
 
-    print(
-        "::set-output name=coverage::%d" % (
-            coverage.get_relative_coverage('statements')
+
+def record_history(
+    history, branch, base_branch, commit_hash, coverage, junit
+):
+    delta = None if base_branch is None or coverage is None else \
+        history.get_coverage_delta(
+            base_branch, coverage.get_relative_coverage("statements")
         )
-    )
-    # upload PR Check
-    check_run = junit.create_check_run(commit_hash)
-    repo.create_check_run(**check_run.to_dict())
+    history.record(commit_hash, branch, coverage, junit)
+    if delta is None:
+        return None
+    print("::set-output name=coverage-delta::%.2f" % delta)
+    return f"Statement coverage changed by {delta:+.2f} percentage points " \
+        f"compared to `{base_branch}`."
 
+
+def get_commit_hash(event_dict):
     if "pull_request" in event_dict:
-        coverage_raw = "<details><summary><link>expand</link>\n" + \
-            f"<pre>{summary}</pre></summary><pre>{details}</pre></details>"
-        issue = repo.get_issue(event_dict["pull_request"]["number"])
-        issue.create_comment(coverage_raw)
+        return event_dict["pull_request"]["head"]["sha"]
+    if "GITHUB_SHA" in environ:
+        return environ["GITHUB_SHA"]
+    # local dry run
+    from subprocess import run
+    return run(
+        ["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+        check=True
+    ).stdout.strip()
+
+
+def main(
+    language, github_token, *, sync=False, junit_pattern="junit.xml",
+    diff=None, diff_coverage=False, comment_sort="missing",
+    comment_files=100, history=None, baseline_junit=None,
+    coverage_pattern=None, dry_run=None, trace=None, junit_format=None,
+    partial=False
+):
+    timer = StageTimer(trace_memory=trace is not None)
+    # tracemalloc is stopped even if a stage raises
+    try:
+        event_dict = {}
+        if "GITHUB_EVENT_PATH" in environ or dry_run is None:
+            with open(environ["GITHUB_EVENT_PATH"]) as filehandler:
+                event_dict = jsonload(filehandler)
+        commit_hash = get_commit_hash(event_dict)
+
+        if language not in LANGUAGES:
+            raise ArgumentError("Unknown language.")
+        default_format, coverage_class, default_coverage = LANGUAGES[language]
+        junit_format = junit_format or default_format
+        coverage_pattern = coverage_pattern or default_coverage
+        # the changed lines are all the coverage a partial run reports
+        diff_coverage = diff_coverage or partial
+        with timer.stage("junit"):
+            junit = read_junit(junit_format, junit_pattern)
+        coverage = None
+        if coverage_class is not None:
+            with timer.stage("coverage"):
+                coverage = read_coverage_reports(
+                    coverage_class, coverage_pattern
+                )
+
+        # totals of a run of the affected tests only are meaningless, its
+        # coverage is reported for the changed lines only
+        if not partial and coverage is not None:
+            for metric, value in coverage.iter_relative_coverage():
+                if metric == "statements":
+                    print("::set-output name=coverage::%d" % value)
+                else:
+                    # metrics not measured, e.g. branches, have no output
+                    print(
+                        "::set-output name=%s-coverage::%d" % (metric, value)
+                    )
+        print("::set-output name=tests::%d" % junit.ntests)
+        print("::set-output name=pass-rate::%d" % junit.get_pass_rate())
+        note = baseline = None
+        if baseline_junit is not None:
+            with timer.stage("baseline"):
+                baseline = DurationBaseline.from_store(
+                    read_junit(junit_format, baseline_junit).store,
+                    baseline_junit
+                )
+        if history is None:
+            with timer.stage("flaky"):
+                flaky = FlakyAnalysis.analyze(
+                    junit.store, retried=junit.retried
+                )
+        else:
+            branch, base_branch = get_branches(event_dict)
+            with History(history) as stored_runs:
+                if baseline is None:
+                    with timer.stage("baseline"):
+                        baseline = DurationBaseline.from_history(
+                            stored_runs, branch=base_branch or branch
+                        )
+                # flip rates of the base branch, failures on other pull request
+                # branches may be expected
+                with timer.stage("flaky"):
+                    flaky = FlakyAnalysis.analyze(
+                        junit.store, stored_runs, branch=base_branch or branch,
+                        retried=junit.retried
+                    )
+                if not partial:
+                    with timer.stage("history"):
+                        note = record_history(
+                            stored_runs, branch, base_branch, commit_hash,
+                            coverage, junit
+                        )
+        with timer.stage("durations"):
+            durations = DurationAnalysis.analyze(junit.store, baseline)
+        with timer.stage("check run"):
+            check_runs = [junit.create_check_run(
+                commit_hash, group=True, durations=durations, flaky=flaky
+            )]
+        if coverage is not None:
+            with timer.stage("diff coverage"):
+                changed = read_changed_lines(
+                    diff, diff_coverage, event_dict, commit_hash
+                )
+                if changed is not None:
+                    patch_coverage = DiffCoverage.compute(changed, coverage)
+                    print(
+                        "::set-output name=patch-coverage::%d" % (
+                            patch_coverage.get_relative_coverage()
+                        )
+                    )
+                    check_runs.append(
+                        patch_coverage.create_check_run(commit_hash)
+                    )
+
+        # upload PR Check and coverage comment, a dry run renders the comment
+        # even outside of pull requests
+        issue_number = coverage_raw = None
+        if coverage is not None and not partial and (
+            "pull_request" in event_dict or dry_run is not None
+        ):
+            with timer.stage("comment"):
+                coverage_raw = CoverageSummary.from_reporter(
+                    coverage, comment_sort, comment_files, Path.cwd()
+                ).render_comment(note=note)
+            issue_number = event_dict.get("pull_request", {}).get("number")
+        if dry_run is not None:
+            Payloads.create(
+                check_runs, issue_number, coverage_raw, timer.to_dict()
+            ).write(Path(dry_run))
+        elif sync:
+            with timer.stage("publish"):
+                publish_sync(
+                    github_token, check_runs, issue_number, coverage_raw
+                )
+        else:
+            from asyncio import run
+            with timer.stage("publish"):
+                run(publish(
+                    github_token, check_runs, issue_number, coverage_raw
+                ))
+        timer.print_outputs()
+        if trace is not None:
+            timer.write_trace(Path(trace))
+    finally:
+        timer.stop()
+    return timer
 
 
 if __name__ == "__main__":
     parser = ArgumentParser(description=__doc__)
     parser.add_argument(
         "language", choices=SUPPORTED_LANGUAGES,
-        help="Select language."
+        help="Select language, 'other' reports the test results of any "
+        "JUnit XML producer without coverage."
+    )
+    parser.add_argument(
+        "github_token", nargs="?",
+        help="Github token for API connection, not needed for dry runs."
+    )
+    parser.add_argument(
+        "--sync", action="store_true",
+        help="Publish with blocking PyGithub calls instead of the "
+        "asynchronous connection pool."
+    )
+    parser.add_argument(
+        "--junit", dest="junit_pattern", default="junit.xml",
+        help="Glob pattern of JUnit XML files. Several matching files, e.g. "
+        "from sharded test jobs, are merged into one check run. "
+        "Default is 'junit.xml'."
+    )
+    parser.add_argument(
+        "--format", dest="junit_format", choices=["auto", *FORMATS],
+        help="Producer of the JUnit XML files, 'auto' detects it from the "
+        "beginning of the first file. Default is 'pytest' for python, "
+        "'jest' for javascript and 'auto' for other languages."
+    )
+    parser.add_argument(
+        "--coverage", dest="coverage_pattern",
+        help="Glob pattern of coverage reports. Reports of sharded test "
+        "jobs are merged, statements count as covered if any job executed "
+        "them. Default is 'coverage/coverage-summary.json' for javascript "
+        "and 'coverage.json' for python, other languages report test "
+        "results only."
+    )
+    parser.add_argument(
+        "--diff",
+        help="Unified diff file. Coverage of the changed lines is reported "
+        "as diff-coverage check run."
+    )
+    parser.add_argument(
+        "--diff-coverage", action="store_true",
+        help="Report coverage of the lines changed by the pull request, "
+        "using git diff against the pull request base."
+    )
+    parser.add_argument(
+        "--comment-sort", default="missing", choices=list(SORT_KEYS),
+        help="Order of the files in the coverage comment: most missing "
+        "statements, lowest coverage or name first. Default is 'missing'."
+    )
+    parser.add_argument(
+        "--comment-files", type=int, default=100,
+        help="Maximal number of files in the coverage comment. Default is "
+        "100, fewer are shown if the comment would exceed GitHub's size "
+        "limit."
+    )
+    parser.add_argument(
+        "--history",
+        help="SQLite database the coverage and test results of every run "
+        "are appended to. Pull requests are compared against the latest run "
+        "of their base branch."
+    )
+    parser.add_argument(
+        "--baseline-junit",
+        help="Glob pattern of JUnit XML files of an earlier run, e.g. of the "
+        "base branch, tests that got significantly slower are reported. "
+        "Default is the history, if given."
+    )
+    parser.add_argument(
+        "--dry-run", metavar="PATH",
+        help="Write check run and comment payloads together with the "
+        "duration of every stage to a json file, or ndjson if PATH ends with "
+        ".ndjson, instead of publishing them. Works without GitHub "
+        "environment, payloads can be uploaded later with "
+        "`python -m action.payloads`."
+    )
+    parser.add_argument(
+        "--trace", metavar="PATH",
+        help="Write duration and tracemalloc peak of every stage to a json "
+        "file. Tracing allocations slows the stages down."
+    )
+    parser.add_argument(
+        "--profile", metavar="PATH",
+        help="Run under cProfile and write the statistics to PATH."
+    )
+    parser.add_argument(
+        "--partial", action="store_true",
+        help="Only the tests affected by the changes ran. Coverage is "
+        "reported for the lines changed by the pull request only, as with "
+        "--diff-coverage, neither the coverage outputs and comment nor the "
+        "history are updated."
     )
-    parser.add_argument("github_token", help="Github token for API connection")
     args = parser.parse_args()
-    main(args.language, args.github_token)
+    if args.github_token is None and args.dry_run is None:
+        parser.error("github_token required unless --dry-run is given.")
+    # destinations of the options are the parameters of main
+    arguments = vars(args)
+    profile = arguments.pop("profile")
+    if profile is None:
+        main(**arguments)
+    else:
+        run_profiled(Path(profile), main, **arguments)
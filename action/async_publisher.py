@@ -0,0 +1,195 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+asynchronous publishing of check runs and comments to github
+"""
+from asyncio import gather, sleep
+from logging import getLogger
+from time import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from .git_data import CheckRun, MAX_ANNOTATIONS_PER_REQUEST, iter_batches
+from .payloads import serialize
+from .transport import GithubAPIError, Response, Transport
+
+logger = getLogger(__file__)
+
+
+class AsyncPublisher:
+    """Publish check runs and pull request comments through a transport.
+    Independent requests like the check runs and the comment are sent
+    concurrently over the connection pool of the transport. Writes to one
+    check run are sent in order, after the check run has been created its
+    remaining annotation batches follow one by one on a kept-alive
+    connection, as concurrent writes to one resource trigger GitHub's
+    secondary rate limits and would append the batches in any order.
+
+    Args:
+        transport (Transport): transport sending the requests
+        repository (str): owner and name of repository, e.g. "org/repo"
+        batch_size (int, optional): annotations per request.
+            Defaults to MAX_ANNOTATIONS_PER_REQUEST.
+        wait (Callable[[float], Awaitable[None]], optional): coroutine
+            function used to wait for the rate limit reset.
+            Defaults to asyncio.sleep.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        repository: str,
+        batch_size: int = MAX_ANNOTATIONS_PER_REQUEST,
+        wait: Callable[[float], Awaitable[None]] = sleep
+    ) -> None:
+        if not 0 < batch_size <= MAX_ANNOTATIONS_PER_REQUEST:
+            raise ValueError(
+                "Batch size has to be between 1 and "
+                f"{MAX_ANNOTATIONS_PER_REQUEST}."
+            )
+        self.transport = transport
+        self.repository = repository
+        self.batch_size = batch_size
+        self.wait = wait
+        self.remaining: Optional[int] = None
+        self.reset: float = 0
+
+    async def publish(
+        self,
+        check_runs: Sequence[CheckRun],
+        issue_number: Optional[int] = None,
+        comment: Optional[str] = None
+    ) -> List[Any]:
+        """Publish check runs and optional comment concurrently.
+
+        Args:
+            check_runs (Sequence[CheckRun]): check runs to publish
+            issue_number (Optional[int], optional): pull request number to
+                comment on. Defaults to None.
+            comment (Optional[str], optional): comment body.
+                Defaults to None.
+
+        Returns:
+            List[Any]: created check run and comment objects
+        """
+        requests = [
+            self.create_check_run(check_run) for check_run in check_runs
+        ]
+        if issue_number is not None and comment is not None:
+            requests.append(self.create_comment(issue_number, comment))
+        return await gather(*requests)
+
+    async def publish_payloads(
+        self,
+        check_runs: Sequence[Dict[str, Any]],
+        issue_number: Optional[int] = None,
+        comment: Optional[str] = None
+    ) -> List[Any]:
+        """Publish serialized check runs, e.g. written by a dry run, and
+        optional comment concurrently.
+
+        Args:
+            check_runs (Sequence[Dict[str, Any]]): check run payloads
+            issue_number (Optional[int], optional): pull request number to
+                comment on. Defaults to None.
+            comment (Optional[str], optional): comment body.
+                Defaults to None.
+
+        Returns:
+            List[Any]: created check run and comment objects
+        """
+        requests = [
+            self.post_check_run(dict(payload)) for payload in check_runs
+        ]
+        if issue_number is not None and comment is not None:
+            requests.append(self.create_comment(issue_number, comment))
+        return await gather(*requests)
+
+    async def create_check_run(self, check_run: CheckRun) -> Any:
+        return await self.post_check_run(serialize(check_run))
+
+    async def post_check_run(self, payload: Dict[str, Any]) -> Any:
+        output = payload.pop("output", None)
+        annotations = [] if output is None \
+            else output.get("annotations", [])
+        batches = iter_batches(annotations, self.batch_size)
+        if output is not None:
+            payload["output"] = dict(output, annotations=next(batches, []))
+        response = await self.request(
+            "POST", f"/repos/{self.repository}/check-runs", payload
+        )
+        path = f"/repos/{self.repository}/check-runs/{response.data['id']}"
+        for batch in batches:
+            await self.append_annotations(path, output, batch)
+        logger.info(
+            "Published check run %s with %i annotations.",
+            payload["name"], len(annotations)
+        )
+        return response.data
+
+    async def append_annotations(
+        self,
+        path: str,
+        output: Dict[str, Any],
+        annotations: List[Dict[str, Any]]
+    ) -> None:
+        await self.request(
+            "PATCH", path, {"output": dict(output, annotations=annotations)}
+        )
+
+    async def create_comment(self, issue_number: int, body: str) -> Any:
+        response = await self.request(
+            "POST",
+            f"/repos/{self.repository}/issues/{issue_number}/comments",
+            {"body": body}
+        )
+        return response.data
+
+    async def request(
+        self, method: str, path: str, payload: Optional[Any] = None
+    ) -> Response:
+        """Send request, waiting for rate limit resets when necessary.
+
+        Raises:
+            GithubAPIError: api answered with an error status
+
+        Returns:
+            Response: successful response
+        """
+        while True:
+            if self.remaining is not None and self.remaining < 1:
+                await self.wait_for_reset(None)
+            response = await self.transport.request(method, path, payload)
+            self.update_rate_limit(response)
+            if response.status < 300:
+                return response
+            if response.status in (403, 429) and (
+                "retry-after" in response.headers
+                or self.remaining == 0
+            ):
+                await self.wait_for_reset(
+                    response.headers.get("retry-after")
+                )
+                continue
+            raise GithubAPIError(response.status, response.data)
+
+    def update_rate_limit(self, response: Response) -> None:
+        if "x-ratelimit-remaining" in response.headers:
+            self.remaining = int(response.headers["x-ratelimit-remaining"])
+        if "x-ratelimit-reset" in response.headers:
+            self.reset = float(response.headers["x-ratelimit-reset"])
+
+    async def wait_for_reset(self, retry_after: Optional[str]) -> None:
+        if retry_after is not None:
+            delay = float(retry_after)
+        else:
+            delay = max(self.reset - time(), 0) + 1
+        logger.warning("Rate limit reached, waiting %.0fs.", delay)
+        # concurrent requests must not wait a second time
+        self.remaining = None
+        await self.wait(delay)
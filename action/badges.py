@@ -10,8 +10,11 @@ Copyright (c) 2021 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
 creating svg badges
 """
 from dataclasses import InitVar, dataclass, field
+from hashlib import sha256
+from html import escape
 from logging import getLogger
-from typing import ClassVar, TextIO
+from pathlib import Path
+from typing import ClassVar, Dict, List, NamedTuple, Optional, TextIO, Tuple
 
 from .colors import BadgeColor
 
@@ -20,16 +23,20 @@ logger = getLogger(__file__)
 
 @dataclass
 class CoverageBadge:
-    """svg badge class
+    """svg badge class, the svgs of all 101 relative coverages are rendered
+    once per palette and thresholds
     """
     relative_coverage: int
 
     color_name: str = field(init=False)
     color_code: str = field(init=False, repr=False)
     svg: str = field(init=False, repr=False)
+    content_hash: str = field(init=False, repr=False)
 
     color: InitVar[BadgeColor]
 
+    tables: ClassVar[Dict[Tuple[str, Tuple[int, ...]], List[str]]] = {}
+
     template: ClassVar[str] = field(
         repr=False,
         default='''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="96" height="20" role="img" aria-label="coverage: {relative_coverage}%">
@@ -59,15 +66,44 @@ class CoverageBadge:
         self.color_name, self.color_code = color.get_color(
             self.relative_coverage
         )
-        self.svg = CoverageBadge.template.format(
-            relative_coverage=self.relative_coverage,
-            color=self.color_code
-        )
+        if isinstance(color, BadgeColor) \
+                and 0 <= self.relative_coverage <= 100:
+            self.svg = CoverageBadge.get_table(color)[self.relative_coverage]
+        else:
+            self.svg = CoverageBadge.template.format(
+                relative_coverage=self.relative_coverage,
+                color=self.color_code
+            )
+        # the svg is fully determined by coverage, palette and thresholds
+        self.content_hash = sha256(self.svg.encode()).hexdigest()
         logger.debug(
             "Created %s coverage badge for relative coverage of %i.",
             self.color_name, self.relative_coverage
         )
 
+    @classmethod
+    def get_table(cls, color: BadgeColor) -> List[str]:
+        """Get the svgs of all relative coverages from 0 to 100.
+
+        Args:
+            color (BadgeColor): palette and thresholds
+
+        Returns:
+            List[str]: svg per relative coverage
+        """
+        key = (type(color).__name__, tuple(color.thresholds))
+        table = cls.tables.get(key)
+        if table is None:
+            table = cls.tables[key] = [
+                cls.template.format(
+                    relative_coverage=relative_coverage,
+                    color=color.get_color(relative_coverage)[1]
+                )
+                for relative_coverage in range(101)
+            ]
+            logger.debug("Rendered badges of %s.", repr(color))
+        return table
+
     def dump(self, file_handler: TextIO):
         """Dump badge SVG to file.
 
@@ -93,3 +129,184 @@ class CoverageBadge:
             repr(self)
         )
         return self.svg
+
+
+# widths of Verdana 11px characters in px, as used by shields.io
+CHAR_WIDTHS = {
+    " ": 3.87, "%": 12.31, "(": 4.55, ")": 4.55, "+": 9.17, ",": 3.63,
+    "-": 4.99, ".": 3.63, "/": 4.99, ":": 4.55, "_": 7.0,
+    "A": 7.52, "B": 7.54, "C": 7.68, "D": 8.48, "E": 6.96, "F": 6.32,
+    "G": 8.53, "H": 8.27, "I": 4.63, "J": 5.0, "K": 7.62, "L": 6.12,
+    "M": 9.27, "N": 8.23, "O": 8.66, "P": 6.63, "Q": 8.66, "R": 7.65,
+    "S": 7.52, "T": 6.78, "U": 8.05, "V": 7.52, "W": 10.88, "X": 7.54,
+    "Y": 6.77, "Z": 7.54,
+    "a": 6.61, "b": 6.85, "c": 5.73, "d": 6.85, "e": 6.55, "f": 3.87,
+    "g": 6.85, "h": 6.96, "i": 3.02, "j": 3.79, "k": 6.51, "l": 3.02,
+    "m": 10.68, "n": 6.96, "o": 6.68, "p": 6.85, "q": 6.85, "r": 4.69,
+    "s": 5.73, "t": 4.33, "u": 6.96, "v": 6.51, "w": 8.99, "x": 6.51,
+    "y": 6.51, "z": 5.78,
+}
+DEFAULT_CHAR_WIDTH = 7.0  # digits and unknown characters
+TEXT_PADDING = 5
+
+
+def get_text_width(text: str) -> int:
+    """Width of a text rendered in Verdana 11px.
+
+    Args:
+        text (str): text
+
+    Returns:
+        int: width in px, rounded up
+    """
+    width = sum(CHAR_WIDTHS.get(char, DEFAULT_CHAR_WIDTH) for char in text)
+    return int(width) + (width % 1 > 0)
+
+
+@dataclass
+class Badge:
+    """svg badge with arbitrary label and value, the width of both parts
+    follows their text
+    """
+    label: str
+    value: str
+    color_code: str = field(repr=False)
+
+    svg: str = field(init=False, repr=False)
+    content_hash: str = field(init=False, repr=False)
+
+    template: ClassVar[str] = field(
+        repr=False,
+        default='''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="{width}" height="20" role="img" aria-label="{label}: {value}">
+    <title>{label}: {value}</title>
+	<linearGradient id="s" x2="0" y2="100%">
+		<stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
+		<stop offset="1" stop-opacity=".1"/>
+	</linearGradient>
+	<clipPath id="r">
+		<rect width="{width}" height="20" rx="3" fill="#fff"/>
+	</clipPath>
+	<g clip-path="url(#r)">
+		<rect width="{label_width}" height="20" fill="#555"/>
+		<rect x="{label_width}" width="{value_width}" height="20" fill="{color}"/>
+		<rect width="{width}" height="20" fill="url(#s)"/>
+	</g>
+	<g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="110">
+		<text aria-hidden="true" x="{label_x}" y="150" fill="#010101" fill-opacity=".3" transform="scale(.1)" textLength="{label_length}">{label}</text>
+		<text x="{label_x}" y="140" transform="scale(.1)" fill="#fff" textLength="{label_length}">{label}</text>
+		<text aria-hidden="true" x="{value_x}" y="150" fill="#010101" fill-opacity=".3" transform="scale(.1)" textLength="{value_length}">{value}</text>
+		<text x="{value_x}" y="140" transform="scale(.1)" fill="#fff" textLength="{value_length}">{value}</text>
+	</g>
+</svg>'''  # noqa
+    )
+
+    def __post_init__(self):
+        label_length = get_text_width(self.label)
+        value_length = get_text_width(self.value)
+        label_width = label_length + 2 * TEXT_PADDING
+        value_width = value_length + 2 * TEXT_PADDING
+        # text coordinates are scaled by 10
+        self.svg = Badge.template.format(
+            label=escape(self.label),
+            value=escape(self.value),
+            color=self.color_code,
+            width=label_width + value_width,
+            label_width=label_width,
+            value_width=value_width,
+            label_x=label_width * 5,
+            value_x=label_width * 10 + value_width * 5,
+            label_length=label_length * 10,
+            value_length=value_length * 10,
+        )
+        self.content_hash = sha256(self.svg.encode()).hexdigest()
+
+    def dump(self, file_handler: TextIO):
+        """Dump badge SVG to file.
+
+        Args:
+            file_handler (TextIO): file IO
+        """
+        file_handler.write(self.svg)
+        logger.debug("Dumped %s to file.", repr(self))
+
+
+class BadgeMetric(NamedTuple):
+    """Metric shown by a badge.
+
+    Args:
+        label (str): default label
+        unit (str): appended to the value
+        colored (bool): colored by the thresholds of the palette, otherwise
+            blue
+    """
+    label: str
+    unit: str = "%"
+    colored: bool = True
+
+
+BADGE_METRICS = {
+    "statements": BadgeMetric("coverage"),
+    "lines": BadgeMetric("lines"),
+    "branches": BadgeMetric("branches"),
+    "functions": BadgeMetric("functions"),
+    "tests": BadgeMetric("tests", "", False),
+    "pass-rate": BadgeMetric("passed"),
+}
+NEUTRAL_COLOR = "#007ec6"
+
+
+def render_badges(
+    values: Dict[str, int],
+    color: BadgeColor,
+    labels: Optional[Dict[str, str]] = None
+) -> Dict[str, Badge]:
+    """Render a badge per metric.
+
+    Args:
+        values (Dict[str, int]): value per metric of BADGE_METRICS
+        color (BadgeColor): palette and thresholds of percentages
+        labels (Optional[Dict[str, str]], optional): labels replacing the
+            default ones. Defaults to None.
+
+    Raises:
+        ValueError: unknown metric
+
+    Returns:
+        Dict[str, Badge]: badge per metric
+    """
+    labels = labels or {}
+    badges = {}
+    for metric, value in values.items():
+        if metric not in BADGE_METRICS:
+            raise ValueError(f"Unknown metric '{metric}'.")
+        label, unit, colored = BADGE_METRICS[metric]
+        badges[metric] = Badge(
+            labels.get(metric, label),
+            f"{value}{unit}",
+            color.get_color(value)[1] if colored else NEUTRAL_COLOR
+        )
+    logger.debug("Rendered %i badges.", len(badges))
+    return badges
+
+
+def write_badges(badges: Dict[str, Badge], directory: Path) -> List[Path]:
+    """Write badges as <metric>.svg, each next to its <metric>.sha256
+    content hash.
+
+    Args:
+        badges (Dict[str, Badge]): badge per metric
+        directory (Path): output directory, created if missing
+
+    Returns:
+        List[Path]: written svg files
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for metric, badge in badges.items():
+        path = directory / f"{metric}.svg"
+        with open(path, "w") as file_handler:
+            badge.dump(file_handler)
+        path.with_suffix(".sha256").write_text(badge.content_hash + "\n")
+        paths.append(path)
+    logger.info("Wrote %i badges to %s.", len(paths), directory)
+    return paths
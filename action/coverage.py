@@ -13,22 +13,95 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from json import load as json_load
 from logging import getLogger
-from typing import Any, ClassVar, Dict, List, TextIO, Union
+from typing import (
+    Any, ClassVar, Dict, Iterator, List, Mapping, NamedTuple, Optional,
+    TextIO, Tuple, Union
+)
+
+from .json_index import LazyJSONObject, read_buffer
 
 logger = getLogger(__file__)
 
 
+class UnmeasuredMetricException(ValueError):
+    """Metric not measured by the report, e.g. branches without branch
+    coverage.
+    """
+
+
 class Parser(ABC):
     @abstractmethod
     def parse(self, file_handler: TextIO) -> None:
         ...
 
 
+class FileCoverage(NamedTuple):
+    """Coverage of a single file or of the whole report.
+
+    Args:
+        path (str): path of file as written in the report
+        statements (int): number of statements
+        missing (int): number of statements not executed
+        percentages (Dict[str, float]): relative coverage per metric
+        missing_lines (Optional[List[int]]): lines not executed, None if the
+            report has no line data
+    """
+    path: str
+    statements: int
+    missing: int
+    percentages: Dict[str, float]
+    missing_lines: Optional[List[int]] = None
+
+
 class CoverageReporter(Parser, ABC):
     @abstractmethod
     def get_relative_coverage(self, metric: str) -> int:
         ...
 
+    def get_file_lines(
+        self, path: str
+    ) -> Optional[Tuple[List[int], List[int]]]:
+        """Get line level coverage of a file.
+
+        Args:
+            path (str): path of file as written in the report
+
+        Returns:
+            Optional[Tuple[List[int], List[int]]]: sorted executed and missing
+                lines, None if the file or line data is not in the report
+        """
+        return None
+
+    def get_total_coverage(self) -> Optional[FileCoverage]:
+        """Get coverage of the whole report.
+
+        Returns:
+            Optional[FileCoverage]: totals, None if not supported
+        """
+        return None
+
+    def iter_file_coverage(self) -> Iterator[FileCoverage]:
+        """Iterate over coverage of each file in the report.
+
+        Yields:
+            FileCoverage: coverage of a file
+        """
+        return iter(())
+
+    def iter_relative_coverage(self) -> Iterator[Tuple[str, int]]:
+        """Iterate over the relative coverage of each metric measured in
+        the report.
+
+        Yields:
+            Tuple[str, int]: metric and relative coverage
+        """
+        for metric in getattr(self, "metrics", ["statements"]):
+            try:
+                value = self.get_relative_coverage(metric)
+            except UnmeasuredMetricException:
+                continue
+            yield metric, value
+
 
 @dataclass
 class JestCoverageJsonSummaryParser(CoverageReporter):
@@ -57,15 +130,37 @@ class JestCoverageJsonSummaryParser(CoverageReporter):
             raise ValueError("Unknown metric.")
         return int(self.total[metric]["pct"])
 
+    def summarize(self, path: str, report: Dict[str, Any]) -> FileCoverage:
+        statements = report["statements"]
+        return FileCoverage(
+            path=path,
+            statements=statements["total"],
+            missing=statements["total"] - statements["covered"],
+            percentages={
+                metric: report[metric]["pct"]
+                for metric in ("statements", "branches", "functions", "lines")
+            }
+        )
+
+    def get_total_coverage(self) -> FileCoverage:
+        return self.summarize("TOTAL", self.total)
+
+    def iter_file_coverage(self) -> Iterator[FileCoverage]:
+        for path, report in self.files.items():
+            yield self.summarize(path, report)
+
 
 @dataclass
 class PythonCoverageParser(CoverageReporter):
     """Parse python coverage reports generated by
     coverage.io.
+    Only totals and meta data are decoded while parsing. Per-file reports
+    are indexed by their position in the file and decoded on access, so
+    huge reports neither have to be decoded nor held in memory as objects.
     """
     total: Dict[str, Dict[str, Union[int, float]]] = \
         field(init=False, repr=False)
-    files: Dict[str, Any] = field(init=False, repr=False)
+    files: Mapping[str, Any] = field(init=False, repr=False)
     metadata: Dict[str, Any] = field(init=False, repr=False)
     metrics: ClassVar[List[str]] = [
         "statements", "lines", "branches"
@@ -75,7 +170,9 @@ class PythonCoverageParser(CoverageReporter):
         logger.debug("Created %s.", repr(self))
 
     def parse(self, file_handler: TextIO) -> int:
-        report: Dict[str, Any] = json_load(file_handler)
+        report = LazyJSONObject.from_buffer(
+            read_buffer(file_handler), expand=("files",)
+        )
         self.total = report["totals"]
         self.files = report["files"]
         self.metadata = report["meta"]
@@ -90,12 +187,44 @@ class PythonCoverageParser(CoverageReporter):
                 (self.total["covered_lines"]+self.total["missing_lines"])
             )
         elif metric == "branches":  # branches
-            return int(
-                self.total["num_branches"]*100/self.total["covered_branches"]
-            )
+            num_branches = self.total.get("num_branches")
+            if num_branches is None:
+                raise UnmeasuredMetricException(
+                    "Branch coverage not measured."
+                )
+            if not num_branches:
+                return 100
+            return int(self.total["covered_branches"]*100/num_branches)
         else:
             raise ValueError("Unknown metric.")
 
+    def get_file_lines(
+        self, path: str
+    ) -> Optional[Tuple[List[int], List[int]]]:
+        file_report = self.files.get(path)
+        if file_report is None:
+            return None
+        return file_report["executed_lines"], file_report["missing_lines"]
+
+    def get_total_coverage(self) -> FileCoverage:
+        return FileCoverage(
+            path="TOTAL",
+            statements=self.total["num_statements"],
+            missing=self.total["missing_lines"],
+            percentages={"cover": self.total["percent_covered"]}
+        )
+
+    def iter_file_coverage(self) -> Iterator[FileCoverage]:
+        for path, file_report in self.files.items():
+            summary = file_report["summary"]
+            yield FileCoverage(
+                path=path,
+                statements=summary["num_statements"],
+                missing=summary["missing_lines"],
+                percentages={"cover": summary["percent_covered"]},
+                missing_lines=file_report["missing_lines"]
+            )
+
 
 REGISTERED_PARSERS = {
     "jest-coverage": JestCoverageJsonSummaryParser,
@@ -0,0 +1,287 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+merging coverage reports of sharded test jobs
+"""
+from __future__ import annotations
+from logging import getLogger
+from os import cpu_count
+from typing import (
+    Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+)
+
+from .coverage import (
+    CoverageReporter, JestCoverageJsonSummaryParser, PythonCoverageParser
+)
+from .line_sets import count, from_bitset, to_bitset
+
+logger = getLogger(__file__)
+
+Arcs = FrozenSet[Tuple[int, int]]
+JEST_METRICS = ("lines", "statements", "functions", "branches")
+SUMMED_TOTALS = (
+    "covered_lines", "num_statements", "missing_lines", "excluded_lines",
+    "num_branches", "num_partial_branches", "covered_branches",
+    "missing_branches"
+)
+
+
+def get_percent_covered(summary: Dict[str, Any]) -> float:
+    # same formula as coverage.py, branches count like statements
+    numerator = summary["covered_lines"] + summary.get("covered_branches", 0)
+    denominator = summary["num_statements"] + summary.get("num_branches", 0)
+    return 100.0 if denominator == 0 else numerator * 100 / denominator
+
+
+def to_arcs(arcs: Optional[List[List[int]]]) -> Optional[Arcs]:
+    return None if arcs is None else frozenset(map(tuple, arcs))
+
+
+class FileLines(NamedTuple):
+    """Coverage of a file as line bitsets.
+
+    Args:
+        executed (int): executed lines
+        missing (int): statements not executed
+        excluded (int): excluded lines
+        summary (Dict[str, Any]): coverage.py summary of the file
+        executed_branches (Optional[Arcs]): taken branches, None if the
+            report has no arcs
+        missing_branches (Optional[Arcs]): branches not taken, None if the
+            report has no arcs
+    """
+    executed: int
+    missing: int
+    excluded: int
+    summary: Dict[str, Any]
+    executed_branches: Optional[Arcs] = None
+    missing_branches: Optional[Arcs] = None
+
+    @classmethod
+    def from_report(cls, report: Dict[str, Any]) -> FileLines:
+        return cls(
+            to_bitset(report["executed_lines"]),
+            to_bitset(report["missing_lines"]),
+            to_bitset(report.get("excluded_lines", [])),
+            report["summary"],
+            to_arcs(report.get("executed_branches")),
+            to_arcs(report.get("missing_branches")),
+        )
+
+    def merge(self, other: FileLines) -> FileLines:
+        """Merge coverage of the same file measured by another test job.
+        A statement is covered if any job executed it, so executed lines
+        are united and missing lines intersected.
+
+        Args:
+            other (FileLines): coverage of the other job
+
+        Returns:
+            FileLines: merged coverage
+        """
+        missing = self.missing & other.missing
+        summary = dict(self.summary)
+        summary["num_statements"] = max(
+            self.summary["num_statements"], other.summary["num_statements"]
+        )
+        summary["missing_lines"] = count(missing)
+        summary["covered_lines"] = \
+            summary["num_statements"] - summary["missing_lines"]
+        executed_branches = missing_branches = None
+        if "num_branches" in summary:
+            if self.missing_branches is not None \
+                    and other.missing_branches is not None:
+                executed_branches = \
+                    self.executed_branches | other.executed_branches
+                missing_branches = \
+                    self.missing_branches & other.missing_branches
+                summary["missing_branches"] = len(missing_branches)
+                summary["covered_branches"] = \
+                    summary["num_branches"] - len(missing_branches)
+                taken = {start for start, _ in executed_branches}
+                summary["num_partial_branches"] = len({
+                    start for start, _ in missing_branches if start in taken
+                })
+            else:
+                # without arcs the best guess is the better of both jobs
+                for key, pick in (
+                    ("covered_branches", max), ("num_partial_branches", min)
+                ):
+                    summary[key] = pick(
+                        self.summary.get(key, 0), other.summary.get(key, 0)
+                    )
+                summary["missing_branches"] = \
+                    summary["num_branches"] - summary["covered_branches"]
+        summary["percent_covered"] = get_percent_covered(summary)
+        summary["percent_covered_display"] = \
+            str(round(summary["percent_covered"]))
+        return FileLines(
+            self.executed | other.executed,
+            missing,
+            self.excluded | other.excluded,
+            summary,
+            executed_branches,
+            missing_branches,
+        )
+
+    def to_report(self) -> Dict[str, Any]:
+        report = {
+            "executed_lines": from_bitset(self.executed),
+            "summary": self.summary,
+            "missing_lines": from_bitset(self.missing),
+            "excluded_lines": from_bitset(self.excluded),
+        }
+        if self.executed_branches is not None:
+            report["executed_branches"] = sorted(
+                map(list, self.executed_branches)
+            )
+            report["missing_branches"] = sorted(
+                map(list, self.missing_branches)
+            )
+        return report
+
+
+Shard = Tuple[Dict[str, Any], Dict[str, FileLines]]
+
+
+def read_python_shard(path: str) -> Shard:
+    """Parse a coverage.py json report into line bitsets, used by worker
+    processes.
+
+    Args:
+        path (str): coverage.json of a test job
+
+    Returns:
+        Shard: meta data and coverage per file
+    """
+    coverage = PythonCoverageParser()
+    with open(path) as file_handler:
+        coverage.parse(file_handler)
+    return coverage.metadata, {
+        filename: FileLines.from_report(report)
+        for filename, report in coverage.files.items()
+    }
+
+
+def merge_python_shards(shards: Sequence[Shard]) -> PythonCoverageParser:
+    """Merge parsed coverage.py reports, recomputing all totals.
+
+    Args:
+        shards (Sequence[Shard]): meta data and coverage per file of every
+            test job
+
+    Returns:
+        PythonCoverageParser: merged report
+    """
+    merged: Dict[str, FileLines] = {}
+    for _, files in shards:
+        for filename, lines in files.items():
+            previous = merged.get(filename)
+            merged[filename] = lines if previous is None \
+                else previous.merge(lines)
+    coverage = PythonCoverageParser()
+    coverage.metadata = dict(shards[0][0])
+    coverage.files = {
+        filename: lines.to_report() for filename, lines in merged.items()
+    }
+    total: Dict[str, Any] = {}
+    for lines in merged.values():
+        for key in SUMMED_TOTALS:
+            if key in lines.summary:
+                total[key] = total.get(key, 0) + lines.summary[key]
+    total.setdefault("num_statements", 0)
+    total.setdefault("covered_lines", 0)
+    total["percent_covered"] = get_percent_covered(total)
+    total["percent_covered_display"] = str(round(total["percent_covered"]))
+    coverage.total = total
+    return coverage
+
+
+def merge_jest_reports(
+    reports: Sequence[JestCoverageJsonSummaryParser]
+) -> JestCoverageJsonSummaryParser:
+    """Merge jest json-summary reports. They only contain counts, so per
+    file and metric the job with most covered items wins. The result is a
+    lower bound of the real coverage of the union.
+
+    Args:
+        reports (Sequence[JestCoverageJsonSummaryParser]): parsed reports
+
+    Returns:
+        JestCoverageJsonSummaryParser: merged report
+    """
+    files: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for report in reports:
+        for filename, metrics in report.files.items():
+            merged = files.setdefault(filename, {})
+            for metric in JEST_METRICS:
+                current = metrics[metric]
+                best = merged.get(metric)
+                if best is None or current["covered"] > best["covered"]:
+                    merged[metric] = dict(current)
+    total = {
+        metric: {"total": 0, "covered": 0, "skipped": 0}
+        for metric in JEST_METRICS
+    }
+    for metrics in files.values():
+        for metric, values in metrics.items():
+            for key in ("total", "covered", "skipped"):
+                total[metric][key] += values[key]
+    for values in total.values():
+        values["pct"] = 100 if values["total"] == 0 \
+            else round(values["covered"] * 100 / values["total"], 2)
+    coverage = JestCoverageJsonSummaryParser()
+    coverage.total = total
+    coverage.files = files
+    return coverage
+
+
+def read_coverage(
+    parser_class: type, paths: Sequence[str],
+    processes: Optional[int] = None
+) -> CoverageReporter:
+    """Parse coverage reports of one or several test jobs. coverage.py
+    reports are parsed in parallel and merged line by line.
+
+    Args:
+        parser_class (type): JestCoverageJsonSummaryParser or
+            PythonCoverageParser
+        paths (Sequence[str]): coverage reports
+        processes (Optional[int], optional): number of worker processes.
+            Defaults to the number of files, at most the cpu count.
+
+    Raises:
+        ValueError: no report given
+
+    Returns:
+        CoverageReporter: merged report
+    """
+    if not paths:
+        raise ValueError("No coverage reports given.")
+    if len(paths) == 1:
+        coverage = parser_class()
+        with open(paths[0]) as file_handler:
+            coverage.parse(file_handler)
+        return coverage
+    if parser_class is PythonCoverageParser:
+        # multiprocessing is only loaded for sharded reports
+        from concurrent.futures import ProcessPoolExecutor
+        processes = processes or min(len(paths), cpu_count() or 1)
+        with ProcessPoolExecutor(processes) as executor:
+            shards = list(executor.map(read_python_shard, paths))
+        logger.info("Merging %i coverage reports.", len(shards))
+        return merge_python_shards(shards)
+    reports = []
+    for path in paths:
+        coverage = parser_class()
+        with open(path) as file_handler:
+            coverage.parse(file_handler)
+        reports.append(coverage)
+    logger.info("Merging %i coverage reports.", len(reports))
+    return merge_jest_reports(reports)
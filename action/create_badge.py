@@ -12,10 +12,10 @@ main routines
 from argparse import ArgumentParser, ArgumentTypeError
 from logging import DEBUG, INFO, Formatter, getLogger, StreamHandler
 from pathlib import Path
-from .badges import CoverageBadge
+from typing import Tuple
 
-from .coverage import REGISTERED_PARSERS, CoverageReporter
-from . import ShieldIO6Color
+from .badges import BADGE_METRICS, CoverageBadge, render_badges, write_badges
+from .colors import ShieldIO6Color
 
 logger = getLogger(__file__)
 
@@ -27,6 +27,21 @@ class ExisitingPath(Path):
             raise ArgumentTypeError("File does not exist.")
 
 
+def metric_argument(value_type: type):
+    def parse(argument: str) -> Tuple[str, str]:
+        metric, separator, value = argument.partition("=")
+        if not separator or metric not in BADGE_METRICS:
+            raise ArgumentTypeError(
+                "METRIC=VALUE with metric one of "
+                f"{', '.join(BADGE_METRICS)} expected."
+            )
+        try:
+            return metric, value_type(value)
+        except ValueError:
+            raise ArgumentTypeError(f"Invalid value '{value}'.")
+    return parse
+
+
 def setup_logging(debug: bool) -> None:
     logger = getLogger()
     handler = StreamHandler()
@@ -58,13 +73,47 @@ if __name__ == "__main__":
         default="90,80,70,60,50"
     )
     parser.add_argument(
-        "coverage", type=int, help="Relative coverage."
+        "--hash", action="store_true",
+        help="Print the sha256 hash of the badge instead of the svg. The "
+        "hash only changes with the badge, so committing it next to the "
+        "badge allows to skip unchanged updates."
+    )
+    parser.add_argument(
+        "-b", "--badge", action="append", type=metric_argument(int),
+        default=[], metavar="METRIC=VALUE",
+        help="Render a badge of a metric, one of "
+        f"{', '.join(BADGE_METRICS)}. Can be repeated, all badges are "
+        "written to the output directory as <metric>.svg together with "
+        "their hash as <metric>.sha256."
+    )
+    parser.add_argument(
+        "-l", "--label", action="append", type=metric_argument(str),
+        default=[], metavar="METRIC=LABEL",
+        help="Replace the default label of a metric badge."
+    )
+    parser.add_argument(
+        "-o", "--output-dir", type=Path, default=Path("badges"),
+        help="Output directory of metric badges. Default is 'badges'."
+    )
+    parser.add_argument(
+        "coverage", type=int, nargs="?", help="Relative coverage."
     )
     args = parser.parse_args()
 
     setup_logging(args.debug)
+    if args.badge:
+        # batch mode, one process for the whole badge set
+        write_badges(
+            render_badges(
+                dict(args.badge), args.thresholds, dict(args.label)
+            ),
+            args.output_dir
+        )
+        parser.exit()
+    if args.coverage is None:
+        parser.error("Relative coverage or --badge required.")
     badge = CoverageBadge(
         args.coverage,
         args.thresholds
     )
-    print(badge.dumps())
+    print(badge.content_hash if args.hash else badge.dumps())
@@ -0,0 +1,275 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+coverage of lines changed in a diff
+"""
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from io import StringIO
+from logging import getLogger
+from re import compile
+from subprocess import run
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .coverage import CoverageReporter
+from .git_data import CheckRun, CheckRunAnnotation
+from .limits import OutputBuilder
+
+logger = getLogger(__file__)
+
+Interval = Tuple[int, int]
+
+
+def merge_lines(lines: Iterable[int]) -> List[Interval]:
+    """Merge sorted line numbers into closed intervals.
+
+    Args:
+        lines (Iterable[int]): ascending line numbers
+
+    Returns:
+        List[Interval]: (start, end) intervals of consecutive lines
+    """
+    intervals: List[Interval] = []
+    for line in lines:
+        if intervals and intervals[-1][1] + 1 >= line:
+            intervals[-1] = (intervals[-1][0], max(intervals[-1][1], line))
+        else:
+            intervals.append((line, line))
+    return intervals
+
+
+def get_changed_files(base: str, head: str = "HEAD") -> List[str]:
+    """Files touched between merge base of base and head, including deleted
+    ones and both sides of renames.
+
+    Args:
+        base (str): base revision, e.g. sha of pull request base
+        head (str, optional): head revision. Defaults to "HEAD".
+
+    Returns:
+        List[str]: changed paths
+    """
+    process = run(
+        [
+            "git", "diff", "--name-only", "--no-renames", "--no-color",
+            f"{base}...{head}"
+        ],
+        capture_output=True, text=True, check=True
+    )
+    return [path for path in process.stdout.splitlines() if path]
+
+
+class ChangedLines:
+    """Index of lines added or modified by a unified diff.
+    Lines are stored per file as sorted, disjoint intervals, so lookups are
+    a dict access plus a binary search.
+
+    Args:
+        intervals (Dict[str, List[Interval]]): changed intervals per file
+    """
+    hunk_pattern = compile(r"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+    def __init__(self, intervals: Dict[str, List[Interval]]) -> None:
+        self.intervals = intervals
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __contains__(self, location: Tuple[str, int]) -> bool:
+        path, line = location
+        intervals = self.intervals.get(path)
+        if not intervals:
+            return False
+        index = bisect_right(intervals, (line, float("inf"))) - 1
+        return index >= 0 and intervals[index][1] >= line
+
+    @classmethod
+    def from_diff(cls, file_handler: TextIO) -> ChangedLines:
+        """Parse unified diff, e.g. output of git diff.
+
+        Args:
+            file_handler (TextIO): unified diff
+
+        Returns:
+            ChangedLines: index of added lines
+        """
+        added: Dict[str, List[int]] = {}
+        lines: Optional[List[int]] = None
+        line = old_remaining = new_remaining = 0
+        for row in file_handler:
+            if old_remaining > 0 or new_remaining > 0:
+                # inside of hunk
+                if row.startswith("+"):
+                    if lines is not None:
+                        lines.append(line)
+                    line += 1
+                    new_remaining -= 1
+                elif row.startswith("-"):
+                    old_remaining -= 1
+                elif row.startswith(" "):
+                    line += 1
+                    old_remaining -= 1
+                    new_remaining -= 1
+            elif row.startswith("+++ "):
+                path = row[4:].rstrip("\n").split("\t")[0]
+                if path == "/dev/null":
+                    lines = None
+                else:
+                    lines = added.setdefault(
+                        path[2:] if path.startswith("b/") else path, []
+                    )
+            elif row.startswith("@@"):
+                match = cls.hunk_pattern.match(row)
+                if match is not None:
+                    old_count, start, new_count = match.groups()
+                    line = int(start)
+                    old_remaining = int(old_count or 1)
+                    new_remaining = int(new_count or 1)
+        return cls({
+            path: merge_lines(sorted(lines))
+            for path, lines in added.items() if lines
+        })
+
+    @classmethod
+    def from_git(cls, base: str, head: str = "HEAD") -> ChangedLines:
+        """Index lines changed between merge base of base and head.
+
+        Args:
+            base (str): base revision, e.g. sha of pull request base
+            head (str, optional): head revision. Defaults to "HEAD".
+
+        Returns:
+            ChangedLines: index of added lines
+        """
+        process = run(
+            [
+                "git", "diff", "--unified=0", "--no-color",
+                "--no-renames", f"{base}...{head}"
+            ],
+            capture_output=True, text=True, check=True
+        )
+        return cls.from_diff(StringIO(process.stdout))
+
+    def count_in(self, path: str, lines: List[int]) -> int:
+        """Count sorted lines inside the changed intervals of a file.
+
+        Args:
+            path (str): file path
+            lines (List[int]): ascending line numbers
+
+        Returns:
+            int: number of changed lines
+        """
+        return sum(
+            bisect_right(lines, end) - bisect_left(lines, start)
+            for start, end in self.intervals.get(path, [])
+        )
+
+    def select(self, path: str, lines: List[int]) -> Iterator[int]:
+        """Select sorted lines inside the changed intervals of a file.
+
+        Args:
+            path (str): file path
+            lines (List[int]): ascending line numbers
+
+        Yields:
+            int: changed line
+        """
+        for start, end in self.intervals.get(path, []):
+            yield from lines[bisect_left(lines, start):
+                             bisect_right(lines, end)]
+
+
+@dataclass
+class DiffCoverage:
+    """Coverage of the changed lines (patch coverage).
+
+    Args:
+        covered (int): changed statements executed by the tests
+        total (int): changed statements
+        uncovered (Dict[str, List[Interval]]): missing changed lines per
+            file
+    """
+    covered: int = 0
+    total: int = 0
+    uncovered: Dict[str, List[Interval]] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def compute(
+        cls, changed: ChangedLines, coverage: CoverageReporter
+    ) -> DiffCoverage:
+        """Intersect changed lines with line coverage of the report.
+        Files without line data are skipped.
+
+        Args:
+            changed (ChangedLines): index of changed lines
+            coverage (CoverageReporter): parsed coverage report
+
+        Returns:
+            DiffCoverage: patch coverage
+        """
+        diff_coverage = cls()
+        for path in changed.intervals:
+            file_lines = coverage.get_file_lines(path)
+            if file_lines is None:
+                continue
+            executed, missing = file_lines
+            covered = changed.count_in(path, executed)
+            uncovered = merge_lines(changed.select(path, missing))
+            diff_coverage.covered += covered
+            diff_coverage.total += covered + sum(
+                end - start + 1 for start, end in uncovered
+            )
+            if uncovered:
+                diff_coverage.uncovered[path] = uncovered
+        logger.debug("Computed %s.", repr(diff_coverage))
+        return diff_coverage
+
+    def get_relative_coverage(self) -> int:
+        if self.total == 0:
+            return 100
+        return int(self.covered*100/self.total)
+
+    def get_summary(self) -> str:
+        return f"{self.get_relative_coverage()}% patch coverage: " + \
+            f"{self.covered} of {self.total} changed statements covered"
+
+    def create_annotations(self) -> Iterator[CheckRunAnnotation]:
+        for path, intervals in self.uncovered.items():
+            for start, end in intervals:
+                yield CheckRunAnnotation(
+                    path=path,
+                    start_line=start,
+                    end_line=end,
+                    annotation_level="warning",
+                    title="Uncovered changed lines",
+                    message=f"Line {start} is not covered by tests."
+                    if start == end
+                    else f"Lines {start}-{end} are not covered by tests."
+                )
+
+    def create_check_run(self, commit_hash: str) -> CheckRun:
+        now = datetime.now()
+        check_run = CheckRun(
+            name="diff-coverage",
+            head_sha=commit_hash,
+            status="completed",
+            conclusion="neutral" if self.uncovered else "success",
+            started_at=now,
+            completed_at=now
+        )
+        output = OutputBuilder("diff coverage", self.get_summary())
+        for annotation in self.create_annotations():
+            output.add_annotation(annotation)
+        check_run.add_output(output.build())
+        return check_run
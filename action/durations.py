@@ -0,0 +1,260 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+slow tests and duration regressions
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from heapq import nlargest
+from logging import getLogger
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from .results import ResultRecord, ResultStore
+
+if TYPE_CHECKING:
+    from .history import History
+
+logger = getLogger(__file__)
+
+
+def escape_cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+class BaselineDuration(NamedTuple):
+    """Expected duration of a test.
+
+    Args:
+        mean (float): mean duration in seconds
+        stddev (float): standard deviation in seconds, 0 for a single run
+        nruns (int): number of runs the baseline is computed from
+    """
+    mean: float
+    stddev: float
+    nruns: int
+
+
+@dataclass
+class DurationBaseline:
+    """Expected durations of tests, by classname and name.
+
+    Args:
+        durations (Dict[Tuple[str, str], BaselineDuration]): baseline per
+            test
+        source (str): description of the baseline
+    """
+    durations: Dict[Tuple[str, str], BaselineDuration] = field(repr=False)
+    source: str
+
+    @classmethod
+    def from_store(
+        cls, store: ResultStore, source: str = "previous report"
+    ) -> DurationBaseline:
+        """Use durations of a single earlier report, e.g. the junit.xml of
+        the base branch.
+
+        Args:
+            store (ResultStore): results of the earlier report
+            source (str, optional): description of the baseline.
+                Defaults to "previous report".
+
+        Returns:
+            DurationBaseline: baseline with one run per test
+        """
+        durations = {}
+        for index in range(len(store)):
+            if store.is_known_duration(index):
+                durations[store.key(index)] = BaselineDuration(
+                    store.durations[index], 0.0, 1
+                )
+        return cls(durations, source)
+
+    @classmethod
+    def from_history(
+        cls, history: History, last: int = 20, branch: Optional[str] = None
+    ) -> DurationBaseline:
+        """Use mean and spread of the durations of stored runs.
+
+        Args:
+            history (History): stored runs
+            last (int, optional): number of runs. Defaults to 20.
+            branch (Optional[str], optional): only runs of this branch.
+                Defaults to None.
+
+        Returns:
+            DurationBaseline: baseline over the latest runs
+        """
+        return cls(
+            {
+                key: BaselineDuration(stats.mean, stats.stddev, stats.nruns)
+                for key, stats in history.get_duration_stats(
+                    last, branch
+                ).items()
+            },
+            f"last {last} runs" + ("" if branch is None else f" of {branch}")
+        )
+
+    def get(self, key: Tuple[str, str]) -> Optional[BaselineDuration]:
+        return self.durations.get(key)
+
+
+class DurationRegression(NamedTuple):
+    """Test that got significantly slower than its baseline.
+
+    Args:
+        record (ResultRecord): result of the slower test
+        baseline (BaselineDuration): expected duration
+        ratio (float): duration relative to the baseline mean
+        zscore (Optional[float]): deviation from the baseline mean in
+            standard deviations, None if the baseline has no spread
+    """
+    record: ResultRecord
+    baseline: BaselineDuration
+    ratio: float
+    zscore: Optional[float]
+
+
+@dataclass
+class DurationAnalysis:
+    """Slowest tests of a run and tests that got slower than a baseline.
+    A test is a regression if it takes min_ratio times its baseline mean
+    and at least min_increase seconds longer. Baselines of at least
+    min_runs runs with a spread additionally require a z-score of
+    min_zscore, so noisy tests are not reported for ordinary jitter.
+
+    Args:
+        slowest (List[ResultRecord]): slowest tests, slowest first
+        regressions (List[DurationRegression]): slowed down tests, largest
+            increase first
+        total (float): summed duration of all tests in seconds
+        baseline (Optional[DurationBaseline]): baseline compared against
+    """
+    slowest: List[ResultRecord]
+    regressions: List[DurationRegression]
+    total: float
+    baseline: Optional[DurationBaseline] = None
+
+    @classmethod
+    def analyze(
+        cls,
+        store: ResultStore,
+        baseline: Optional[DurationBaseline] = None,
+        top: int = 10,
+        min_ratio: float = 1.5,
+        min_increase: float = 0.5,
+        min_zscore: float = 3.0,
+        min_runs: int = 3
+    ) -> DurationAnalysis:
+        """Rank tests by duration and compare them against a baseline.
+
+        Args:
+            store (ResultStore): results of the run
+            baseline (Optional[DurationBaseline], optional): expected
+                durations. Defaults to None.
+            top (int, optional): number of slowest tests. Defaults to 10.
+            min_ratio (float, optional): minimal slowdown factor.
+                Defaults to 1.5.
+            min_increase (float, optional): minimal slowdown in seconds.
+                Defaults to 0.5.
+            min_zscore (float, optional): minimal z-score for baselines
+                with spread. Defaults to 3.0.
+            min_runs (int, optional): minimal number of baseline runs to
+                apply the z-score. Defaults to 3.
+
+        Returns:
+            DurationAnalysis: analysis of the run
+        """
+        durations = store.durations
+        known = [
+            index for index in range(len(store))
+            if store.is_known_duration(index)
+        ]
+        slowest = [
+            store[index]
+            for index in nlargest(top, known, key=durations.__getitem__)
+        ]
+        regressions = []
+        if baseline is not None:
+            for index in known:
+                expected = baseline.get(store.key(index))
+                duration = durations[index]
+                if expected is None \
+                        or duration - expected.mean < min_increase \
+                        or duration < min_ratio * expected.mean:
+                    continue
+                zscore = None
+                if expected.stddev > 0:
+                    zscore = (duration - expected.mean) / expected.stddev
+                    if expected.nruns >= min_runs and zscore < min_zscore:
+                        continue
+                regressions.append(DurationRegression(
+                    store[index], expected,
+                    duration / expected.mean if expected.mean > 0
+                    else float("inf"),
+                    zscore
+                ))
+            regressions.sort(
+                key=lambda regression:
+                    regression.record.duration - regression.baseline.mean,
+                reverse=True
+            )
+            logger.info(
+                "%i tests slower than %s.", len(regressions), baseline.source
+            )
+        return cls(slowest, regressions, store.total_duration(), baseline)
+
+    def describe(self, regression: DurationRegression) -> str:
+        record, expected = regression.record, regression.baseline
+        message = f"{record.name} took {record.duration:.3f}s, " \
+            f"{regression.ratio:.1f}x the {expected.mean:.3f}s of the " \
+            f"{self.baseline.source}"
+        if regression.zscore is not None:
+            message += f" ({regression.zscore:.1f} standard deviations)"
+        return message + "."
+
+    def render_table(self, limit: int = 50) -> str:
+        """Render markdown tables of the slowest tests and the regressions.
+
+        Args:
+            limit (int, optional): maximal number of regressions listed.
+                Defaults to 50.
+
+        Returns:
+            str: markdown
+        """
+        lines = [
+            f"### Slowest tests\n\nAll tests took {self.total:.3f}s.\n",
+            "| Test | Duration | Baseline |",
+            "|:---|---:|---:|",
+        ]
+        for record in self.slowest:
+            expected = None if self.baseline is None \
+                else self.baseline.get(record.key)
+            lines.append(
+                f"| {escape_cell(record.name)} | {record.duration:.3f}s | " +
+                ("-" if expected is None else f"{expected.mean:.3f}s") + " |"
+            )
+        if self.regressions:
+            lines += [
+                f"\n### Slower than {self.baseline.source}\n",
+                "| Test | Duration | Baseline | Change |",
+                "|:---|---:|---:|---:|",
+            ]
+            for regression in self.regressions[:limit]:
+                record = regression.record
+                lines.append(
+                    f"| {escape_cell(record.name)} | {record.duration:.3f}s | "
+                    f"{regression.baseline.mean:.3f}s | "
+                    f"+{record.duration - regression.baseline.mean:.3f}s |"
+                )
+            if len(self.regressions) > limit:
+                lines.append(
+                    f"\n{len(self.regressions) - limit} more tests are slower."
+                )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,207 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+flaky test detection
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from logging import getLogger
+from typing import (
+    TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+)
+
+from .results import STATUS_CODES, ResultRecord, ResultStore
+
+if TYPE_CHECKING:
+    from .history import History
+
+logger = getLogger(__file__)
+
+FAILED_CODES = {STATUS_CODES["failure"], STATUS_CODES["error"]}
+PASSED_CODE = STATUS_CODES["passed"]
+
+
+def get_flip_rate(statuses: List[str]) -> float:
+    """Share of consecutive runs in which a test changed between passing
+    and failing. Skipped runs are ignored.
+
+    Args:
+        statuses (List[str]): statuses oldest first
+
+    Returns:
+        float: flip rate between 0 and 1
+    """
+    outcomes = [status == "passed" for status in statuses
+                if status != "skipped"]
+    if len(outcomes) < 2:
+        return 0.0
+    flips = sum(
+        previous != current
+        for previous, current in zip(outcomes, outcomes[1:])
+    )
+    return flips / (len(outcomes) - 1)
+
+
+class FlakyTest(NamedTuple):
+    """Failed test considered flaky. Only tests passing on a retry in this
+    run are confirmed, tests flagged by their flip rate alone still fail the
+    run.
+
+    Args:
+        record (ResultRecord): last failed attempt
+        attempts (int): number of attempts in this run
+        passed (int): number of passed attempts in this run
+        flip_rate (Optional[float]): flip rate over stored runs, None if
+            the history has not been consulted
+    """
+    record: ResultRecord
+    attempts: int
+    passed: int
+    flip_rate: Optional[float]
+
+    @property
+    def confirmed(self) -> bool:
+        return self.passed > 0
+
+    @property
+    def reason(self) -> str:
+        if self.passed:
+            return f"passed {self.passed} of {self.attempts} attempts"
+        return f"changed outcome in {self.flip_rate:.0%} of recent runs"
+
+
+@dataclass
+class FlakyAnalysis:
+    """Split failures into real and flaky ones. Consecutive attempts of a
+    test are grouped by classname and name in a single pass over the result
+    store, a test failing in one attempt and passing in another is flaky.
+    Tests failing in every attempt are looked up in the history through its
+    hash index of test ids, they are flaky if their outcome flipped often
+    in recent runs.
+
+    Args:
+        failures (List[ResultRecord]): last attempt of tests failing for
+            real
+        flaky (List[FlakyTest]): flaky tests
+    """
+    failures: List[ResultRecord]
+    flaky: List[FlakyTest]
+
+    @classmethod
+    def analyze(
+        cls,
+        store: ResultStore,
+        history: Optional[History] = None,
+        last: int = 20,
+        min_flip_rate: float = 0.3,
+        min_runs: int = 5,
+        branch: Optional[str] = None,
+        retried: Optional[
+            Dict[Tuple[str, str, int], List[ResultRecord]]
+        ] = None
+    ) -> FlakyAnalysis:
+        """Detect flaky tests in retries and stored runs.
+
+        Args:
+            store (ResultStore): results of the run, may contain several
+                attempts per test
+            history (Optional[History], optional): stored runs.
+                Defaults to None.
+            last (int, optional): number of stored runs. Defaults to 20.
+            min_flip_rate (float, optional): flip rate from which a test is
+                flaky. Defaults to 0.3.
+            min_runs (int, optional): minimal number of stored results of
+                a test to compute its flip rate. Defaults to 5.
+            branch (Optional[str], optional): only stored runs of this
+                branch. Defaults to None.
+            retried (Optional[Dict[Tuple[str, str, int],
+                List[ResultRecord]]], optional): rows of earlier attempts
+                superseded when sharded reports were merged, by classname,
+                name and occurence of the testcase. Defaults to None.
+
+        Returns:
+            FlakyAnalysis: real and flaky failures
+        """
+        # [attempts, passed, index of last failed attempt] per test, retries
+        # follow their first attempt directly, equally named testcases
+        # elsewhere in the report are different tests (jest names testcases
+        # by their title only)
+        tests: List[List[int]] = []
+        # test of each testcase by its name and occurence, as paired by
+        # JUnitXML.merge
+        occurences: Dict[Tuple[str, str], int] = {}
+        tests_by_occurence: Dict[Tuple[str, str, int], int] = {}
+        previous_key = None
+        for start, end in store.iter_testcases():
+            key = store.key(start)
+            if key != previous_key:
+                tests.append([0, 0, -1])
+                previous_key = key
+            if retried:
+                occurence = occurences.get(key, 0)
+                occurences[key] = occurence + 1
+                tests_by_occurence[(*key, occurence)] = len(tests) - 1
+            counts = tests[-1]
+            counts[0] += 1
+            code = store.get_testcase_status(start, end)
+            if code == PASSED_CODE:
+                counts[1] += 1
+            elif code in FAILED_CODES:
+                counts[2] = start
+        # attempts superseded by later shards count for the test of the
+        # same occurence
+        earlier: Dict[int, list] = {}
+        for occurence, records in (retried or {}).items():
+            test = tests_by_occurence.get(occurence)
+            if test is None:
+                continue
+            previous = earlier.setdefault(test, [0, 0, None])
+            for record in records:
+                if record.element:
+                    # further failure element of the same attempt
+                    continue
+                previous[0] += 1
+                if record.status == "passed":
+                    previous[1] += 1
+                elif record.status in ("failure", "error"):
+                    previous[2] = record
+        failed: List[Tuple[int, int, ResultRecord]] = []
+        for test, (nattempts, npassed, index) in enumerate(tests):
+            record = store[index] if index >= 0 else None
+            previous = earlier.get(test)
+            if previous is not None:
+                nattempts += previous[0]
+                npassed += previous[1]
+                record = record or previous[2]
+            if record is not None:
+                failed.append((nattempts, npassed, record))
+        stored = {} if history is None else history.get_statuses(
+            [record.key for _, npassed, record in failed if not npassed],
+            last, branch
+        )
+        failures, flaky = [], []
+        for nattempts, npassed, record in failed:
+            if npassed:
+                flaky.append(FlakyTest(record, nattempts, npassed, None))
+                continue
+            previous = stored.get(record.key, [])
+            flip_rate = get_flip_rate(previous)
+            if len(previous) >= min_runs and flip_rate >= min_flip_rate:
+                flaky.append(FlakyTest(record, nattempts, 0, flip_rate))
+            else:
+                failures.append(record)
+        logger.info(
+            "%i failed tests, %i of them flaky.", len(failed), len(flaky)
+        )
+        return cls(failures, flaky)
+
+    def get_conclusion(self) -> str:
+        if self.failures or not all(test.confirmed for test in self.flaky):
+            return "failure"
+        return "neutral" if self.flaky else "success"
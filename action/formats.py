@@ -0,0 +1,126 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+registry of JUnit XML producers detected from the head of a report
+"""
+from logging import getLogger
+from re import compile, IGNORECASE
+from typing import Callable, Dict, List, NamedTuple, Type
+
+from .reports import GenericJUnitXML, JESTJunitXML, JUnitXML, PytestJunitXML
+
+logger = getLogger(__file__)
+
+# producers identify themselves in the root or first testsuite element
+SNIFF_LENGTH = 4096
+GENERIC_FORMAT = "junit"
+
+
+class JUnitFormat(NamedTuple):
+    """JUnit XML producer.
+
+    Args:
+        name (str): name of the producer
+        junit_class (Type[JUnitXML]): report class reading its files
+        sniff (Callable[[str], bool]): tells from the first SNIFF_LENGTH
+            characters of a file whether the producer wrote it
+    """
+    name: str
+    junit_class: Type[JUnitXML]
+    sniff: Callable[[str], bool]
+
+
+FORMATS: Dict[str, JUnitFormat] = {}
+
+
+def register_format(
+    name: str, junit_class: Type[JUnitXML], sniff: Callable[[str], bool]
+) -> None:
+    """Add producer to the registry, detection tries producers in order of
+    registration.
+
+    Args:
+        name (str): name of the producer, e.g. for --format
+        junit_class (Type[JUnitXML]): report class reading its files
+        sniff (Callable[[str], bool]): detects files of the producer
+    """
+    FORMATS[name] = JUnitFormat(name, junit_class, sniff)
+
+
+def pattern_sniffer(pattern: str) -> Callable[[str], bool]:
+    regex = compile(pattern, IGNORECASE)
+    return lambda head: regex.search(head) is not None
+
+
+def sniff_format(head: str) -> JUnitFormat:
+    """Detect producer of a report.
+
+    Args:
+        head (str): beginning of the report
+
+    Returns:
+        JUnitFormat: first matching producer, the generic format if none
+            matches
+    """
+    for junit_format in FORMATS.values():
+        if junit_format.name != GENERIC_FORMAT and junit_format.sniff(head):
+            return junit_format
+    return FORMATS[GENERIC_FORMAT]
+
+
+def detect_format(path: str) -> JUnitFormat:
+    """Detect producer of a report file from its first SNIFF_LENGTH
+    characters, the file is parsed once afterwards.
+
+    Args:
+        path (str): JUnit XML file
+
+    Returns:
+        JUnitFormat: producer
+    """
+    with open(path, errors="replace") as file_handle:
+        junit_format = sniff_format(file_handle.read(SNIFF_LENGTH))
+    logger.info("Detected %s JUnit XML in %s.", junit_format.name, path)
+    return junit_format
+
+
+def get_junit_class(name: str, paths: List[str]) -> Type[JUnitXML]:
+    """Get report class of a format.
+
+    Args:
+        name (str): name of a registered format or "auto"
+        paths (List[str]): report files, the first one is sniffed
+
+    Returns:
+        Type[JUnitXML]: report class
+    """
+    if name == "auto":
+        return detect_format(paths[0]).junit_class
+    return FORMATS[name].junit_class
+
+
+register_format("jest", JESTJunitXML, pattern_sniffer(
+    r'<testsuites\s[^>]*name="jest tests"'
+))
+register_format("pytest", PytestJunitXML, pattern_sniffer(
+    r'<testsuite\s[^>]*name="pytest"'
+))
+register_format("go-junit-report", GenericJUnitXML, pattern_sniffer(
+    r'<property\s[^>]*name="go\.version"'
+))
+register_format("surefire", GenericJUnitXML, pattern_sniffer(
+    r"surefire-test-report|maven-surefire"
+))
+register_format("mocha", GenericJUnitXML, pattern_sniffer(
+    r'<testsuites\s[^>]*name="Mocha Tests"'
+))
+register_format("cargo-nextest", GenericJUnitXML, pattern_sniffer(
+    r'<testsuites\s[^>]*name="nextest-run"'
+))
+register_format(GENERIC_FORMAT, GenericJUnitXML, lambda head: True)
@@ -10,7 +10,26 @@ Copyright (c) 2021 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
 github data classes
 """
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+MAX_ANNOTATIONS_PER_REQUEST = 50
+
+
+def iter_batches(
+    annotations: List[Dict[str, Any]], batch_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Split annotations into batches accepted by a single API request.
+
+    Args:
+        annotations (List[Dict[str, Any]]): dict representations of
+            annotations
+        batch_size (int): maximum number of annotations per batch
+
+    Yields:
+        List[Dict[str, Any]]: slice of annotations
+    """
+    for start in range(0, len(annotations), batch_size):
+        yield annotations[start:start+batch_size]
 
 
 class BaseGitData:
@@ -96,13 +115,14 @@ class CheckRunOutput(BaseGitData):
 
     def add_annotation(self, annotation: CheckRunAnnotation) -> None:
         """add dict representation of check run annotation to internal
-        annotations list
+        annotations list. The list is not limited to
+        MAX_ANNOTATIONS_PER_REQUEST, splitting it into several requests is
+        up to the publisher.
 
         Args:
             annotation (CheckRunAnnotation): annotation instance to add
         """
-        if len(self.annotations) < 50:
-            self.annotations.append(annotation.to_dict())
+        self.annotations.append(annotation.to_dict())
 
 
 @dataclass
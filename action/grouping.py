@@ -0,0 +1,101 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+grouping of failures sharing one root cause
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from logging import getLogger
+from re import compile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .results import ResultRecord
+
+logger = getLogger(__file__)
+
+Fingerprint = Tuple[str, str, Optional[str], int]
+
+
+NORMALIZE_PATTERNS = [
+    (compile(r"0x[0-9a-fA-F]+"), "0x?"),
+    (compile(r"\b[0-9a-fA-F]{8,}\b"), "?"),
+    (compile(r"\d+(\.\d+)?"), "N"),
+    (compile(r"\s+"), " "),
+]
+
+
+@lru_cache(maxsize=4096)
+def normalize_message(message: Optional[str]) -> str:
+    """Normalize failure message, so messages differing only in numbers,
+    addresses or whitespace get the same fingerprint.
+
+    Args:
+        message (Optional[str]): failure message
+
+    Returns:
+        str: normalized message
+    """
+    message = message or ""
+    for pattern, replacement in NORMALIZE_PATTERNS:
+        message = pattern.sub(replacement, message)
+    return message.strip()
+
+
+@dataclass
+class FailureGroup:
+    """Failures sharing status, normalized message and top project frame.
+
+    Args:
+        first (ResultRecord): first failure of the group
+        tests (List[ResultRecord]): all failures of the group
+        details (Dict[str, int]): distinct failure texts of the group with
+            number of occurences
+    """
+    first: ResultRecord
+    tests: List[ResultRecord] = field(default_factory=list, repr=False)
+    details: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    @property
+    def count(self) -> int:
+        return len(self.tests)
+
+    def add(self, record: ResultRecord) -> None:
+        self.tests.append(record)
+        if record.details is not None:
+            self.details[record.details] = \
+                self.details.get(record.details, 0) + 1
+
+
+def fingerprint(record: ResultRecord) -> Fingerprint:
+    return (
+        record.status,
+        normalize_message(record.message),
+        record.path,
+        record.line,
+    )
+
+
+def group_failures(records: Iterable[ResultRecord]) -> List[FailureGroup]:
+    """Group failures by fingerprint, keeping order of first occurence.
+
+    Args:
+        records (Iterable[ResultRecord]): failed or errored testcases
+
+    Returns:
+        List[FailureGroup]: groups of failures
+    """
+    groups: Dict[Fingerprint, FailureGroup] = {}
+    for record in records:
+        key = fingerprint(record)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = FailureGroup(record)
+        group.add(record)
+    logger.debug("Grouped failures into %i groups.", len(groups))
+    return list(groups.values())
@@ -0,0 +1,479 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+history of coverage and test results across runs
+"""
+from __future__ import annotations
+from argparse import ArgumentParser
+from logging import getLogger
+from math import isnan, sqrt
+from pathlib import Path
+from sqlite3 import connect
+from time import time
+from typing import (
+    Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+)
+
+from .coverage import CoverageReporter
+from .reports import JUnitXML
+from .results import STATUSES
+
+logger = getLogger(__file__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    commit_hash TEXT NOT NULL,
+    branch TEXT,
+    created REAL NOT NULL,
+    ntests INTEGER,
+    nfailures INTEGER,
+    nerrors INTEGER,
+    nskipped INTEGER,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS runs_branch ON runs (branch, id);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs (commit_hash);
+CREATE TABLE IF NOT EXISTS coverage (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, metric)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tests (
+    id INTEGER PRIMARY KEY,
+    classname TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (classname, name)
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test_id INTEGER NOT NULL REFERENCES tests (id),
+    status INTEGER NOT NULL,
+    duration REAL,
+    PRIMARY KEY (run_id, test_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_test ON results (test_id, run_id);
+"""
+
+
+class DurationStats(NamedTuple):
+    """Durations of a test over several runs.
+
+    Args:
+        classname (str): classname of the testcase
+        name (str): name of the testcase
+        mean (float): mean duration in seconds
+        maximum (float): maximal duration in seconds
+        nruns (int): number of runs with a known duration
+        stddev (float): standard deviation of the duration in seconds
+    """
+    classname: str
+    name: str
+    mean: float
+    maximum: float
+    nruns: int
+    stddev: float = 0.0
+
+
+class Outcome(NamedTuple):
+    """Outcome of a test in a stored run.
+
+    Args:
+        run_id (int): id of the run
+        status (str): one of passed, failure, error or skipped
+        duration (Optional[float]): duration in seconds
+    """
+    run_id: int
+    status: str
+    duration: Optional[float]
+
+
+class History:
+    """Append-only SQLite store of per-run coverage totals and per-test
+    outcomes. Tests are stored once in a table of identities and results
+    reference them by id, results are clustered by run and indexed by test,
+    so queries over the last runs or over one test's history are range
+    scans even with tens of thousands of stored runs.
+
+    Args:
+        path (Union[str, Path]): database file, ":memory:" for a
+            temporary store
+    """
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = path
+        self.connection = connect(str(path))
+        self.connection.executescript(SCHEMA)
+        self.test_ids: Optional[Dict[Tuple[str, str], int]] = None
+
+    def __enter__(self) -> History:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def load_test_ids(self) -> Dict[Tuple[str, str], int]:
+        """Load hash index of the stored test identities, kept for the
+        lifetime of the store.
+
+        Returns:
+            Dict[Tuple[str, str], int]: ids by classname and name
+        """
+        if self.test_ids is None:
+            self.test_ids = {
+                (classname, name): test_id for test_id, classname, name
+                in self.connection.execute(
+                    "SELECT id, classname, name FROM tests"
+                )
+            }
+        return self.test_ids
+
+    def get_test_ids(
+        self, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], int]:
+        """Get ids of tests, adding unknown tests to the store.
+
+        Args:
+            keys (Iterable[Tuple[str, str]]): classname and name of tests
+
+        Returns:
+            Dict[Tuple[str, str], int]: ids of all stored tests
+        """
+        test_ids = self.load_test_ids()
+        cursor = self.connection.cursor()
+        for key in keys:
+            if key not in test_ids:
+                cursor.execute(
+                    "INSERT INTO tests (classname, name) VALUES (?, ?)", key
+                )
+                test_ids[key] = cursor.lastrowid
+        return test_ids
+
+    def record(
+        self,
+        commit_hash: str,
+        branch: Optional[str] = None,
+        coverage: Optional[CoverageReporter] = None,
+        junit: Optional[JUnitXML] = None,
+        created: Optional[float] = None
+    ) -> int:
+        """Append a run.
+
+        Args:
+            commit_hash (str): commit the run tested
+            branch (Optional[str], optional): branch of the commit.
+                Defaults to None.
+            coverage (Optional[CoverageReporter], optional): parsed coverage
+                report, every metric it supports is stored. Defaults to None.
+            junit (Optional[JUnitXML], optional): parsed test results.
+                Defaults to None.
+            created (Optional[float], optional): unix time of the run.
+                Defaults to now.
+
+        Returns:
+            int: id of the run
+        """
+        try:
+            run_id = self._record(
+                commit_hash, branch, coverage, junit,
+                time() if created is None else created
+            )
+        except Exception:
+            # ids of tests inserted by the rolled back transaction are gone
+            self.test_ids = None
+            raise
+        logger.debug("Recorded run %i of %s.", run_id, commit_hash)
+        return run_id
+
+    def _record(
+        self,
+        commit_hash: str,
+        branch: Optional[str],
+        coverage: Optional[CoverageReporter],
+        junit: Optional[JUnitXML],
+        created: float
+    ) -> int:
+        counts = (None,) * 5 if junit is None else (
+            junit.ntests, junit.nfailures, junit.nerrors, junit.nskipped,
+            junit.time
+        )
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (commit_hash, branch, created, ntests, "
+                "nfailures, nerrors, nskipped, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (commit_hash, branch, created, *counts)
+            )
+            run_id = cursor.lastrowid
+            if coverage is not None:
+                self.connection.executemany(
+                    "INSERT INTO coverage (run_id, metric, value) "
+                    "VALUES (?, ?, ?)",
+                    list(iter_coverage(run_id, coverage))
+                )
+            if junit is not None:
+                store = junit.store
+                test_ids = self.get_test_ids(
+                    store.key(index) for index in range(len(store))
+                )
+                # one result per testcase, further failure elements of a
+                # testcase have their own rows
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO results "
+                    "(run_id, test_id, status, duration) VALUES (?, ?, ?, ?)",
+                    (
+                        (
+                            run_id, test_ids[store.key(start)],
+                            store.get_testcase_status(start, end),
+                            None if isnan(store.durations[start])
+                            else store.durations[start]
+                        )
+                        for start, end in store.iter_testcases()
+                    )
+                )
+        return run_id
+
+    def get_coverage(
+        self, branch: str, metric: str = "statements"
+    ) -> Optional[float]:
+        """Get coverage of the latest run of a branch.
+
+        Args:
+            branch (str): branch name
+            metric (str, optional): coverage metric.
+                Defaults to "statements".
+
+        Returns:
+            Optional[float]: relative coverage, None if no run is stored
+        """
+        row = self.connection.execute(
+            "SELECT coverage.value FROM runs JOIN coverage "
+            "ON coverage.run_id = runs.id AND coverage.metric = ? "
+            "WHERE runs.branch = ? ORDER BY runs.id DESC LIMIT 1",
+            (metric, branch)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def get_coverage_delta(
+        self, base_branch: str, coverage: float, metric: str = "statements"
+    ) -> Optional[float]:
+        """Compare coverage against the latest run of the base branch.
+
+        Args:
+            base_branch (str): branch to compare against
+            coverage (float): relative coverage of the current run
+            metric (str, optional): coverage metric.
+                Defaults to "statements".
+
+        Returns:
+            Optional[float]: difference in percentage points, None if the
+                base branch has no stored run
+        """
+        base = self.get_coverage(base_branch, metric)
+        return None if base is None else coverage - base
+
+    def get_run_ids(
+        self, last: int, branch: Optional[str] = None
+    ) -> List[int]:
+        """Get ids of the latest runs, newest first.
+
+        Args:
+            last (int): number of runs
+            branch (Optional[str], optional): only runs of this branch.
+                Defaults to None.
+
+        Returns:
+            List[int]: run ids
+        """
+        if branch is None:
+            rows = self.connection.execute(
+                "SELECT id FROM runs ORDER BY id DESC LIMIT ?", (last,)
+            )
+        else:
+            rows = self.connection.execute(
+                "SELECT id FROM runs WHERE branch = ? "
+                "ORDER BY id DESC LIMIT ?", (branch, last)
+            )
+        return [run_id for run_id, in rows]
+
+    def get_slowest_tests(
+        self, last: int = 10, limit: int = 10, branch: Optional[str] = None
+    ) -> List[DurationStats]:
+        """Get tests with the longest mean duration over the latest runs.
+
+        Args:
+            last (int, optional): number of runs. Defaults to 10.
+            limit (int, optional): number of tests. Defaults to 10.
+            branch (Optional[str], optional): only runs of this branch.
+                Defaults to None.
+
+        Returns:
+            List[DurationStats]: slowest tests, slowest first
+        """
+        return self.query_durations(
+            self.get_run_ids(last, branch), "ORDER BY 3 DESC LIMIT ?",
+            (limit,)
+        )
+
+    def get_duration_stats(
+        self, last: int = 10, branch: Optional[str] = None
+    ) -> Dict[Tuple[str, str], DurationStats]:
+        """Get duration statistics of every test over the latest runs.
+
+        Args:
+            last (int, optional): number of runs. Defaults to 10.
+            branch (Optional[str], optional): only runs of this branch.
+                Defaults to None.
+
+        Returns:
+            Dict[Tuple[str, str], DurationStats]: statistics by classname
+                and name
+        """
+        return {
+            (stats.classname, stats.name): stats
+            for stats in self.query_durations(self.get_run_ids(last, branch))
+        }
+
+    def query_durations(
+        self, run_ids: List[int], suffix: str = "",
+        parameters: Tuple[Any, ...] = ()
+    ) -> List[DurationStats]:
+        if not run_ids:
+            return []
+        # primary key lookups per run, a range condition on run_id would let
+        # sqlite group along the test index and scan every stored result
+        condition = "results.run_id IN (%s)" % ",".join("?" * len(run_ids))
+        rows = self.connection.execute(
+            "SELECT tests.classname, tests.name, AVG(results.duration), "
+            "MAX(results.duration), COUNT(results.duration), "
+            "AVG(results.duration * results.duration) "
+            "FROM results JOIN tests ON tests.id = results.test_id "
+            f"WHERE {condition} AND results.duration IS NOT NULL "
+            f"GROUP BY results.test_id {suffix}",
+            (*run_ids, *parameters)
+        )
+        return [
+            DurationStats(
+                classname, name, mean, maximum, nruns,
+                sqrt(max(square_mean - mean * mean, 0.0))
+            )
+            for classname, name, mean, maximum, nruns, square_mean in rows
+        ]
+
+    def get_test_history(
+        self, classname: str, name: str, last: int = 10
+    ) -> List[Outcome]:
+        """Get outcomes of a test in the latest runs it was part of.
+
+        Args:
+            classname (str): classname of the testcase
+            name (str): name of the testcase
+            last (int, optional): number of runs. Defaults to 10.
+
+        Returns:
+            List[Outcome]: outcomes, newest first
+        """
+        rows = self.connection.execute(
+            "SELECT results.run_id, results.status, results.duration "
+            "FROM tests JOIN results ON results.test_id = tests.id "
+            "WHERE tests.classname = ? AND tests.name = ? "
+            "ORDER BY results.run_id DESC LIMIT ?",
+            (classname, name, last)
+        )
+        return [
+            Outcome(run_id, STATUSES[status], duration)
+            for run_id, status, duration in rows
+        ]
+
+    def get_statuses(
+        self,
+        keys: Iterable[Tuple[str, str]],
+        last: int = 20,
+        branch: Optional[str] = None
+    ) -> Dict[Tuple[str, str], List[str]]:
+        """Get statuses of tests over the latest runs.
+
+        Args:
+            keys (Iterable[Tuple[str, str]]): classname and name of tests
+            last (int, optional): number of runs. Defaults to 20.
+            branch (Optional[str], optional): only runs of this branch.
+                Defaults to None.
+
+        Returns:
+            Dict[Tuple[str, str], List[str]]: statuses oldest first, tests
+                without stored results are left out
+        """
+        test_ids = self.load_test_ids()
+        keys_by_id = {
+            test_ids[key]: key for key in keys if key in test_ids
+        }
+        run_ids = self.get_run_ids(last, branch)
+        statuses: Dict[Tuple[str, str], List[str]] = {}
+        if not run_ids:
+            return statuses
+        ids = list(keys_by_id)
+        # stay below the host parameter limit of old sqlite versions
+        chunk_size = max(1, 900 - len(run_ids))
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            rows = self.connection.execute(
+                "SELECT test_id, status FROM results "
+                "WHERE test_id IN (%s) AND run_id IN (%s) "
+                "ORDER BY test_id, run_id" % (
+                    ",".join("?" * len(chunk)), ",".join("?" * len(run_ids))
+                ),
+                (*chunk, *run_ids)
+            )
+            for test_id, status in rows:
+                statuses.setdefault(keys_by_id[test_id], []).append(
+                    STATUSES[status]
+                )
+        return statuses
+
+
+def iter_coverage(
+    run_id: int, coverage: CoverageReporter
+) -> Iterable[Tuple[int, str, float]]:
+    for metric, value in coverage.iter_relative_coverage():
+        yield run_id, metric, value
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path, help="History database.")
+    subparsers = parser.add_subparsers(dest="query", required=True)
+    slowest = subparsers.add_parser(
+        "slowest", help="Tests with the longest mean duration."
+    )
+    slowest.add_argument("--runs", type=int, default=10)
+    slowest.add_argument("--limit", type=int, default=10)
+    slowest.add_argument("--branch")
+    delta = subparsers.add_parser(
+        "delta", help="Coverage difference to the latest run of a branch."
+    )
+    delta.add_argument("base_branch")
+    delta.add_argument("coverage", type=float)
+    delta.add_argument("--metric", default="statements")
+    args = parser.parse_args()
+    with History(args.path) as history:
+        if args.query == "slowest":
+            for test in history.get_slowest_tests(
+                args.runs, args.limit, args.branch
+            ):
+                print(
+                    f"{test.mean:10.3f}s {test.maximum:10.3f}s "
+                    f"{test.nruns:5d} {test.classname} {test.name}"
+                )
+        else:
+            print(history.get_coverage_delta(
+                args.base_branch, args.coverage, args.metric
+            ))
@@ -0,0 +1,221 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+selecting the tests affected by changed files
+"""
+from __future__ import annotations
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from json import dump as json_dump, load as json_load
+from logging import getLogger
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional
+
+from .coverage import PythonCoverageParser
+
+logger = getLogger(__file__)
+
+TEST_MODULE_PATTERNS = ("test_*.py", "*_test.py")
+# changes of these files cannot affect test results
+IGNORED_PATTERNS = ("*.md", "*.rst", "docs/*", "LICENSE*", ".github/*")
+
+
+def is_test_module(path: str) -> bool:
+    name = PurePosixPath(path).name
+    return any(fnmatch(name, pattern) for pattern in TEST_MODULE_PATTERNS)
+
+
+def is_ignored(path: str) -> bool:
+    return any(fnmatch(path, pattern) for pattern in IGNORED_PATTERNS)
+
+
+def get_test_module(context: str, rootdir: Path) -> Optional[str]:
+    """Test module of a coverage context, either a pytest node id set by
+    action.pytest_contexts or a name recorded by coverage's
+    dynamic_context = test_function option.
+
+    Args:
+        context (str): coverage context
+        rootdir (Path): directory the tests ran in
+
+    Returns:
+        Optional[str]: path of the test module, None if not found
+    """
+    if "::" in context:
+        return context.split("::", 1)[0]
+    from .reports import find_module
+    # e.g. tests.test_badges.test_content_hash|run
+    return find_module(context.split("|", 1)[0], rootdir)
+
+
+@dataclass
+class ImpactIndex:
+    """Reverse index from source files to the test modules executing them,
+    built from coverage contexts recorded by the action.pytest_contexts
+    plugin. Only full runs cover every test, so the index is rebuilt by
+    full runs and partial runs are counted to force a full run regularly.
+
+    Args:
+        tests (Dict[str, List[str]]): test modules per executed file
+        commit (Optional[str]): commit of the full run
+        runs_since_full (int): number of partial runs since
+    """
+    tests: Dict[str, List[str]] = field(repr=False)
+    commit: Optional[str] = None
+    runs_since_full: int = 0
+
+    @classmethod
+    def from_coverage(
+        cls, coverage: PythonCoverageParser, commit: Optional[str] = None,
+        rootdir: Optional[Path] = None
+    ) -> ImpactIndex:
+        """Build index from a coverage.py json report with contexts
+        (coverage json --show-contexts).
+
+        Args:
+            coverage (PythonCoverageParser): report of a full run
+            commit (Optional[str], optional): commit of the run.
+                Defaults to None.
+            rootdir (Optional[Path], optional): directory the tests ran in.
+                Defaults to the working directory.
+
+        Raises:
+            ValueError: report has no contexts
+
+        Returns:
+            ImpactIndex: index
+        """
+        if rootdir is None:
+            rootdir = Path.cwd()
+        tests: Dict[str, List[str]] = {}
+        has_contexts = False
+        for path, report in coverage.files.items():
+            contexts = report.get("contexts")
+            if contexts is None:
+                continue
+            has_contexts = True
+            modules = set()
+            for context in {
+                context for line_contexts in contexts.values()
+                for context in line_contexts if context
+            }:
+                module = get_test_module(context, rootdir)
+                if module is not None:
+                    modules.add(module)
+            if modules:
+                tests[path] = sorted(modules)
+        if not has_contexts:
+            raise ValueError(
+                "Coverage report has no contexts, create it with "
+                "`coverage json --show-contexts`."
+            )
+        logger.info("Indexed tests of %i files.", len(tests))
+        return cls(tests, commit)
+
+    @property
+    def test_modules(self) -> List[str]:
+        return sorted({
+            module for modules in self.tests.values() for module in modules
+        })
+
+    def select(
+        self, changed_files: Iterable[str], full_run_every: int = 10
+    ) -> Optional[List[str]]:
+        """Select the test modules affected by changed files.
+
+        Args:
+            changed_files (Iterable[str]): changed paths
+            full_run_every (int, optional): run everything if the index has
+                seen this many partial runs. Defaults to 10.
+
+        Returns:
+            Optional[List[str]]: test modules, None if all tests have to
+                run
+        """
+        if self.runs_since_full + 1 >= full_run_every:
+            logger.info("%i partial runs, running all tests.", full_run_every)
+            return None
+        selected = set()
+        for path in changed_files:
+            if path in self.tests:
+                selected.update(self.tests[path])
+            elif is_test_module(path):
+                # new test module
+                selected.add(path)
+            elif not is_ignored(path):
+                # configuration, data or a file unknown to the index
+                logger.info("%s is not indexed, running all tests.", path)
+                return None
+        # deleted test modules cannot run
+        selected = {module for module in selected if Path(module).is_file()}
+        if not selected:
+            # reports need results, a change without affected tests still
+            # gets the full picture
+            logger.info("No affected tests, running all tests.")
+            return None
+        logger.info("Selected %i affected test modules.", len(selected))
+        return sorted(selected)
+
+    def write(self, path: Path) -> None:
+        with open(path, "w") as file_handler:
+            json_dump({
+                "commit": self.commit,
+                "runs_since_full": self.runs_since_full,
+                "tests": self.tests,
+            }, file_handler)
+
+    @classmethod
+    def read(cls, path: Path) -> ImpactIndex:
+        with open(path) as file_handler:
+            data = json_load(file_handler)
+        return cls(data["tests"], data["commit"], data["runs_since_full"])
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("index", type=Path, help="Impact index json file.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser(
+        "build", help="Build the index from the coverage report of a full "
+        "run with contexts."
+    )
+    build.add_argument("coverage", help="coverage.json with contexts.")
+    build.add_argument("--commit", help="Commit of the full run.")
+    select = subparsers.add_parser(
+        "select", help="Print the test modules affected by the changes "
+        "since a base revision as step output 'tests', empty for all tests."
+    )
+    select.add_argument("base", help="Base revision, e.g. the PR base sha.")
+    select.add_argument(
+        "--full-run-every", type=int, default=10,
+        help="Run all tests after this many partial runs. Default is 10."
+    )
+    args = parser.parse_args()
+    if args.command == "build":
+        coverage = PythonCoverageParser()
+        with open(args.coverage) as file_handler:
+            coverage.parse(file_handler)
+        ImpactIndex.from_coverage(coverage, args.commit).write(args.index)
+    else:
+        from .diff_coverage import get_changed_files
+        selected = None
+        if args.index.is_file():
+            index = ImpactIndex.read(args.index)
+            selected = index.select(
+                get_changed_files(args.base), args.full_run_every
+            )
+            if selected is not None:
+                index.runs_since_full += 1
+                index.write(args.index)
+        print("::set-output name=tests::" + " ".join(selected or []))
+        print(
+            "::set-output name=full-run::"
+            + ("true" if selected is None else "false")
+        )
@@ -0,0 +1,218 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+lazy access to members of large json objects
+"""
+from __future__ import annotations
+from io import UnsupportedOperation
+from json import loads
+from logging import getLogger
+from mmap import ACCESS_READ, mmap
+from re import compile
+from typing import (
+    Any, Container, Dict, Iterator, Mapping, Optional, TextIO, Tuple, Union
+)
+
+logger = getLogger(__file__)
+
+Buffer = Union[bytes, mmap]
+Span = Tuple[int, int]
+
+STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+
+
+def object_pattern(inner: bytes) -> bytes:
+    return rb'\{[^{}"]*(?:(?:' + inner + rb')[^{}"]*)*\}'
+
+
+# objects nested up to three levels deep and arrays of scalars are matched
+# by the regex engine as a whole, deeper values fall back to TOKEN_PATTERN
+OBJECT_PATTERN = compile(object_pattern(
+    STRING + rb'|' + object_pattern(STRING + rb'|' + object_pattern(STRING))
+))
+ARRAY_PATTERN = compile(rb'\[[^\[\]{}"]*(?:' + STRING + rb'[^\[\]{}"]*)*\]')
+TOKEN_PATTERN = compile(STRING + rb'|[{}\[\]]')
+STRING_PATTERN = compile(STRING)
+SCALAR_PATTERN = compile(rb'[^\s,}\]]+')
+WHITESPACE_PATTERN = compile(rb'\s*')
+
+
+class JSONIndexError(ValueError):
+    pass
+
+
+def read_buffer(file_handler: TextIO) -> Buffer:
+    """Map json file into memory, falling back to reading it for file like
+    objects without file descriptor.
+
+    Args:
+        file_handler (TextIO): utf-8 encoded json file
+
+    Returns:
+        Buffer: raw json
+    """
+    try:
+        return mmap(file_handler.fileno(), 0, access=ACCESS_READ)
+    except (AttributeError, OSError, UnsupportedOperation, ValueError):
+        return file_handler.read().encode()
+
+
+def skip_whitespace(data: Buffer, position: int) -> int:
+    return WHITESPACE_PATTERN.match(data, position).end()
+
+
+def skip_value(data: Buffer, position: int) -> int:
+    """Find end of json value without decoding it. Only strings and
+    brackets are visited, everything else is skipped by the regex engine.
+
+    Args:
+        data (Buffer): raw json
+        position (int): start of the value
+
+    Raises:
+        JSONIndexError: value is truncated
+
+    Returns:
+        int: end of the value
+    """
+    first = data[position:position + 1]
+    if first == b"{":
+        match = OBJECT_PATTERN.match(data, position)
+    elif first == b"[":
+        match = ARRAY_PATTERN.match(data, position)
+    else:
+        match = STRING_PATTERN.match(data, position) \
+            or SCALAR_PATTERN.match(data, position)
+        if match is None:
+            raise JSONIndexError("Expected value at %i." % position)
+    if match is not None:
+        return match.end()
+    depth = 0
+    for match in TOKEN_PATTERN.finditer(data, position):
+        token = match[0]
+        if token in (b"{", b"["):
+            depth += 1
+        elif token in (b"}", b"]"):
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise JSONIndexError("Unterminated value at %i." % position)
+
+
+def index_object(
+    data: Buffer, position: int = 0, expand: Container[str] = ()
+) -> Tuple[Dict[str, Span], Dict[str, Dict[str, Span]], int]:
+    """Index members of a json object by the byte span of their values.
+
+    Args:
+        data (Buffer): raw json
+        position (int, optional): start of the object. Defaults to 0.
+        expand (Container[str], optional): keys of object members to index
+            one level deeper in the same pass. Defaults to ().
+
+    Raises:
+        JSONIndexError: data is not a well formed object
+
+    Returns:
+        Tuple[Dict[str, Span], Dict[str, Dict[str, Span]], int]: spans of
+            the members, spans of the members of expanded members and end of
+            the object
+    """
+    position = skip_whitespace(data, position)
+    if data[position:position + 1] != b"{":
+        raise JSONIndexError("Expected object at %i." % position)
+    spans: Dict[str, Span] = {}
+    nested: Dict[str, Dict[str, Span]] = {}
+    position = skip_whitespace(data, position + 1)
+    if data[position:position + 1] == b"}":
+        return spans, nested, position + 1
+    while True:
+        match = STRING_PATTERN.match(data, position)
+        if match is None:
+            raise JSONIndexError("Expected key at %i." % position)
+        key = loads(match[0])
+        position = skip_whitespace(data, match.end())
+        if data[position:position + 1] != b":":
+            raise JSONIndexError("Expected ':' at %i." % position)
+        start = skip_whitespace(data, position + 1)
+        if key in expand and data[start:start + 1] == b"{":
+            nested[key], _, end = index_object(data, start)
+        else:
+            end = skip_value(data, start)
+        spans[key] = (start, end)
+        position = skip_whitespace(data, end)
+        delimiter = data[position:position + 1]
+        position = skip_whitespace(data, position + 1)
+        if delimiter == b"}":
+            return spans, nested, position
+        if delimiter != b",":
+            raise JSONIndexError("Expected ',' or '}' at %i." % position)
+
+
+class LazyJSONObject(Mapping):
+    """Read only mapping over the members of a json object, decoding a
+    member only when it is accessed. Holding the index costs a key and two
+    integers per member, the raw json stays in the (memory mapped) buffer.
+
+    Args:
+        data (Buffer): raw json
+        spans (Dict[str, Span]): byte spans of the member values
+        children (Dict[str, LazyJSONObject], optional): members returned as
+            lazy objects themselves. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        data: Buffer,
+        spans: Dict[str, Span],
+        children: Optional[Dict[str, LazyJSONObject]] = None
+    ) -> None:
+        self.data = data
+        self.spans = spans
+        self.children = children or {}
+
+    @classmethod
+    def from_buffer(
+        cls, data: Buffer, position: int = 0, expand: Container[str] = ()
+    ) -> LazyJSONObject:
+        """Index json object in a single pass over the raw json.
+
+        Args:
+            data (Buffer): raw json
+            position (int, optional): start of the object. Defaults to 0.
+            expand (Container[str], optional): keys of object members to
+                return as lazy objects. Defaults to ().
+
+        Returns:
+            LazyJSONObject: indexed object
+        """
+        spans, nested, _ = index_object(data, position, expand)
+        return cls(data, spans, {
+            key: cls(data, member_spans)
+            for key, member_spans in nested.items()
+        })
+
+    def __getitem__(self, key: str) -> Any:
+        child = self.children.get(key)
+        if child is not None:
+            return child
+        start, end = self.spans[key]
+        return loads(self.data[start:end])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __repr__(self) -> str:
+        return "%s(%i members)" % (type(self).__name__, len(self))
@@ -0,0 +1,259 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+building check run output within the size limits of the checks api
+"""
+from dataclasses import replace
+from logging import getLogger
+from typing import Callable, List, Optional, Sequence
+
+from .git_data import (
+    CheckRunAnnotation, CheckRunOutput, MAX_ANNOTATIONS_PER_REQUEST
+)
+
+logger = getLogger(__file__)
+
+# limits documented for the checks api
+MAX_TITLE_LENGTH = 255
+MAX_DETAILS_BYTES = 64 * 1024
+MAX_OUTPUT_LENGTH = 65535
+# annotation messages and details sent in one request, the api documents no
+# limit, large bodies still fail after all the work is done
+MAX_REQUEST_BYTES = 1024 * 1024
+
+TRUNCATION_MARKER = "\n[truncated]"
+GAP_MARKER = "[... {} lines omitted ...]"
+HEAD_LINES = 10
+TAIL_LINES = 10
+
+
+def encoded_size(text: Optional[str]) -> int:
+    return 0 if text is None else len(text.encode())
+
+
+def truncate_length(text: str, max_length: int) -> str:
+    """Limit number of characters, marking truncated text.
+
+    Args:
+        text (str): text
+        max_length (int): maximal number of characters
+
+    Returns:
+        str: text of at most max_length characters
+    """
+    if len(text) <= max_length:
+        return text
+    keep = max(max_length - len(TRUNCATION_MARKER), 0)
+    return (text[:keep] + TRUNCATION_MARKER)[:max_length]
+
+
+def truncate_bytes(text: str, max_bytes: int) -> str:
+    """Limit size of UTF-8 encoded text, marking truncated text. Text is
+    cut on character boundaries.
+
+    Args:
+        text (str): text
+        max_bytes (int): maximal number of bytes
+
+    Returns:
+        str: text of at most max_bytes encoded bytes
+    """
+    encoded = text.encode()
+    if len(encoded) <= max_bytes:
+        return text
+    marker = TRUNCATION_MARKER if max_bytes >= len(TRUNCATION_MARKER) else ""
+    return encoded[:max_bytes - len(marker)].decode("utf-8", "ignore") \
+        + marker
+
+
+def truncate_traceback(
+    text: str, max_bytes: int,
+    is_project_line: Optional[Callable[[str], bool]] = None,
+    head_lines: int = HEAD_LINES, tail_lines: int = TAIL_LINES
+) -> str:
+    """Limit size of a traceback by omitting lines. The head, the tail with
+    the final error and the project frames are kept, deepest frames first,
+    each with its neighbouring lines as long as the budget lasts. Runs of
+    omitted lines are replaced by a marker.
+
+    Args:
+        text (str): traceback
+        max_bytes (int): maximal number of encoded bytes
+        is_project_line (Optional[Callable[[str], bool]], optional): tells
+            frames inside the project. Defaults to None.
+        head_lines (int, optional): number of leading lines to keep.
+            Defaults to HEAD_LINES.
+        tail_lines (int, optional): number of trailing lines to keep.
+            Defaults to TAIL_LINES.
+
+    Returns:
+        str: text of at most max_bytes encoded bytes
+    """
+    if encoded_size(text) <= max_bytes:
+        return text
+    lines = text.split("\n")
+    candidates = list(range(min(head_lines, len(lines))))
+    candidates.extend(range(
+        len(lines) - 1, max(len(lines) - 1 - tail_lines, -1), -1
+    ))
+    if is_project_line is not None:
+        for index in range(len(lines) - 1, -1, -1):
+            if is_project_line(lines[index]):
+                candidates.extend((index, index - 1, index + 1))
+    # every kept line opens at most one gap, the widest marker bounds its
+    # size, one more gap may trail the last kept line
+    marker_size = len(GAP_MARKER.format(len(lines))) + 1
+    size = marker_size
+    kept = set()
+    for index in candidates:
+        if index in kept or not 0 <= index < len(lines):
+            continue
+        cost = len(lines[index].encode()) + 1 + marker_size
+        if size + cost <= max_bytes:
+            kept.add(index)
+            size += cost
+    if not kept:
+        return truncate_bytes(text, max_bytes)
+    parts: List[str] = []
+    omitted = 0
+    for index, line in enumerate(lines):
+        if index not in kept:
+            omitted += 1
+            continue
+        if omitted:
+            parts.append(GAP_MARKER.format(omitted))
+            omitted = 0
+        parts.append(line)
+    if omitted:
+        parts.append(GAP_MARKER.format(omitted))
+    return "\n".join(parts)
+
+
+def share_budget(sizes: Sequence[int], budget: int) -> List[int]:
+    """Split a budget fairly: items smaller than an equal share keep their
+    size, the rest is split evenly among the larger items.
+
+    Args:
+        sizes (Sequence[int]): requested sizes
+        budget (int): total size
+
+    Returns:
+        List[int]: granted size per item
+    """
+    shares = [0] * len(sizes)
+    remaining = max(budget, 0)
+    order = sorted(range(len(sizes)), key=sizes.__getitem__)
+    for position, index in enumerate(order):
+        share = remaining // (len(sizes) - position)
+        shares[index] = min(sizes[index], share)
+        remaining -= shares[index]
+    return shares
+
+
+class OutputBuilder:
+    """Build check run output that the checks api accepts. Summary and
+    text are limited to MAX_OUTPUT_LENGTH characters, sections appended to
+    the text are measured before they are added. Annotation titles are
+    limited to MAX_TITLE_LENGTH characters, messages and details to
+    MAX_DETAILS_BYTES. Annotations are sent in batches, the messages and
+    details of each batch share MAX_REQUEST_BYTES, messages first: texts
+    smaller than an equal share are kept, longer ones are truncated to
+    their share, tracebacks keeping their head and project frames.
+
+    Args:
+        title (str): title of the output
+        summary (str): summary of the output
+        is_project_line (Optional[Callable[[str], bool]], optional): tells
+            project frames of tracebacks. Defaults to None.
+        request_budget (int, optional): bytes of messages and details per
+            batch of annotations. Defaults to MAX_REQUEST_BYTES.
+    """
+
+    def __init__(
+        self, title: str, summary: str,
+        is_project_line: Optional[Callable[[str], bool]] = None,
+        request_budget: int = MAX_REQUEST_BYTES
+    ) -> None:
+        self.title = title
+        self.summary = truncate_length(summary, MAX_OUTPUT_LENGTH)
+        self.is_project_line = is_project_line
+        self.request_budget = request_budget
+        self.text: Optional[str] = None
+        self.annotations: List[CheckRunAnnotation] = []
+
+    def append_text(self, section: Optional[str]) -> bool:
+        """Append section to the text, truncated if it does not fit.
+
+        Args:
+            section (Optional[str]): markdown, None is ignored
+
+        Returns:
+            bool: False if the section has been truncated
+        """
+        if section is None:
+            return True
+        text = section if self.text is None else self.text + "\n" + section
+        self.text = truncate_length(text, MAX_OUTPUT_LENGTH)
+        if len(self.text) < len(text):
+            logger.info("Check run text truncated.")
+            return False
+        return True
+
+    def add_annotation(self, annotation: CheckRunAnnotation) -> None:
+        """Add annotation with title and message limited. Details are
+        limited when the output is built, as their budget depends on the
+        other annotations of the batch.
+
+        Args:
+            annotation (CheckRunAnnotation): annotation
+        """
+        title = annotation.title
+        if title is not None:
+            title = truncate_length(title, MAX_TITLE_LENGTH)
+        self.annotations.append(replace(
+            annotation, title=title,
+            message=truncate_bytes(annotation.message, MAX_DETAILS_BYTES)
+        ))
+
+    def build(self) -> CheckRunOutput:
+        output = CheckRunOutput(
+            title=self.title, summary=self.summary, text=self.text
+        )
+        for start in range(
+            0, len(self.annotations), MAX_ANNOTATIONS_PER_REQUEST
+        ):
+            batch = self.annotations[start:start+MAX_ANNOTATIONS_PER_REQUEST]
+            # messages are shown first, details get what they leave
+            message_shares = share_budget(
+                [encoded_size(annotation.message) for annotation in batch],
+                self.request_budget
+            )
+            details_shares = share_budget(
+                [
+                    min(encoded_size(annotation.raw_details),
+                        MAX_DETAILS_BYTES)
+                    for annotation in batch
+                ],
+                self.request_budget - sum(message_shares)
+            )
+            for annotation, message_share, details_share in zip(
+                batch, message_shares, details_shares
+            ):
+                details = annotation.raw_details
+                if details is not None \
+                        and encoded_size(details) > details_share:
+                    details = truncate_traceback(
+                        details, details_share, self.is_project_line
+                    ) or None
+                output.add_annotation(replace(
+                    annotation,
+                    message=truncate_bytes(annotation.message, message_share),
+                    raw_details=details
+                ))
+        return output
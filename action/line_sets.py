@@ -0,0 +1,56 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+line number sets as integer bitsets
+"""
+from typing import Iterable, List
+
+# bit i of a line set is set if line i is in the set, unions and
+# intersections of whole files are a single big integer operation
+
+
+def to_bitset(lines: Iterable[int]) -> int:
+    """Convert line numbers to a bitset.
+
+    Args:
+        lines (Iterable[int]): positive line numbers
+
+    Returns:
+        int: bitset
+    """
+    lines = list(lines)
+    if not lines:
+        return 0
+    buffer = bytearray((max(lines) >> 3) + 1)
+    for line in lines:
+        buffer[line >> 3] |= 1 << (line & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def from_bitset(bits: int) -> List[int]:
+    """Convert a bitset to sorted line numbers.
+
+    Args:
+        bits (int): bitset
+
+    Returns:
+        List[int]: ascending line numbers
+    """
+    lines = []
+    buffer = bits.to_bytes((bits.bit_length() + 7) >> 3, "little")
+    for offset, byte in enumerate(buffer):
+        while byte:
+            lowest = byte & -byte
+            lines.append((offset << 3) + lowest.bit_length() - 1)
+            byte ^= lowest
+    return lines
+
+
+def count(bits: int) -> int:
+    return bin(bits).count("1")
@@ -0,0 +1,306 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+locating failures in tracebacks
+"""
+from __future__ import annotations
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path, PurePosixPath
+from posixpath import isabs, join, normpath
+from re import compile, MULTILINE
+from subprocess import CalledProcessError, run
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+logger = getLogger(__file__)
+
+Location = Tuple[str, int]
+
+
+class JestLocationResolver:
+    """Find the first project frame of a jest stack trace.
+    Frames are matched lazily and scanning stops at the first frame inside
+    the project. Frames outside of the root directory or inside
+    node_modules are rejected with string operations before any path object
+    is built, and relative paths are memoized per file name, since failures
+    of one suite mostly share the same frames.
+
+    Args:
+        rootdir (Path): project root, stack trace paths are absolute
+        cache_size (int, optional): number of memoized file names.
+            Defaults to 4096.
+    """
+    frame_pattern = compile(r"(/\S+):(\d+):(\d+)")
+
+    def __init__(self, rootdir: Path, cache_size: int = 4096) -> None:
+        self.rootdir = rootdir
+        self.prefix = str(rootdir).rstrip("/") + "/"
+        self.relative_path = lru_cache(maxsize=cache_size)(
+            self._relative_path
+        )
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def for_rootdir(cls, rootdir: Path) -> JestLocationResolver:
+        """Get shared resolver of a root directory.
+
+        Args:
+            rootdir (Path): project root
+
+        Returns:
+            JestLocationResolver: resolver with warm cache
+        """
+        return cls(rootdir)
+
+    def _relative_path(self, filename: str) -> str:
+        return str(PurePosixPath(filename[len(self.prefix):]))
+
+    def resolve(self, text: str) -> Optional[Location]:
+        """Locate first project frame in stack trace.
+
+        Args:
+            text (str): failure text with stack trace
+
+        Returns:
+            Optional[Location]: repository relative path and line,
+                None if no project frame has been found
+        """
+        prefix = self.prefix
+        for match in self.frame_pattern.finditer(text):
+            filename = match[1]
+            if not filename.startswith(prefix) \
+                    or "node_modules" in filename[len(prefix):]:
+                continue
+            return self.relative_path(filename), int(match[2])
+        return None
+
+    def is_project_frame(self, line: str) -> bool:
+        """Tell whether a stack trace line is a frame inside the project.
+
+        Args:
+            line (str): line of a stack trace
+
+        Returns:
+            bool: True for project frames
+        """
+        match = self.frame_pattern.search(line)
+        return match is not None and match[1].startswith(self.prefix) \
+            and "node_modules" not in match[1][len(self.prefix):]
+
+
+@lru_cache(maxsize=8)
+def get_tracked_files(rootdir: Path) -> Optional[Tuple[str, FrozenSet[str]]]:
+    """List files tracked by the git repository containing a directory.
+
+    Args:
+        rootdir (Path): directory inside the repository
+
+    Returns:
+        Optional[Tuple[str, FrozenSet[str]]]: path of rootdir relative to
+            the repository root, empty or ending with a slash, and the
+            tracked files relative to the repository root, None if rootdir
+            is not inside a git repository
+    """
+    try:
+        prefix = run(
+            ["git", "-C", str(rootdir), "rev-parse", "--show-prefix"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        files = run(
+            [
+                "git", "-C", str(rootdir), "ls-files", "--full-name", "-z",
+                ":/"
+            ],
+            capture_output=True, text=True, check=True
+        ).stdout.split("\0")
+    except (CalledProcessError, FileNotFoundError):
+        logger.info("%s is not inside a git repository.", rootdir)
+        return None
+    return prefix, frozenset(path for path in files if path)
+
+
+class PytestLocationResolver:
+    """Find the deepest repository frame of a pytest traceback.
+    Frames are read from the location lines of the long, short and line
+    formats (path:line: ...) and from the File lines of the native format.
+    Paths are made absolute against the root directory first. Paths below
+    it are looked up in the set of tracked files, copies installed to
+    site-packages by the trailing parts of their path, so a package
+    installed from the repository maps back to its sources. Frames of
+    untracked files, e.g. the standard library, are skipped.
+    Without tracked files, i.e. outside of a git repository, every path
+    below the root directory is accepted.
+
+    Args:
+        rootdir (Path): directory pytest ran in
+        tracked (Optional[Tuple[str, FrozenSet[str]]], optional): result of
+            get_tracked_files. Defaults to None.
+        cache_size (int, optional): number of memoized file names.
+            Defaults to 4096.
+    """
+    frame_pattern = compile(
+        r'^(?:([^\s":]+\.py):(\d+):(?: |$)'
+        r'|\s*File "([^"\n]+\.py)", line (\d+))',
+        MULTILINE
+    )
+    install_markers = ("/site-packages/", "/dist-packages/")
+
+    def __init__(
+        self, rootdir: Path,
+        tracked: Optional[Tuple[str, FrozenSet[str]]] = None,
+        cache_size: int = 4096
+    ) -> None:
+        self.rootdir = str(rootdir).rstrip("/")
+        self.prefix = self.rootdir + "/"
+        self.repo_prefix, self.tracked = tracked or ("", None)
+        self._suffixes: Optional[Dict[str, Optional[str]]] = None
+        self.relative_path = lru_cache(maxsize=cache_size)(
+            self._relative_path
+        )
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def for_rootdir(cls, rootdir: Path) -> PytestLocationResolver:
+        """Get shared resolver of a root directory, listing its tracked
+        files once.
+
+        Args:
+            rootdir (Path): directory pytest ran in
+
+        Returns:
+            PytestLocationResolver: resolver with warm cache
+        """
+        return cls(rootdir, get_tracked_files(rootdir))
+
+    @property
+    def suffixes(self) -> Dict[str, Optional[str]]:
+        """Tracked files by every trailing part of their path, None for
+        parts shared by several files. Built on first use, as only
+        installed packages need it.
+        """
+        if self._suffixes is None:
+            self._suffixes = build_suffix_index(self.tracked or ())
+        return self._suffixes
+
+    def _relative_path(self, filename: str) -> Optional[str]:
+        if not isabs(filename):
+            filename = join(self.rootdir, filename)
+        filename = normpath(filename)
+        if filename.startswith(self.prefix):
+            path = self.repo_prefix + filename[len(self.prefix):]
+            if self.tracked is None or path in self.tracked:
+                return path
+            return None
+        if self.tracked is None:
+            return None
+        for marker in self.install_markers:
+            index = filename.rfind(marker)
+            if index >= 0:
+                return self.suffixes.get(filename[index + len(marker):])
+        return None
+
+    def resolve(self, text: str) -> Optional[Location]:
+        """Locate deepest repository frame in traceback.
+
+        Args:
+            text (str): failure text with traceback
+
+        Returns:
+            Optional[Location]: repository relative path and line,
+                None if no repository frame has been found
+        """
+        location = None
+        for match in self.frame_pattern.finditer(text):
+            filename, line = (match[1], match[2]) if match[1] is not None \
+                else (match[3], match[4])
+            path = self.relative_path(filename)
+            if path is not None:
+                location = path, int(line)
+        return location
+
+    def is_project_frame(self, line: str) -> bool:
+        """Tell whether a traceback line is a frame of a tracked file.
+
+        Args:
+            line (str): line of a traceback
+
+        Returns:
+            bool: True for repository frames
+        """
+        match = self.frame_pattern.match(line)
+        return match is not None and self.relative_path(
+            match[1] if match[1] is not None else match[3]
+        ) is not None
+
+
+class SourceLocationResolver(PytestLocationResolver):
+    """Find the first repository frame in failure texts of other test
+    runners, e.g. go test (main_test.go:12:), Java stack traces
+    (FooTest.java:25) or rust panics (src/lib.rs:10:5). These often name
+    files relative to a package or by their name only, so paths that are
+    not tracked below the root directory are looked up by their trailing
+    parts, which succeeds if a single tracked file ends with them.
+    Outside of a git repository only existing files are accepted.
+    """
+    frame_pattern = compile(r"([\w./-]*\w\.[A-Za-z]\w*):(\d+)")
+
+    def _relative_path(self, filename: str) -> Optional[str]:
+        path = super()._relative_path(filename)
+        if self.tracked is None:
+            # without tracked files the pattern would accept host names
+            # and the like
+            if path is None or not Path(self.rootdir, path).is_file():
+                return None
+            return path
+        if path is not None or isabs(filename):
+            return path
+        return self.suffixes.get(normpath(filename))
+
+    def resolve(self, text: str) -> Optional[Location]:
+        """Locate first repository frame in failure text.
+
+        Args:
+            text (str): failure text
+
+        Returns:
+            Optional[Location]: repository relative path and line,
+                None if no repository frame has been found
+        """
+        for match in self.frame_pattern.finditer(text):
+            path = self.relative_path(match[1])
+            if path is not None:
+                return path, int(match[2])
+        return None
+
+    def is_project_frame(self, line: str) -> bool:
+        return any(
+            self.relative_path(match[1]) is not None
+            for match in self.frame_pattern.finditer(line)
+        )
+
+
+def build_suffix_index(paths: Iterable[str]) -> Dict[str, Optional[str]]:
+    """Index paths by all of their trailing parts, e.g. a/b/c.py by
+    a/b/c.py, b/c.py and c.py. Parts of several paths map to None.
+
+    Args:
+        paths (Iterable[str]): slash separated paths
+
+    Returns:
+        Dict[str, Optional[str]]: path per trailing part
+    """
+    index: Dict[str, Optional[str]] = {}
+    for path in paths:
+        suffix = path
+        while True:
+            index[suffix] = path if index.get(suffix, path) == path else None
+            _, slash, suffix = suffix.partition("/")
+            if not slash:
+                break
+    return index
@@ -0,0 +1,191 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+writing and replaying check run and comment payloads
+"""
+from __future__ import annotations
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from datetime import datetime
+from json import dumps as json_dumps, load as json_load, loads as json_loads
+from logging import getLogger
+from os import environ
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from .git_data import CheckRun
+
+logger = getLogger(__file__)
+
+
+def serialize(check_run: CheckRun) -> Dict[str, Any]:
+    """Create json payload of a check run.
+
+    Args:
+        check_run (CheckRun): check run
+
+    Returns:
+        Dict[str, Any]: payload with ISO 8601 timestamps
+    """
+    payload = check_run.to_dict()
+    for key in ("started_at", "completed_at"):
+        if isinstance(payload.get(key), datetime):
+            payload[key] = payload[key].strftime("%Y-%m-%dT%H:%M:%SZ")
+    return payload
+
+
+@dataclass
+class Payloads:
+    """Everything a run would publish, so it can be inspected, compared and
+    uploaded later without parsing the reports again.
+
+    Args:
+        check_runs (List[Dict[str, Any]]): check run payloads, as sent to
+            the checks api
+        issue_number (Optional[int]): pull request to comment on
+        comment (Optional[str]): comment body
+        timings (Dict[str, Any]): duration of each stage in seconds
+    """
+    check_runs: List[Dict[str, Any]]
+    issue_number: Optional[int] = None
+    comment: Optional[str] = None
+    timings: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def create(
+        cls,
+        check_runs: Sequence[CheckRun],
+        issue_number: Optional[int] = None,
+        comment: Optional[str] = None,
+        timings: Optional[Dict[str, Any]] = None
+    ) -> Payloads:
+        return cls(
+            [serialize(check_run) for check_run in check_runs],
+            issue_number, comment, timings or {}
+        )
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        for payload in self.check_runs:
+            yield {"type": "check_run", "payload": payload}
+        if self.comment is not None:
+            yield {
+                "type": "comment", "issue_number": self.issue_number,
+                "body": self.comment
+            }
+        yield {"type": "timings", "stages": self.timings}
+
+    def write(self, path: Path) -> None:
+        """Write payloads as one json document, or as one json record per
+        line if the file name ends with .ndjson.
+
+        Args:
+            path (Path): output file
+        """
+        with open(path, "w") as file_handler:
+            if path.suffix == ".ndjson":
+                for record in self.iter_records():
+                    file_handler.write(json_dumps(record) + "\n")
+            else:
+                file_handler.write(json_dumps({
+                    "check_runs": self.check_runs,
+                    "issue_number": self.issue_number,
+                    "comment": self.comment,
+                    "timings": self.timings,
+                }, indent=2))
+        logger.info(
+            "Wrote %i check runs%s to %s.", len(self.check_runs),
+            "" if self.comment is None else " and a comment", path
+        )
+
+    @classmethod
+    def read(cls, path: Path) -> Payloads:
+        """Read payloads written by write.
+
+        Args:
+            path (Path): json or ndjson file
+
+        Returns:
+            Payloads: payloads
+        """
+        with open(path) as file_handler:
+            if path.suffix != ".ndjson":
+                data = json_load(file_handler)
+                return cls(
+                    data["check_runs"], data.get("issue_number"),
+                    data.get("comment"), data.get("timings", {})
+                )
+            payloads = cls([])
+            for line in file_handler:
+                if not line.strip():
+                    continue
+                record = json_loads(line)
+                if record["type"] == "check_run":
+                    payloads.check_runs.append(record["payload"])
+                elif record["type"] == "comment":
+                    payloads.issue_number = record["issue_number"]
+                    payloads.comment = record["body"]
+                elif record["type"] == "timings":
+                    payloads.timings = record["stages"]
+            return payloads
+
+
+async def upload(
+    payloads: Payloads, github_token: str, repository: str,
+    api_url: Optional[str] = None
+) -> List[Any]:
+    """Publish stored payloads.
+
+    Args:
+        payloads (Payloads): payloads
+        github_token (str): github token
+        repository (str): owner and name of repository, e.g. "org/repo"
+        api_url (Optional[str], optional): api base url.
+            Defaults to GITHUB_API_URL.
+
+    Returns:
+        List[Any]: created check run and comment objects
+    """
+    from .async_publisher import AsyncPublisher
+    from .transport import GITHUB_API_URL, PooledHTTPTransport
+    async with PooledHTTPTransport(
+        github_token, api_url or GITHUB_API_URL
+    ) as transport:
+        return await AsyncPublisher(transport, repository).publish_payloads(
+            payloads.check_runs, payloads.issue_number, payloads.comment
+        )
+
+
+if __name__ == "__main__":
+    from asyncio import run
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "path", type=Path, help="Payloads written by a dry run."
+    )
+    parser.add_argument("github_token", help="Github token for API connection")
+    parser.add_argument(
+        "--repository", default=environ.get("GITHUB_REPOSITORY"),
+        help="Owner and name of the repository, e.g. 'org/repo'. Default is "
+        "GITHUB_REPOSITORY."
+    )
+    parser.add_argument(
+        "--commit",
+        help="Publish the check runs for this commit instead of the one "
+        "they were created for."
+    )
+    args = parser.parse_args()
+    if args.repository is None:
+        parser.error("--repository or GITHUB_REPOSITORY required.")
+    payloads = Payloads.read(args.path)
+    if args.commit is not None:
+        for payload in payloads.check_runs:
+            payload["head_sha"] = args.commit
+    run(upload(
+        payloads, args.github_token, args.repository,
+        environ.get("GITHUB_API_URL")
+    ))
@@ -0,0 +1,134 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+publishing check runs to github
+"""
+from __future__ import annotations
+from logging import getLogger
+from time import sleep, time
+from typing import TYPE_CHECKING, Any, Callable
+
+from .git_data import CheckRun, MAX_ANNOTATIONS_PER_REQUEST, iter_batches
+
+if TYPE_CHECKING:
+    from github.MainClass import Github
+    from github.Repository import Repository
+
+logger = getLogger(__file__)
+
+
+class CheckRunPublisher:
+    """Create a check run and upload all of its annotations.
+    The Checks API accepts at most 50 annotations per request, so the check
+    run is created with the first batch and the remaining batches are
+    appended by updating the check run.
+
+    Args:
+        github (Github): github API connection
+        repo (Repository): repository the check run belongs to
+        batch_size (int, optional): annotations per request.
+            Defaults to MAX_ANNOTATIONS_PER_REQUEST.
+        wait (Callable[[float], None], optional): function used to wait for
+            the rate limit reset. Defaults to time.sleep.
+    """
+
+    def __init__(
+        self,
+        github: Github,
+        repo: Repository,
+        batch_size: int = MAX_ANNOTATIONS_PER_REQUEST,
+        wait: Callable[[float], None] = sleep
+    ) -> None:
+        if not 0 < batch_size <= MAX_ANNOTATIONS_PER_REQUEST:
+            raise ValueError(
+                "Batch size has to be between 1 and "
+                f"{MAX_ANNOTATIONS_PER_REQUEST}."
+            )
+        self.github = github
+        self.repo = repo
+        self.batch_size = batch_size
+        self.wait = wait
+
+    def publish(self, check_run: CheckRun) -> Any:
+        """Create check run and append all annotations batch by batch.
+        The output dict is built once, only its annotations are replaced
+        between requests.
+
+        Args:
+            check_run (CheckRun): check run to publish
+
+        Returns:
+            Any: github check run object
+        """
+        payload = check_run.to_dict()
+        output = payload.pop("output", None)
+        if output is None:
+            return self.call(self.repo.create_check_run, **payload)
+
+        output = dict(output)
+        batches = iter_batches(
+            output.pop("annotations", []), self.batch_size
+        )
+        output["annotations"] = next(batches, [])
+        github_check_run = self.call(
+            self.repo.create_check_run, output=output, **payload
+        )
+        nrequests = 1
+        for batch in batches:
+            self.wait_for_rate_limit()
+            output["annotations"] = batch
+            self.call(github_check_run.edit, output=output)
+            nrequests += 1
+        logger.info(
+            "Published check run %s in %i requests.",
+            check_run.name, nrequests
+        )
+        return github_check_run
+
+    def call(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """Call API method and retry once the rate limit has been reset.
+
+        Args:
+            method (Callable[..., Any]): PyGithub method
+
+        Returns:
+            Any: return value of method
+        """
+        # PyGithub is only loaded once the api is actually called
+        from github.GithubException import RateLimitExceededException
+        while True:
+            try:
+                return method(**kwargs)
+            except RateLimitExceededException as exception:
+                headers = getattr(exception, "headers", None) or {}
+                retry_after = headers.get("retry-after")
+                if retry_after is not None:
+                    delay = float(retry_after)
+                else:
+                    delay = self.seconds_until_reset()
+                logger.warning(
+                    "Rate limit exceeded, retrying in %.0fs.", delay
+                )
+                self.wait(delay)
+
+    def wait_for_rate_limit(self) -> None:
+        """Wait for the rate limit reset if no requests are left.
+        Uses the rate limit headers of the last response, so checking does
+        not cost an additional request.
+        """
+        remaining, _ = self.github.rate_limiting
+        if remaining < 1:
+            delay = self.seconds_until_reset()
+            logger.warning(
+                "Rate limit reached, waiting %.0fs for reset.", delay
+            )
+            self.wait(delay)
+
+    def seconds_until_reset(self) -> float:
+        return max(self.github.rate_limiting_resettime - time(), 0) + 1
@@ -0,0 +1,25 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+pytest plugin recording the running test as coverage context, enabled with
+`coverage run -m pytest -p action.pytest_contexts`
+"""
+from pytest import hookimpl
+
+
+@hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    from coverage import Coverage
+    coverage = Coverage.current()
+    if coverage is not None:
+        # lines executed by setup, call and teardown belong to the test
+        coverage.switch_context(item.nodeid)
+    yield
+    if coverage is not None:
+        coverage.switch_context("")
@@ -11,20 +11,42 @@ collection of test reports
 """
 
 from __future__ import annotations
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from logging import getLogger
+from math import nan
+from os import cpu_count
 from pathlib import Path
 from re import compile, MULTILINE
-from typing import TextIO
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
 try:
-    from xml.etree.cElementTree import parse as parse_xml, ElementTree, Element
+    from xml.etree.cElementTree import (
+        parse as parse_xml, iterparse, ElementTree, Element
+    )
 except ModuleNotFoundError:
-    from xml.etree.ElementTree import parse as parse_xml, ElementTree, Element
+    from xml.etree.ElementTree import (
+        parse as parse_xml, iterparse, ElementTree, Element
+    )
 
+from .durations import DurationAnalysis, DurationRegression
+from .flaky import FlakyAnalysis, FlakyTest
 from .git_data import CheckRun, CheckRunAnnotation, CheckRunOutput
+from .grouping import FailureGroup, group_failures
+from .limits import OutputBuilder
+from .locations import (
+    JestLocationResolver, Location, PytestLocationResolver,
+    SourceLocationResolver
+)
+from .results import ResultRecord, ResultStore, STATUS_CODES
 
 logger = getLogger(__file__)
 ROOTDIR = Path.cwd()
+# path of failures without a location in the repository
+NO_FILE_MATCHED = "nofilematched"
+STATUS_COUNTERS = {
+    "failure": "nfailures",
+    "error": "nerrors",
+    "skipped": "nskipped",
+}
 
 
 class UnknownTestSuiteException(Exception):
@@ -32,13 +54,25 @@ class UnknownTestSuiteException(Exception):
     """
 
 
+def format_time(record: ResultRecord) -> str:
+    return "-" if record.time is None else record.time
+
+
 class JUnitXML:
     """JUnit XML test result class
 
     Args:
         xml (ElementTree): JUnit XML
     """
-    root: Element
+    root: Optional[Element] = None
+    store: ResultStore
+    testcase_path: str
+    root_tags: Tuple[str, ...] = ("testsuites",)
+    # rows of attempts superseded by retries in later shards, by classname,
+    # name and occurence of the testcase
+    retried: Optional[Dict[Tuple[str, str, int], List[ResultRecord]]] = None
+    # drop failure annotations without a location in the repository
+    drop_unlocated: bool = False
     title: str
     start_time: datetime = None
     end_time: datetime = None
@@ -48,24 +82,304 @@ class JUnitXML:
     nskipped: int
     time: float
 
-    def __init__(self) -> None:
+    def __init__(self, xml: ElementTree) -> None:
+        self.root = xml.getroot()
+        assert self.root.tag in self.root_tags, \
+            "root element of JUnit XML should be testsuites"
+        self.read_testsuites(self.root.attrib)
+        test_suites = self.root.findall("./testsuite")
+        for test_suite in test_suites:
+            self.read_testsuite(test_suite.attrib)
+        self.validate(len(test_suites))
+        self.store = ResultStore()
+        for test_case in self.root.iterfind(self.testcase_path):
+            self.read_testcase(test_case)
+
+    def read_testsuites(self, attrib: Dict[str, str]) -> None:
+        """Read attributes of the testsuites root element.
+
+        Args:
+            attrib (Dict[str, str]): attributes of root element
+        """
         raise NotImplementedError()
 
-    def create_check_run_output(self) -> None:
+    def read_testsuite(self, attrib: Dict[str, str]) -> None:
+        """Read attributes of a top level testsuite element.
+
+        Args:
+            attrib (Dict[str, str]): attributes of testsuite element
+        """
         raise NotImplementedError()
 
-    def create_check_run(self, commit_hash: str) -> CheckRun:
+    def validate(self, ntestsuites: int) -> None:
+        """Check the report after all testsuite elements have been read.
+
+        Args:
+            ntestsuites (int): number of top level testsuite elements
+        """
+
+    def accepts_testcase(self, depth: int) -> bool:
+        """Decide whether a testcase element contributes to the results.
+        Must match testcase_path used by the tree based path.
+
+        Args:
+            depth (int): depth of the testcase element, root has depth 0
+
+        Returns:
+            bool: True if testcase is part of the report
+        """
+        return True
+
+    def parse_failure(
+        self, message: Optional[str], text: str
+    ) -> Tuple[str, str, int]:
+        """Extract annotation message and location of a failure.
+
+        Args:
+            message (Optional[str]): message attribute of failure element
+            text (str): text of failure element
+
+        Returns:
+            Tuple[str, str, int]: message, path and line
+        """
+        raise NotImplementedError()
+
+    def is_project_line(self, line: str) -> bool:
+        """Tell whether a line of a failure text is a frame inside the
+        project, these frames are kept when long failure texts are
+        truncated.
+
+        Args:
+            line (str): line of a failure text
+
+        Returns:
+            bool: True for project frames
+        """
+        return False
+
+    def read_testcase(self, test_case: Element) -> None:
+        """Add testcase element to the result store. Failure and error
+        elements are located while the element is at hand, so the store
+        only keeps the extracted data. Every failure and error element gets
+        a row.
+
+        Args:
+            test_case (Element): testcase element
+        """
+        attrib = test_case.attrib
+        classname = attrib.get("classname", "")
+        name = attrib.get("name", "no name detected")
+        time = attrib.get("time")
+        try:
+            duration = float(time)
+        except (TypeError, ValueError):
+            duration = nan
+        failures: List[Element] = []
+        skipped = False
+        for result in test_case:
+            if result.tag in ("failure", "error"):
+                failures.append(result)
+            elif result.tag == "skipped":
+                skipped = True
+        if not failures:
+            self.store.append(
+                classname, name, duration,
+                "skipped" if skipped else "passed",
+                time=time
+            )
+            return
+
+        for element, result in enumerate(failures):
+            message, path, line = self.parse_failure(
+                result.attrib.get("message"), result.text or ""
+            )
+            self.store.append(
+                classname, name, duration, result.tag, path, line, message,
+                result.text, time, element
+            )
+
+    def create_annotation(self, record: ResultRecord) -> CheckRunAnnotation:
+        return CheckRunAnnotation(
+            title="%s (%ss)" % (record.name, format_time(record)),
+            start_line=record.line,
+            end_line=record.line,
+            path=record.path,
+            message=record.message,
+            annotation_level="warning"
+            if record.status == "failure"
+            else "failure",
+            raw_details=record.details
+        )
+
+    def create_group_annotation(
+        self, group: FailureGroup
+    ) -> CheckRunAnnotation:
+        """Create one annotation for all failures of a group. Every distinct
+        failure text is included once.
+
+        Args:
+            group (FailureGroup): failures sharing one fingerprint
+
+        Returns:
+            CheckRunAnnotation: annotation listing the affected tests
+        """
+        record = group.first
+        if group.count == 1:
+            return self.create_annotation(record)
+        affected = "\n".join(
+            "- %s (%ss)" % (test.name, format_time(test))
+            for test in group.tests
+        )
+        return CheckRunAnnotation(
+            title="%s (+%i more)" % (record.name, group.count - 1),
+            start_line=record.line,
+            end_line=record.line,
+            path=record.path,
+            message=f"{record.message}\n\n{group.count} tests failed "
+            f"with this message:\n{affected}",
+            annotation_level="warning"
+            if record.status == "failure"
+            else "failure",
+            raw_details="\n\n".join(group.details) or None
+        )
+
+    def locate_testcase(self, record: ResultRecord) -> Optional[Location]:
+        """Find the file of a testcase, passed tests have no failure
+        location.
+
+        Args:
+            record (ResultRecord): testcase
+
+        Returns:
+            Optional[Location]: path and line, None if unknown
+        """
+        if record.path is None or record.path == NO_FILE_MATCHED:
+            return None
+        return record.path, record.line
+
+    def create_duration_annotation(
+        self, analysis: DurationAnalysis, regression: DurationRegression
+    ) -> Optional[CheckRunAnnotation]:
+        location = self.locate_testcase(regression.record)
+        if location is None:
+            return None
+        path, line = location
+        return CheckRunAnnotation(
+            title="%s got slower (%ss)" % (
+                regression.record.name, format_time(regression.record)
+            ),
+            start_line=line,
+            end_line=line,
+            path=path,
+            message=analysis.describe(regression),
+            annotation_level="notice"
+        )
+
+    def create_flaky_annotation(self, test: FlakyTest) -> CheckRunAnnotation:
+        record = test.record
+        if not test.confirmed:
+            # failed every attempt, flagged by its flip rate only
+            annotation = self.create_annotation(record)
+            annotation.message = f"{record.message}\n\nPossibly flaky " \
+                f"test, {test.reason}."
+            return annotation
+        return CheckRunAnnotation(
+            title="%s is flaky (%ss)" % (
+                record.name, format_time(record)
+            ),
+            start_line=record.line,
+            end_line=record.line,
+            path=record.path,
+            message=f"{record.message}\n\nFlaky test, {test.reason}.",
+            annotation_level="notice",
+            raw_details=record.details
+        )
+
+    def create_check_run_output(
+        self, group: bool = False,
+        durations: Optional[DurationAnalysis] = None,
+        flaky: Optional[FlakyAnalysis] = None
+    ) -> CheckRunOutput:
+        """Create check run output with an annotation per failure.
+
+        Args:
+            group (bool, optional): create one annotation per group of
+                failures sharing message and location. Defaults to False.
+            durations (Optional[DurationAnalysis], optional): slowest tests
+                and duration regressions, shown as text and as notice
+                annotations. Defaults to None.
+            flaky (Optional[FlakyAnalysis], optional): failures split into
+                real and flaky ones, attempts of a test are annotated once
+                and flaky tests only as notice. Defaults to None.
+
+        Returns:
+            CheckRunOutput: check run output
+        """
+        summary = self.get_summary()
+        if flaky is not None and flaky.flaky:
+            summary += f" ({len(flaky.flaky)} flaky tests)"
+        builder = OutputBuilder(self.title, summary, self.is_project_line)
+        if durations is not None:
+            builder.append_text(durations.render_table())
+        failures = self.store.iter_status("failure", "error") \
+            if flaky is None else flaky.failures
+        if group:
+            annotations = [
+                self.create_group_annotation(failure_group)
+                for failure_group in group_failures(failures)
+            ]
+        else:
+            annotations = [
+                self.create_annotation(record) for record in failures
+            ]
+        annotations.extend(
+            self.create_flaky_annotation(test)
+            for test in ([] if flaky is None else flaky.flaky)
+        )
+        # GitHub rejects or hides annotations outside of the repository
+        located = [
+            annotation for annotation in annotations
+            if not self.drop_unlocated or annotation.path != NO_FILE_MATCHED
+        ]
+        if len(located) < len(annotations):
+            logger.info(
+                "Dropped %i annotations without location.",
+                len(annotations) - len(located)
+            )
+        for annotation in located:
+            builder.add_annotation(annotation)
+        for regression in [] if durations is None else durations.regressions:
+            annotation = self.create_duration_annotation(
+                durations, regression
+            )
+            if annotation is not None:
+                builder.add_annotation(annotation)
+        return builder.build()
+
+    def create_check_run(
+        self, commit_hash: str, group: bool = False,
+        durations: Optional[DurationAnalysis] = None,
+        flaky: Optional[FlakyAnalysis] = None
+    ) -> CheckRun:
+        if flaky is not None:
+            # only failures passing on a retry make the run neutral instead
+            # of failed
+            conclusion = flaky.get_conclusion()
+        elif self.nfailures > 0 or self.nerrors > 0:
+            conclusion = "failure"
+        else:
+            conclusion = "success"
         check_run = CheckRun(
             name="unit-tests",
             head_sha=commit_hash,
             status="completed",
-            conclusion="failure"
-            if self.nfailures > 0 or self.nerrors > 0
-            else "success",
+            conclusion=conclusion,
             started_at=self.start_time,
             completed_at=self.end_time
         )
-        check_run.add_output(self.create_check_run_output())
+        check_run.add_output(
+            self.create_check_run_output(group, durations, flaky)
+        )
         return check_run
 
     def get_summary(self) -> str:
@@ -73,138 +387,374 @@ class JUnitXML:
             f"{self.nfailures} failures, " + \
             f"{self.nerrors} errors, {self.nskipped} skipped"
 
+    def get_pass_rate(self) -> int:
+        executed = self.ntests - self.nskipped
+        if executed == 0:
+            return 100
+        passed = executed - self.nfailures - self.nerrors
+        return int(passed * 100 / executed)
+
     @classmethod
-    def from_file(cls, file_handle: TextIO) -> JUnitXML:
-        xml = parse_xml(file_handle)
-        assert xml.getroot().tag == "testsuites", \
-            "root element of JUnit XML should be testsuites"
-        return cls(xml)
+    def from_file(cls, file_handle: TextIO, stream: bool = False) -> JUnitXML:
+        """Create report from JUnit XML file.
+
+        Args:
+            file_handle (TextIO): JUnit XML file
+            stream (bool, optional): use iterparse based ingestion instead
+                of keeping the whole tree in memory. Defaults to False.
+
+        Returns:
+            JUnitXML: report instance
+        """
+        if stream:
+            return cls.from_stream(file_handle)
+        return cls(parse_xml(file_handle))
+
+    @classmethod
+    def from_stream(cls, file_handle: TextIO) -> JUnitXML:
+        """Create report from JUnit XML file in a single iterparse pass.
+        Totals and timestamps are read from the start events, testcases are
+        added to the result store on their end events. Finished elements
+        are removed from their parent, so the element tree does not grow
+        with the size of the report.
+
+        Args:
+            file_handle (TextIO): JUnit XML file
+
+        Returns:
+            JUnitXML: report instance
+        """
+        junit = cls.__new__(cls)
+        junit.store = ResultStore()
+        ntestsuites = 0
+        open_testcases = 0
+        stack: List[Element] = []
+        for event, element in iterparse(file_handle, ("start", "end")):
+            if event == "start":
+                if not stack:
+                    assert element.tag in junit.root_tags, \
+                        "root element of JUnit XML should be testsuites"
+                    junit.read_testsuites(element.attrib)
+                elif len(stack) == 1 and element.tag == "testsuite":
+                    ntestsuites += 1
+                    junit.read_testsuite(element.attrib)
+                elif element.tag == "testcase":
+                    open_testcases += 1
+                stack.append(element)
+                continue
+
+            stack.pop()
+            if element.tag == "testcase" and stack:
+                open_testcases -= 1
+                if junit.accepts_testcase(len(stack)):
+                    junit.read_testcase(element)
+            # children of open testcases are needed for their results
+            if stack and open_testcases == 0:
+                stack[-1].remove(element)
+        junit.validate(ntestsuites)
+        return junit
+
+    @classmethod
+    def from_files(
+        cls, paths: Sequence[str], processes: Optional[int] = None
+    ) -> JUnitXML:
+        """Parse sharded reports in parallel and merge them into one.
+
+        Args:
+            paths (Sequence[str]): JUnit XML files, e.g. one per CI shard
+            processes (Optional[int], optional): number of worker processes.
+                Defaults to the number of files, at most the cpu count.
+
+        Returns:
+            JUnitXML: merged report
+        """
+        if not paths:
+            raise ValueError("No JUnit XML files given.")
+        if len(paths) == 1:
+            return cls.merge([read_shard(cls, paths[0])])
+        # multiprocessing is only loaded for sharded reports
+        from concurrent.futures import ProcessPoolExecutor
+        processes = processes or min(len(paths), cpu_count() or 1)
+        with ProcessPoolExecutor(processes) as executor:
+            shards = list(executor.map(read_shard, [cls]*len(paths), paths))
+        logger.info("Parsed %i JUnit XML shards.", len(shards))
+        return cls.merge(shards)
+
+    @classmethod
+    def merge(cls, shards: Sequence[JUnitXML]) -> JUnitXML:
+        """Merge reports. Counts and times are summed up, the earliest
+        start and the latest end are kept. A testcase of a later shard
+        supersedes the same testcase of an earlier shard, e.g. a retried
+        test only counts with its last attempt. Equally named testcases of
+        one shard are different tests (jest names testcases by their title
+        only), so the n-th occurence of a name in a shard supersedes the
+        n-th occurence in earlier shards. Superseded attempts are kept in
+        retried for flaky test detection.
+
+        Args:
+            shards (Sequence[JUnitXML]): reports in order of precedence
+
+        Returns:
+            JUnitXML: merged report
+        """
+        junit = cls.__new__(cls)
+        junit.title = shards[0].title
+        junit.start_time = min(shard.start_time for shard in shards)
+        junit.end_time = max(shard.end_time for shard in shards)
+        junit.time = round(sum(shard.time for shard in shards), 3)
+        for attr in ("ntests", "nfailures", "nerrors", "nskipped"):
+            setattr(junit, attr, sum(getattr(shard, attr) for shard in shards))
+
+        counters = {
+            STATUS_CODES[status]: counter
+            for status, counter in STATUS_COUNTERS.items()
+        }
+        latest: Dict[
+            Tuple[str, str, int], Tuple[ResultStore, int, int]
+        ] = {}
+        junit.retried = {}
+        for shard in shards:
+            store = shard.store
+            occurences: Dict[Tuple[str, str], int] = {}
+            for start, end in store.iter_testcases():
+                classname, name = store.key(start)
+                occurence = occurences.get((classname, name), 0)
+                occurences[classname, name] = occurence + 1
+                key = (classname, name, occurence)
+                # the merged store keeps the position of the first attempt,
+                # so occurences of a name stay in order
+                superseded = latest.get(key)
+                latest[key] = (store, start, end)
+                if superseded is None:
+                    continue
+                junit.ntests -= 1
+                superseded_store, superseded_start, superseded_end = \
+                    superseded
+                junit.retried.setdefault(key, []).extend(
+                    superseded_store[index]
+                    for index in range(superseded_start, superseded_end)
+                )
+                counter = counters.get(superseded_store.get_testcase_status(
+                    superseded_start, superseded_end
+                ))
+                if counter is not None:
+                    setattr(junit, counter, getattr(junit, counter) - 1)
+        junit.store = ResultStore()
+        for store, start, end in latest.values():
+            for index in range(start, end):
+                junit.store.append_result(store[index])
+        return junit
+
+
+def read_shard(cls: type, path: str) -> JUnitXML:
+    """Parse a single report, used by worker processes.
+
+    Args:
+        cls (type): JUnitXML subclass
+        path (str): path of JUnit XML file
+
+    Returns:
+        JUnitXML: report instance
+    """
+    with open(path) as file_handle:
+        return cls.from_stream(file_handle)
 
 
 class JESTJunitXML(JUnitXML):
     jest_message_pattern = compile(r"(.*)\n\s+at", MULTILINE)
-    jest_path_pattern = compile(r"(/\S+):(\d+):(\d+)")
+    testcase_path = ".//testcase"
 
-    def __init__(self, xml: ElementTree) -> None:
-        self.root = xml.getroot()
-
-        assert self.root.attrib.get("name") == "jest tests"
+    def read_testsuites(self, attrib: Dict[str, str]) -> None:
+        assert attrib.get("name") == "jest tests"
         logger.info("JEST JUnit XML deteted.")
 
         self.title = "jest tests"
         self.start_time = self.end_time = datetime.now()
-        self.ntests = int(self.root.attrib.get("tests"))
-        self.time = float(self.root.attrib.get("time"))
-        self.nfailures = int(self.root.attrib.get("failures"))
-        self.nerrors = int(self.root.attrib.get("errors"))
+        self.ntests = int(attrib.get("tests"))
+        self.time = float(attrib.get("time"))
+        self.nfailures = int(attrib.get("failures"))
+        self.nerrors = int(attrib.get("errors"))
         self.nskipped = 0
 
+    def read_testsuite(self, attrib: Dict[str, str]) -> None:
         # jest is grouping tests in suites
         # to get skipped sum and starting timestamp we have to
         # iter through them
-        for test_suite in self.root.findall("./testsuite"):
-            timestamp = datetime.fromisoformat(
-                test_suite.attrib.get("timestamp"))
-            if timestamp < self.start_time:
-                self.start_time = timestamp
-                self.end_time = self.start_time + timedelta(seconds=self.time)
-            self.nskipped += int(test_suite.get("skipped"))
-
-    def create_check_run_output(self) -> CheckRunOutput:
-        check_run_output = CheckRunOutput(
-            title=self.title,
-            summary=self.get_summary()
+        timestamp = datetime.fromisoformat(attrib.get("timestamp"))
+        if timestamp < self.start_time:
+            self.start_time = timestamp
+            self.end_time = self.start_time + timedelta(seconds=self.time)
+        self.nskipped += int(attrib.get("skipped"))
+
+    def parse_failure(
+        self, message: Optional[str], text: str
+    ) -> Tuple[str, str, int]:
+        message = "Failed to match message text."
+        match = self.jest_message_pattern.search(text)
+        if match is not None:
+            message = match[1]
+        location = JestLocationResolver.for_rootdir(ROOTDIR).resolve(text)
+        if location is None:
+            return message, NO_FILE_MATCHED, 1
+        return (message, *location)
+
+    def is_project_line(self, line: str) -> bool:
+        return JestLocationResolver.for_rootdir(ROOTDIR).is_project_frame(
+            line
         )
-        for test_case in self.root.findall(".//testcase"):
-            name = test_case.attrib.get("name", "no name detected")
-            time = test_case.attrib.get("time", "-")
-            for result in test_case.findall("./*"):
-                message = "Failed to match message text."
-                path = "nofilematched"
-                line = 1
-                match = self.jest_message_pattern.search(result.text)
-                if match is not None:
-                    message = match[1]
-                for filename, line_tmp, _ \
-                        in self.jest_path_pattern.findall(result.text):
-                    try:
-                        path_tmp = str(Path(filename).relative_to(ROOTDIR))
-                        if "node_modules" not in path_tmp:
-                            path = path_tmp
-                            line = int(line_tmp)
-                            break
-                    except ValueError:
-                        continue
-
-                check_run_output.add_annotation(
-                    CheckRunAnnotation(
-                        title="%s (%ss)" % (name, time),
-                        start_line=line,
-                        end_line=line,
-                        path=path,
-                        message=message,
-                        annotation_level="warning"
-                        if result.tag == "failure"
-                        else "failure",
-                        raw_details=result.text
-                    )
-                )
-        return check_run_output
 
 
-class PytestJunitXML(JUnitXML):
-    pytest_path_pattern = compile(r"^(\w\S*.py):(\d+)", MULTILINE)
+def find_module(classname: str, rootdir: Path) -> Optional[str]:
+    """Find the test module of a pytest classname, the dotted module path
+    optionally followed by test classes.
 
-    def __init__(self, xml: ElementTree) -> None:
-        self.root = xml.getroot()
+    Args:
+        classname (str): classname of a testcase
+        rootdir (Path): directory pytest ran in
+
+    Returns:
+        Optional[str]: path relative to rootdir, None if not found
+    """
+    parts = classname.split(".")
+    for end in range(len(parts), 0, -1):
+        path = "/".join(parts[:end]) + ".py"
+        if (rootdir / path).is_file():
+            return path
+    return None
 
-        assert self.root.attrib.get("name") is None
-        assert len(self.root.findall("./testsuite")) == 1
-        assert self.root.find("./testsuite").attrib.get("name") == "pytest"
 
-        self.root = self.root.find("./testsuite")
+class PytestJunitXML(JUnitXML):
+    drop_unlocated = True
+    testcase_path = "./testsuite/testcase"
+
+    def read_testsuites(self, attrib: Dict[str, str]) -> None:
+        # pytest names the root element since version 7
+        assert attrib.get("name") in (None, "pytest tests")
         self.title = "pytest tests"
-        self.ntests = int(self.root.attrib.get("tests"))
-        self.time = float(self.root.attrib.get("time"))
-        self.nfailures = int(self.root.attrib.get("failures"))
-        self.nerrors = int(self.root.attrib.get("errors"))
-        self.nskipped = int(self.root.attrib.get("skipped"))
-        self.start_time = datetime.fromisoformat(
-            self.root.attrib.get("timestamp")
-        )
+
+    def read_testsuite(self, attrib: Dict[str, str]) -> None:
+        assert attrib.get("name") == "pytest"
+        self.ntests = int(attrib.get("tests"))
+        self.time = float(attrib.get("time"))
+        self.nfailures = int(attrib.get("failures"))
+        self.nerrors = int(attrib.get("errors"))
+        self.nskipped = int(attrib.get("skipped"))
+        self.start_time = datetime.fromisoformat(attrib.get("timestamp"))
         self.end_time = self.start_time + timedelta(seconds=self.time)
 
-    def create_check_run_output(self) -> CheckRunOutput:
-        check_run_output = CheckRunOutput(
-            title=self.title,
-            summary=self.get_summary()
+    def validate(self, ntestsuites: int) -> None:
+        assert ntestsuites == 1
+
+    def locate_testcase(self, record: ResultRecord) -> Optional[Location]:
+        location = super().locate_testcase(record)
+        if location is not None:
+            return location
+        path = find_module(record.classname, ROOTDIR)
+        return None if path is None else (path, 1)
+
+    def accepts_testcase(self, depth: int) -> bool:
+        return depth == 2
+
+    def parse_failure(
+        self, message: Optional[str], text: str
+    ) -> Tuple[str, str, int]:
+        if message is None:
+            message = "Failed to match message text."
+        location = PytestLocationResolver.for_rootdir(ROOTDIR).resolve(text)
+        if location is None:
+            return message, NO_FILE_MATCHED, 1
+        return (message, *location)
+
+    def is_project_line(self, line: str) -> bool:
+        return PytestLocationResolver.for_rootdir(ROOTDIR).is_project_frame(
+            line
+        )
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse ISO 8601 timestamp, aware ones are converted to naive UTC
+    like the timestamps of jest and pytest.
+
+    Args:
+        value (Optional[str]): timestamp attribute
+
+    Returns:
+        Optional[datetime]: timestamp, None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        timestamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+class GenericJUnitXML(JUnitXML):
+    """JUnit XML of any producer, e.g. go-junit-report, surefire, mocha or
+    cargo-nextest. The root may be a testsuites or a single testsuite
+    element. Producers disagree on the totals they write, so tests are
+    counted from the testcases. Failures are located at the first frame of
+    a tracked file.
+    """
+    drop_unlocated = True
+    root_tags = ("testsuites", "testsuite")
+    testcase_path = ".//testcase"
+
+    def read_testsuites(self, attrib: Dict[str, str]) -> None:
+        self.title = attrib.get("name") or "unit tests"
+        self.ntests = self.nfailures = self.nerrors = self.nskipped = 0
+        self.time = float(attrib.get("time") or 0)
+        self.suites_time = 0.0
+        self.start_time = parse_timestamp(attrib.get("timestamp"))
+
+    def read_testsuite(self, attrib: Dict[str, str]) -> None:
+        self.suites_time += float(attrib.get("time") or 0)
+        timestamp = parse_timestamp(attrib.get("timestamp"))
+        if timestamp is not None and (
+            self.start_time is None or timestamp < self.start_time
+        ):
+            self.start_time = timestamp
+
+    def validate(self, ntestsuites: int) -> None:
+        if not self.time:
+            self.time = round(self.suites_time, 3)
+        if self.start_time is None:
+            self.end_time = datetime.now()
+            self.start_time = self.end_time - timedelta(seconds=self.time)
+        else:
+            self.end_time = self.start_time + timedelta(seconds=self.time)
+
+    def read_testcase(self, test_case: Element) -> None:
+        super().read_testcase(test_case)
+        tags = {result.tag for result in test_case}
+        self.ntests += 1
+        if "error" in tags:
+            self.nerrors += 1
+        elif "failure" in tags:
+            self.nfailures += 1
+        elif "skipped" in tags:
+            self.nskipped += 1
+
+    def parse_failure(
+        self, message: Optional[str], text: str
+    ) -> Tuple[str, str, int]:
+        if not message:
+            lines = [line.strip() for line in text.splitlines()]
+            message = next(
+                (line for line in lines if line),
+                "Failed to match message text."
+            )
+        location = SourceLocationResolver.for_rootdir(ROOTDIR).resolve(
+            f"{message}\n{text}"
+        )
+        if location is None:
+            return message, NO_FILE_MATCHED, 1
+        return (message, *location)
+
+    def is_project_line(self, line: str) -> bool:
+        return SourceLocationResolver.for_rootdir(ROOTDIR).is_project_frame(
+            line
         )
-        for test_case in self.root.findall("./testcase"):
-            name = test_case.attrib.get("name", "no name detected")
-            time = test_case.attrib.get("time", "-")
-            for result in test_case.findall("./*"):
-                message = result.attrib.get(
-                    "message", "Failed to match message text."
-                )
-                match = self.pytest_path_pattern.search(result.text)
-                if match is None:
-                    path = "nofilematched"
-                    line = 1
-                else:
-                    path = match[1]
-                    line = int(match[2])
-
-                check_run_output.add_annotation(
-                    CheckRunAnnotation(
-                        title="%s (%ss)" % (name, time),
-                        start_line=line,
-                        end_line=line,
-                        path=path,
-                        message=message,
-                        annotation_level="warning"
-                        if result.tag == "failure"
-                        else "failure",
-                        raw_details=result.text
-                    )
-                )
-        return check_run_output
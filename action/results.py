@@ -0,0 +1,223 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+compact column store of test results
+"""
+from __future__ import annotations
+from array import array
+from logging import getLogger
+from math import isnan, nan
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = getLogger(__file__)
+
+STATUSES = ("passed", "failure", "error", "skipped")
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+
+class ResultRecord(NamedTuple):
+    """Row of a ResultStore.
+
+    Args:
+        classname (str): classname of the testcase
+        name (str): name of the testcase
+        duration (float): duration in seconds, nan if unknown
+        status (str): one of passed, failure, error or skipped
+        path (Optional[str]): file the failure is located in
+        line (int): line the failure is located at, 0 if unknown
+        message (Optional[str]): short failure message
+        details (Optional[str]): full failure text
+        time (Optional[str]): duration as written in the report
+        element (int): position of the failure element in its testcase,
+            rows of later elements follow the row of the first one
+    """
+    classname: str
+    name: str
+    duration: float
+    status: str
+    path: Optional[str]
+    line: int
+    message: Optional[str]
+    details: Optional[str]
+    time: Optional[str] = None
+    element: int = 0
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.classname, self.name
+
+
+class ResultStore:
+    """Column store of testcases. Every column is an array or a list of
+    references into a table of interned strings, so a testcase costs a
+    handful of machine words instead of a dict and a dataclass instance.
+    Classnames, paths, messages and failure texts repeat a lot between
+    testcases and are stored only once. A testcase with several failure
+    elements has a row per element, durations count for its first row
+    only.
+    """
+    __slots__ = (
+        "strings", "string_index", "names", "classnames", "durations",
+        "statuses", "paths", "lines", "messages", "details", "times",
+        "elements"
+    )
+
+    def __init__(self) -> None:
+        # index 0 is reserved for None
+        self.strings: List[Optional[str]] = [None]
+        self.string_index: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.classnames = array("L")
+        self.durations = array("d")
+        self.statuses = array("B")
+        self.paths = array("L")
+        self.lines = array("L")
+        self.messages = array("L")
+        self.details = array("L")
+        self.times = array("L")
+        self.elements = array("L")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> ResultRecord:
+        strings = self.strings
+        return ResultRecord(
+            classname=strings[self.classnames[index]],
+            name=self.names[index],
+            duration=self.durations[index],
+            status=STATUSES[self.statuses[index]],
+            path=strings[self.paths[index]],
+            line=self.lines[index],
+            message=strings[self.messages[index]],
+            details=strings[self.details[index]],
+            time=strings[self.times[index]],
+            element=self.elements[index]
+        )
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def intern(self, text: Optional[str]) -> int:
+        """Get reference of a string, adding it to the table if unknown.
+
+        Args:
+            text (Optional[str]): string to intern
+
+        Returns:
+            int: index into strings
+        """
+        if text is None:
+            return 0
+        index = self.string_index.get(text)
+        if index is None:
+            index = self.string_index[text] = len(self.strings)
+            self.strings.append(text)
+        return index
+
+    def append(
+        self,
+        classname: str,
+        name: str,
+        duration: float = nan,
+        status: str = "passed",
+        path: Optional[str] = None,
+        line: int = 0,
+        message: Optional[str] = None,
+        details: Optional[str] = None,
+        time: Optional[str] = None,
+        element: int = 0
+    ) -> None:
+        self.names.append(name)
+        self.classnames.append(self.intern(classname))
+        self.durations.append(duration)
+        self.statuses.append(STATUS_CODES[status])
+        self.paths.append(self.intern(path))
+        self.lines.append(line)
+        self.messages.append(self.intern(message))
+        self.details.append(self.intern(details))
+        self.times.append(self.intern(time))
+        self.elements.append(element)
+
+    def append_result(self, result: ResultRecord) -> None:
+        self.append(*result)
+
+    def key(self, index: int) -> Tuple[str, str]:
+        return self.strings[self.classnames[index]], self.names[index]
+
+    def iter_testcases(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the rows of each testcase.
+
+        Yields:
+            Tuple[int, int]: first row and end of the rows of a testcase
+        """
+        elements = self.elements
+        start = 0
+        for index in range(1, len(self) + 1):
+            if index == len(self) or not elements[index]:
+                yield start, index
+                start = index
+
+    def get_testcase_status(self, start: int, end: int) -> int:
+        """Status code of a testcase, errors take precedence over failures.
+
+        Args:
+            start (int): first row of the testcase
+            end (int): end of the rows of the testcase
+
+        Returns:
+            int: status code
+        """
+        codes = self.statuses[start:end]
+        if STATUS_CODES["error"] in codes:
+            return STATUS_CODES["error"]
+        return codes[0]
+
+    def count(self, status: str) -> int:
+        return self.statuses.count(STATUS_CODES[status])
+
+    def iter_status(self, *statuses: str) -> Iterator[ResultRecord]:
+        """Iterate over rows with one of the given statuses.
+
+        Yields:
+            ResultRecord: matching row
+        """
+        codes = {STATUS_CODES[status] for status in statuses}
+        for index, code in enumerate(self.statuses):
+            if code in codes:
+                yield self[index]
+
+    def is_known_duration(self, index: int) -> bool:
+        return not (isnan(self.durations[index]) or self.elements[index])
+
+    def total_duration(self) -> float:
+        return sum(
+            self.durations[index] for index in range(len(self))
+            if self.is_known_duration(index)
+        )
+
+    def sorted_by_duration(self, reverse: bool = True) -> List[int]:
+        """Row indices ordered by duration, unknown durations last.
+
+        Args:
+            reverse (bool, optional): longest first. Defaults to True.
+
+        Returns:
+            List[int]: row indices
+        """
+        known = [
+            index for index in range(len(self))
+            if self.is_known_duration(index)
+        ]
+        known.sort(key=self.durations.__getitem__, reverse=reverse)
+        return known + [
+            index for index in range(len(self))
+            if not self.is_known_duration(index)
+        ]
@@ -0,0 +1,239 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+running tests in parallel shards balanced by past durations
+"""
+from argparse import ArgumentParser
+from glob import glob
+from heapq import heapify, heapreplace
+from logging import getLogger
+from os import cpu_count
+from pathlib import Path
+from re import compile
+from subprocess import PIPE, Popen, run
+from sys import executable
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .durations import DurationBaseline
+
+logger = getLogger(__file__)
+
+DEFAULT_DURATION = 1.0
+COLLECTED_PATTERN = compile(r"([^\s:]+\.py)(?:::|: \d+$)")
+NO_TESTS_COLLECTED = 5
+
+
+def balance_shards(
+    durations: Dict[str, float], nshards: int
+) -> List[List[str]]:
+    """Distribute work items on shards by longest processing time first
+    scheduling: the longest remaining item is assigned to the shard with
+    the least total duration. The longest shard takes at most 4/3 of the
+    optimal time.
+
+    Args:
+        durations (Dict[str, float]): expected duration per item
+        nshards (int): number of shards
+
+    Returns:
+        List[List[str]]: items per shard, empty shards are dropped
+    """
+    if nshards < 1:
+        raise ValueError("At least one shard required.")
+    shards: List[List[str]] = [[] for _ in range(nshards)]
+    # (total duration, shard index), the index keeps the order stable
+    loads: List[Tuple[float, int]] = [
+        (0.0, index) for index in range(nshards)
+    ]
+    heapify(loads)
+    for item in sorted(durations, key=lambda item: (-durations[item], item)):
+        total, index = loads[0]
+        shards[index].append(item)
+        heapreplace(loads, (total + durations[item], index))
+    return [shard for shard in shards if shard]
+
+
+def collect_test_files(pytest_args: Sequence[str] = ()) -> List[str]:
+    """Collect test modules the way pytest does, honoring its config.
+
+    Args:
+        pytest_args (Sequence[str], optional): arguments selecting tests.
+            Defaults to ().
+
+    Returns:
+        List[str]: test modules in collection order
+    """
+    process = run(
+        [executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        stdout=PIPE, text=True
+    )
+    files: Dict[str, None] = {}
+    for line in process.stdout.splitlines():
+        # node ids, or "path: count" if quietness was raised further
+        match = COLLECTED_PATTERN.match(line)
+        if match is not None:
+            files[match[1]] = None
+    return list(files)
+
+
+def get_file_durations(
+    files: Sequence[str], baseline: Optional[DurationBaseline],
+    rootdir: Path
+) -> Dict[str, float]:
+    """Expected duration of each test module, the sum of the mean durations
+    of its tests. Modules without known tests are assumed to take as long
+    as the average module.
+
+    Args:
+        files (Sequence[str]): test modules
+        baseline (Optional[DurationBaseline]): durations of earlier runs
+        rootdir (Path): directory the tests run in
+
+    Returns:
+        Dict[str, float]: duration per module
+    """
+    from .reports import find_module
+    known: Dict[str, float] = {}
+    if baseline is not None:
+        modules: Dict[str, Optional[str]] = {}
+        for (classname, _), duration in baseline.durations.items():
+            if classname not in modules:
+                modules[classname] = find_module(classname, rootdir)
+            path = modules[classname]
+            if path is not None:
+                known[path] = known.get(path, 0) + duration.mean
+    durations = {path: known[path] for path in files if path in known}
+    default = sum(durations.values()) / len(durations) if durations \
+        else DEFAULT_DURATION
+    logger.info(
+        "Known durations of %i of %i test modules.",
+        len(durations), len(files)
+    )
+    return {path: durations.get(path, default) for path in files}
+
+
+def run_pytest_shards(
+    shards: Sequence[Sequence[str]],
+    output_dir: Path,
+    pytest_args: Sequence[str] = (),
+    contexts: bool = False
+) -> int:
+    """Run every shard in its own pytest process under coverage, then
+    combine the coverage data into coverage.json. Each shard writes
+    junit-<index>.xml to the output directory.
+
+    Args:
+        shards (Sequence[Sequence[str]]): test modules per shard
+        output_dir (Path): directory of the junit files
+        pytest_args (Sequence[str], optional): additional pytest arguments.
+            Defaults to ().
+        contexts (bool, optional): record the test running each line as
+            coverage context, required by the impact index. Defaults to
+            False.
+
+    Returns:
+        int: highest exit code of the shards
+    """
+    if not shards:
+        logger.warning("No tests collected.")
+        return NO_TESTS_COLLECTED
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for stale in output_dir.glob("junit-*.xml"):
+        stale.unlink()
+    plugin_args = ["-p", "action.pytest_contexts"] if contexts else []
+    processes = [
+        Popen([
+            executable, "-m", "coverage", "run", "--parallel-mode",
+            "-m", "pytest", *plugin_args, "--junitxml",
+            str(output_dir / f"junit-{index}.xml"), *pytest_args, *files
+        ])
+        for index, files in enumerate(shards)
+    ]
+    exit_code = max((process.wait() for process in processes), default=0)
+    run([executable, "-m", "coverage", "combine"], check=True)
+    json_args = ["--show-contexts"] if contexts else []
+    run([executable, "-m", "coverage", "json", *json_args], check=True)
+    logger.info("Ran %i shards, exit code %i.", len(shards), exit_code)
+    return exit_code
+
+
+def read_baseline(
+    baseline_junit: Optional[str], history: Optional[str]
+) -> Optional[DurationBaseline]:
+    if baseline_junit is not None:
+        from .reports import PytestJunitXML
+        paths = sorted(glob(baseline_junit, recursive=True))
+        if paths:
+            return DurationBaseline.from_store(
+                PytestJunitXML.from_files(paths).store, baseline_junit
+            )
+    if history is not None and Path(history).is_file():
+        from .history import History
+        with History(history) as stored_runs:
+            return DurationBaseline.from_history(stored_runs)
+    return None
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers", default="auto",
+        help="Number of parallel pytest processes, 'auto' for one per cpu. "
+        "Default is 'auto'."
+    )
+    parser.add_argument(
+        "--baseline-junit",
+        help="Glob pattern of JUnit XML files of an earlier run, the "
+        "durations of its tests balance the shards."
+    )
+    parser.add_argument(
+        "--history",
+        help="SQLite database of earlier runs, used for the durations if no "
+        "baseline JUnit XML is given."
+    )
+    parser.add_argument(
+        "--output-dir", type=Path, default=Path("test-shards"),
+        help="Directory of the JUnit XML file of each shard. Default is "
+        "'test-shards'."
+    )
+    parser.add_argument(
+        "--tests", nargs="*",
+        help="Run only these test modules, e.g. selected by the impact "
+        "index. Default is all collected modules."
+    )
+    parser.add_argument(
+        "--contexts", action="store_true",
+        help="Record the test running each line as coverage context."
+    )
+    parser.add_argument(
+        "pytest_args", nargs="*",
+        help="Additional pytest options after --, passed to the collection "
+        "and to every shard, e.g. -m or -k."
+    )
+    args = parser.parse_args()
+    if args.workers == "auto":
+        workers = cpu_count() or 1
+    else:
+        workers = int(args.workers)
+    files = collect_test_files(args.pytest_args)
+    if args.tests:
+        selected = set(args.tests)
+        files = [path for path in files if path in selected]
+    durations = get_file_durations(
+        files, read_baseline(args.baseline_junit, args.history), Path.cwd()
+    )
+    shards = balance_shards(durations, workers)
+    for index, shard in enumerate(shards):
+        print(
+            f"shard {index}: {len(shard)} modules, "
+            f"{sum(durations[path] for path in shard):.1f}s expected"
+        )
+    parser.exit(run_pytest_shards(
+        shards, args.output_dir, args.pytest_args, args.contexts
+    ))
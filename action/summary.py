@@ -0,0 +1,211 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+coverage tables of the pull request comment
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from heapq import nlargest, nsmallest
+from logging import getLogger
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .coverage import CoverageReporter, FileCoverage
+from .diff_coverage import merge_lines
+
+logger = getLogger(__file__)
+
+# github rejects comments longer than 65536 characters
+MAX_COMMENT_LENGTH = 65536
+
+METRIC_LABELS = {
+    "cover": "Cover",
+    "statements": "% Stmts",
+    "branches": "% Branch",
+    "functions": "% Funcs",
+    "lines": "% Lines",
+}
+
+# sort order: (select largest, key)
+SORT_KEYS: Dict[str, Tuple[bool, Callable[[FileCoverage], tuple]]] = {
+    "missing": (True, lambda row: (row.missing, row.statements)),
+    "coverage": (
+        False, lambda row: (min(row.percentages.values()), -row.missing)
+    ),
+    "name": (False, lambda row: (row.path,)),
+}
+
+
+def format_ranges(lines: List[int]) -> str:
+    return ", ".join(
+        str(start) if start == end else f"{start}-{end}"
+        for start, end in merge_lines(lines)
+    )
+
+
+def format_percentage(percentage: float) -> str:
+    return f"{percentage:.0f}%" if percentage == int(percentage) \
+        else f"{percentage:.2f}%"
+
+
+@dataclass
+class CoverageSummary:
+    """Coverage tables rendered from parsed coverage reports, so no text
+    report of the test runner has to be scraped.
+
+    Args:
+        total (FileCoverage): coverage of the whole report
+        files (List[FileCoverage]): selected files in display order
+        nfiles (int): number of files in the report
+        sort (str): sort order of the files
+    """
+    total: FileCoverage
+    files: List[FileCoverage]
+    nfiles: int
+    sort: str = "missing"
+
+    @classmethod
+    def from_reporter(
+        cls,
+        coverage: CoverageReporter,
+        sort: str = "missing",
+        limit: int = 100,
+        rootdir: Optional[Path] = None
+    ) -> CoverageSummary:
+        """Select top files of a coverage report. Only the selected files
+        are kept, the others are just counted.
+
+        Args:
+            coverage (CoverageReporter): parsed coverage report
+            sort (str, optional): one of missing (most missing statements
+                first), coverage (lowest coverage first) or name.
+                Defaults to "missing".
+            limit (int, optional): maximal number of files.
+                Defaults to 100.
+            rootdir (Optional[Path], optional): directory absolute paths are
+                shown relative to. Defaults to None.
+
+        Raises:
+            ValueError: unknown sort order or reporter without totals
+
+        Returns:
+            CoverageSummary: summary of the report
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort order '{sort}'.")
+        total = coverage.get_total_coverage()
+        if total is None:
+            raise ValueError(f"{type(coverage).__name__} has no totals.")
+        largest, key = SORT_KEYS[sort]
+        nfiles = 0
+
+        def iter_files():
+            nonlocal nfiles
+            prefix = None if rootdir is None \
+                else str(rootdir).rstrip("/") + "/"
+            for row in coverage.iter_file_coverage():
+                nfiles += 1
+                if prefix is not None and row.path.startswith(prefix):
+                    row = row._replace(path=row.path[len(prefix):])
+                yield row
+        files = (nlargest if largest else nsmallest)(
+            limit, iter_files(), key=key
+        )
+        logger.debug("Selected %i of %i files.", len(files), nfiles)
+        return cls(total, files, nfiles, sort)
+
+    @property
+    def metrics(self) -> List[str]:
+        return list(self.total.percentages)
+
+    @property
+    def show_missing_lines(self) -> bool:
+        return any(row.missing_lines is not None for row in self.files)
+
+    def render_header(self) -> str:
+        columns = ["Name", "Stmts", "Miss"] + [
+            METRIC_LABELS.get(metric, metric) for metric in self.metrics
+        ]
+        if self.show_missing_lines:
+            columns.append("Missing")
+        return "| " + " | ".join(columns) + " |\n" + \
+            "|" + "|".join(
+                [":---"] + ["---:"] * (len(columns) - 1)
+            ) + "|\n"
+
+    def render_row(self, row: FileCoverage, bold: bool = False) -> str:
+        name = f"**{row.path}**" if bold else f"`{row.path}`"
+        cells = [name, str(row.statements), str(row.missing)] + [
+            format_percentage(row.percentages.get(metric, 100))
+            for metric in self.metrics
+        ]
+        if self.show_missing_lines:
+            cells.append(format_ranges(row.missing_lines or []))
+        return "| " + " | ".join(cells) + " |\n"
+
+    def render_summary(self) -> str:
+        """Render table of the totals.
+
+        Returns:
+            str: markdown table
+        """
+        return self.render_header() + self.render_row(self.total, bold=True)
+
+    def render_details(self, max_length: int = MAX_COMMENT_LENGTH) -> str:
+        """Render table of the selected files, dropping rows that exceed
+        the maximal length.
+
+        Args:
+            max_length (int, optional): maximal number of characters.
+                Defaults to MAX_COMMENT_LENGTH.
+
+        Returns:
+            str: markdown table
+        """
+        footer = "\n{} of {} files shown, sorted by {}.\n"
+        # reserve space for the longest possible footer
+        budget = max_length - len(footer) - 2 * len(str(self.nfiles)) - \
+            len(self.sort)
+        lines = [self.render_header()]
+        length = len(lines[0])
+        for row in self.files:
+            line = self.render_row(row)
+            length += len(line)
+            if length > budget:
+                logger.info(
+                    "Coverage table truncated after %i files.", len(lines) - 1
+                )
+                break
+            lines.append(line)
+        return "".join(lines) + footer.format(
+            len(lines) - 1, self.nfiles, self.sort
+        )
+
+    def render_comment(
+        self, max_length: int = MAX_COMMENT_LENGTH, note: Optional[str] = None
+    ) -> str:
+        """Render pull request comment with totals and collapsible table of
+        the files.
+
+        Args:
+            max_length (int, optional): maximal number of characters.
+                Defaults to MAX_COMMENT_LENGTH.
+            note (Optional[str], optional): paragraph shown below the
+                totals. Defaults to None.
+
+        Returns:
+            str: markdown comment
+        """
+        head = "### Coverage\n\n" + self.render_summary() + (
+            "" if note is None else f"\n{note}\n"
+        ) + "\n<details><summary>Files</summary>\n\n"
+        tail = "\n</details>\n"
+        return head + self.render_details(
+            max_length - len(head) - len(tail)
+        ) + tail
@@ -0,0 +1,120 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+timing of pipeline stages
+"""
+from contextlib import contextmanager
+from json import dump as json_dump, dumps as json_dumps
+from logging import getLogger
+from pathlib import Path
+from time import perf_counter
+from tracemalloc import (
+    get_traced_memory, is_tracing, reset_peak, start as start_tracing,
+    stop as stop_tracing
+)
+from typing import Any, Callable, Dict, Iterator
+
+logger = getLogger(__file__)
+
+
+class StageTimer:
+    """Measure the wall time of named stages with a monotonic clock and,
+    if memory is traced, the tracemalloc peak of each stage. A stage entered
+    several times accumulates its durations and keeps its highest peak.
+    Stages must not be nested when memory is traced, entering a stage resets
+    the peak.
+
+    Args:
+        trace_memory (bool, optional): trace python allocations, slows the
+            stages down. Defaults to False.
+    """
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.durations: Dict[str, float] = {}
+        self.peaks: Dict[str, int] = {}
+        self.trace_memory = trace_memory
+        if trace_memory and not is_tracing():
+            start_tracing()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self.trace_memory:
+            reset_peak()
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            self.durations[name] = self.durations.get(name, 0) + duration
+            if self.trace_memory:
+                self.peaks[name] = max(
+                    self.peaks.get(name, 0), get_traced_memory()[1]
+                )
+            logger.debug("Stage %s took %.3fs.", name, duration)
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations.values())
+
+    def stop(self) -> None:
+        if self.trace_memory:
+            stop_tracing()
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self.durations, total=self.total)
+
+    def to_trace(self) -> Dict[str, Any]:
+        return {
+            "stages": [
+                {
+                    "name": name,
+                    "seconds": duration,
+                    "peak_bytes": self.peaks.get(name),
+                }
+                for name, duration in self.durations.items()
+            ],
+            "total_seconds": self.total,
+        }
+
+    def print_outputs(self) -> None:
+        """Print durations, and memory peaks if traced, as step outputs."""
+        print("::set-output name=timings::" + json_dumps(self.to_dict()))
+        if self.peaks:
+            print("::set-output name=memory-peaks::" + json_dumps(self.peaks))
+
+    def write_trace(self, path: Path) -> None:
+        with open(path, "w") as file_handler:
+            json_dump(self.to_trace(), file_handler, indent=2)
+        logger.info(
+            "Wrote trace of %i stages to %s.", len(self.durations), path
+        )
+
+
+def run_profiled(
+    path: Path, function: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Run function under cProfile and dump the statistics, readable with
+    pstats or snakeviz.
+
+    Args:
+        path (Path): statistics file
+        function (Callable[..., Any]): profiled function
+        *args (Any): positional arguments of function
+        **kwargs (Any): keyword arguments of function
+
+    Returns:
+        Any: return value of function
+    """
+    from cProfile import Profile
+    profiler = Profile()
+    try:
+        return profiler.runcall(function, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
+        logger.info("Wrote profile to %s.", path)
@@ -0,0 +1,187 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+asynchronous http transports for the github api
+"""
+from abc import ABC, abstractmethod
+from asyncio import LifoQueue, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from json import dumps as json_dumps, loads as json_loads
+from logging import getLogger
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = getLogger(__file__)
+GITHUB_API_URL = "https://api.github.com"
+
+
+class GithubAPIError(Exception):
+    """Github API answered with an unexpected status.
+    """
+
+    def __init__(self, status: int, data: Any) -> None:
+        super().__init__(f"Github API responded with {status}: {data}")
+        self.status = status
+        self.data = data
+
+
+@dataclass
+class Response:
+    """Decoded http response.
+
+    Args:
+        status (int): http status code
+        headers (Dict[str, str]): response headers with lower case names
+        data (Any): decoded json body, None for empty bodies
+    """
+    status: int
+    headers: Dict[str, str] = field(repr=False)
+    data: Any = field(repr=False)
+
+
+class Transport(ABC):
+    """Asynchronous transport sending json requests to the github api.
+    """
+
+    @abstractmethod
+    async def request(
+        self, method: str, path: str, payload: Optional[Any] = None
+    ) -> Response:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "Transport":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+
+class PooledHTTPTransport(Transport):
+    """Transport keeping a pool of keep-alive connections.
+    Every request borrows an idle connection, so concurrent requests use
+    separate connections and sequential requests reuse warm ones instead of
+    paying for a new TCP and TLS handshake. The blocking http.client calls
+    run in a thread pool of the same size as the connection pool.
+
+    Args:
+        token (Optional[str]): github token sent as bearer authorization
+        base_url (str, optional): api url. Defaults to GITHUB_API_URL.
+        pool_size (int, optional): maximum number of open connections.
+            Defaults to 4.
+        timeout (float, optional): socket timeout in seconds.
+            Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str],
+        base_url: str = GITHUB_API_URL,
+        pool_size: int = 4,
+        timeout: float = 30
+    ) -> None:
+        url = urlsplit(base_url)
+        self.connection_class = HTTPSConnection \
+            if url.scheme == "https" else HTTPConnection
+        self.netloc = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.headers = {
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+            "User-Agent": "dgc-ci-action",
+            "Connection": "keep-alive",
+        }
+        if token is not None:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.pool_size = pool_size
+        self.connections: Optional[LifoQueue] = None
+        self.executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="transport"
+        )
+
+    def create_pool(self) -> LifoQueue:
+        # connections are opened lazily, the queue only limits their number
+        connections = LifoQueue(maxsize=self.pool_size)
+        for _ in range(self.pool_size):
+            connections.put_nowait(None)
+        return connections
+
+    async def request(
+        self, method: str, path: str, payload: Optional[Any] = None
+    ) -> Response:
+        if self.connections is None:
+            self.connections = self.create_pool()
+        body = None if payload is None else json_dumps(payload).encode()
+        connection = await self.connections.get()
+        try:
+            connection, response = await get_running_loop().run_in_executor(
+                self.executor, self.send, connection, method,
+                self.prefix + path, body
+            )
+        except BaseException:
+            if connection is not None:
+                connection.close()
+            self.connections.put_nowait(None)
+            raise
+        self.connections.put_nowait(connection)
+        return response
+
+    def send(
+        self,
+        connection: Optional[HTTPConnection],
+        method: str,
+        path: str,
+        body: Optional[bytes]
+    ) -> Tuple[Optional[HTTPConnection], Response]:
+        """Send request on a pooled connection. A reused connection that was
+        closed by the server while idle is replaced once.
+        """
+        while True:
+            reused = connection is not None
+            if connection is None:
+                connection = self.connection_class(
+                    self.netloc, timeout=self.timeout
+                )
+            try:
+                connection.request(method, path, body, self.headers)
+                raw_response = connection.getresponse()
+                raw_body = raw_response.read()
+                break
+            except (HTTPException, ConnectionError):
+                connection.close()
+                connection = None
+                if not reused:
+                    raise
+                logger.debug("Reconnecting to %s.", self.netloc)
+
+        if raw_response.will_close:
+            connection.close()
+            connection = None
+        return connection, Response(
+            status=raw_response.status,
+            headers={
+                key.lower(): value
+                for key, value in raw_response.getheaders()
+            },
+            data=json_loads(raw_body) if raw_body else None
+        )
+
+    async def close(self) -> None:
+        while self.connections is not None \
+                and not self.connections.empty():
+            connection = self.connections.get_nowait()
+            if connection is not None:
+                connection.close()
+        self.connections = None
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,187 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+synthetic reports for benchmarks
+"""
+from json import dump, dumps
+from random import Random
+from typing import Iterator, List, TextIO
+
+JEST_ROOTDIR = "/home/runner/work/project"
+SUITE_SIZE = 50
+
+
+def jest_failure(random: Random, suite: int) -> str:
+    frames = [
+        "    at Object.&lt;anonymous&gt; "
+        f"({JEST_ROOTDIR}/apps/app{suite % 20}/"
+        f"test/suite{suite}.spec.ts:{random.randint(1, 400)}:"
+        f"{random.randint(1, 40)})"
+    ] + [
+        f"    at fn{depth} ({JEST_ROOTDIR}/node_modules/jest-circus/build/"
+        f"index.js:{random.randint(1, 2000)}:{random.randint(1, 40)})"
+        for depth in range(random.randint(5, 25))
+    ]
+    return "Error: expect(received).toEqual(expected)\n" \
+        f"Expected: {random.randint(0, 1000)}\n" + "\n".join(frames)
+
+
+def pytest_failure(random: Random, module: int) -> str:
+    line = random.randint(1, 400)
+    return "def test_something():\n" \
+        "&gt;       assert compute() == 42\n" \
+        f"E       assert {random.randint(0, 1000)} == 42\n\n" \
+        f"tests/test_module{module}.py:{line}: AssertionError"
+
+
+def iter_suites(ntests: int) -> Iterator[List[int]]:
+    for start in range(0, ntests, SUITE_SIZE):
+        yield list(range(start, min(start + SUITE_SIZE, ntests)))
+
+
+def write_jest_junit(
+    file_handler: TextIO, ntests: int, failure_rate: float = 0.05,
+    seed: int = 0
+) -> None:
+    """Write jest-junit flavoured report.
+
+    Args:
+        file_handler (TextIO): output file
+        ntests (int): number of testcases
+        failure_rate (float, optional): share of failing testcases.
+            Defaults to 0.05.
+        seed (int, optional): random seed. Defaults to 0.
+    """
+    random = Random(seed)
+    failing = {
+        index for index in range(ntests) if random.random() < failure_rate
+    }
+    file_handler.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<testsuites name="jest tests" tests="{ntests}" '
+        f'failures="{len(failing)}" errors="0" time="{ntests / 100}">\n'
+    )
+    for suite, indices in enumerate(iter_suites(ntests)):
+        nfailures = len(failing.intersection(indices))
+        file_handler.write(
+            f'  <testsuite name="Suite {suite}" errors="0" '
+            f'failures="{nfailures}" skipped="0" '
+            f'timestamp="2021-12-13T16:20:15" time="{len(indices) / 100}" '
+            f'tests="{len(indices)}">\n'
+        )
+        for index in indices:
+            name = f"Suite {suite} test {index}"
+            file_handler.write(
+                f'    <testcase classname="{name}" name="{name}" '
+                f'time="{random.random():.3f}"'
+            )
+            if index in failing:
+                file_handler.write(
+                    f">\n      <failure>{jest_failure(random, suite)}"
+                    "</failure>\n    </testcase>\n"
+                )
+            else:
+                file_handler.write("/>\n")
+        file_handler.write("  </testsuite>\n")
+    file_handler.write("</testsuites>\n")
+
+
+def write_pytest_junit(
+    file_handler: TextIO, ntests: int, failure_rate: float = 0.05,
+    seed: int = 0
+) -> None:
+    """Write pytest flavoured report.
+
+    Args:
+        file_handler (TextIO): output file
+        ntests (int): number of testcases
+        failure_rate (float, optional): share of failing testcases.
+            Defaults to 0.05.
+        seed (int, optional): random seed. Defaults to 0.
+    """
+    random = Random(seed)
+    failing = {
+        index for index in range(ntests) if random.random() < failure_rate
+    }
+    file_handler.write(
+        '<?xml version="1.0" encoding="utf-8"?><testsuites>'
+        f'<testsuite name="pytest" errors="0" failures="{len(failing)}" '
+        f'skipped="0" tests="{ntests}" time="{ntests / 100}" '
+        'timestamp="2021-12-14T14:55:13.512061" hostname="runner">'
+    )
+    for index in range(ntests):
+        module = index // SUITE_SIZE
+        file_handler.write(
+            f'<testcase classname="tests.test_module{module}" '
+            f'name="test_{index}" time="{random.random():.3f}"'
+        )
+        if index in failing:
+            file_handler.write(
+                '><failure message="AssertionError: assert 1 == 42">'
+                f"{pytest_failure(random, module)}</failure></testcase>"
+            )
+        else:
+            file_handler.write(" />")
+    file_handler.write("</testsuite></testsuites>")
+
+
+def write_python_coverage(
+    file_handler: TextIO, nfiles: int, seed: int = 0
+) -> None:
+    """Write coverage.py json report file by file, so huge reports do not
+    have to fit into memory.
+
+    Args:
+        file_handler (TextIO): output file
+        nfiles (int): number of measured files
+        seed (int, optional): random seed. Defaults to 0.
+    """
+    random = Random(seed)
+    covered = statements = 0
+    file_handler.write(
+        '{"meta": {"version": "6.2", '
+        '"timestamp": "2021-12-02T16:50:23.062891", '
+        '"branch_coverage": false, "show_contexts": false}, "files": {'
+    )
+    for index in range(nfiles):
+        lines = list(range(1, random.randint(10, 120)))
+        missing = sorted(random.sample(lines, len(lines) // 10))
+        missing_set = set(missing)
+        executed = [line for line in lines if line not in missing_set]
+        covered += len(executed)
+        statements += len(lines)
+        file_handler.write(", " if index else "")
+        filename = f"src/package{index // 100}/module{index}.py"
+        file_handler.write(dumps(filename))
+        file_handler.write(": ")
+        dump({
+            "executed_lines": executed,
+            "summary": {
+                "covered_lines": len(executed),
+                "num_statements": len(lines),
+                "percent_covered": len(executed) * 100 / len(lines),
+                "percent_covered_display": str(
+                    len(executed) * 100 // len(lines)
+                ),
+                "missing_lines": len(missing),
+                "excluded_lines": 0,
+            },
+            "missing_lines": missing,
+            "excluded_lines": [],
+        }, file_handler)
+    file_handler.write('}, "totals": ')
+    dump({
+        "covered_lines": covered,
+        "num_statements": statements,
+        "percent_covered": covered * 100 / max(statements, 1),
+        "percent_covered_display": str(covered * 100 // max(statements, 1)),
+        "missing_lines": statements - covered,
+        "excluded_lines": 0,
+    }, file_handler)
+    file_handler.write("}")
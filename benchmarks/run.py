@@ -0,0 +1,239 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+benchmark runner
+"""
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from json import dump, load
+from multiprocessing import get_context
+from pathlib import Path
+from platform import python_version
+from resource import RUSAGE_SELF, getrusage
+from subprocess import CalledProcessError, check_output
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .generate import (
+    JEST_ROOTDIR, write_jest_junit, write_pytest_junit, write_python_coverage
+)
+
+FIXTURES = {
+    "jest": ("junit-jest.xml", write_jest_junit),
+    "pytest": ("junit-pytest.xml", write_pytest_junit),
+    "coverage": ("coverage.json", write_python_coverage),
+}
+
+
+def parse_junit(
+    flavour: str, stream: bool
+) -> Callable[[Path], Callable[[], Any]]:
+    def setup(path: Path) -> Callable[[], Any]:
+        from action import reports
+
+        reports.ROOTDIR = Path(JEST_ROOTDIR)
+        junit_class = reports.JESTJunitXML if flavour == "jest" \
+            else reports.PytestJunitXML
+
+        def run() -> None:
+            with path.open() as file_handler:
+                junit_class.from_file(file_handler, stream=stream)
+        return run
+    return setup
+
+
+def build_annotations(
+    flavour: str, group: bool
+) -> Callable[[Path], Callable[[], Any]]:
+    def setup(path: Path) -> Callable[[], Any]:
+        from action import reports
+
+        reports.ROOTDIR = Path(JEST_ROOTDIR)
+        junit_class = reports.JESTJunitXML if flavour == "jest" \
+            else reports.PytestJunitXML
+        with path.open() as file_handler:
+            junit = junit_class.from_file(file_handler, stream=True)
+        return lambda: junit.create_check_run_output(group=group)
+    return setup
+
+
+def parse_coverage(path: Path) -> Callable[[], Any]:
+    from action.coverage import PythonCoverageParser
+
+    def run() -> None:
+        with path.open() as file_handler:
+            PythonCoverageParser().parse(file_handler)
+    return run
+
+
+def render_badges(path: Path) -> Callable[[], Any]:
+    from action.badges import CoverageBadge
+    from action.colors import ShieldIO6Color
+
+    color = ShieldIO6Color("100,90,80,70,60")
+
+    def run() -> None:
+        for relative_coverage in range(101):
+            CoverageBadge(relative_coverage, color).dumps()
+    return run
+
+
+# name: (fixture, setup), a fixture of None runs once independent of size
+BENCHMARKS: Dict[str, Tuple[Optional[str], Callable]] = {
+    "jest.from_file": ("jest", parse_junit("jest", False)),
+    "jest.from_file.stream": ("jest", parse_junit("jest", True)),
+    "jest.create_check_run_output": ("jest", build_annotations("jest", False)),
+    "jest.create_check_run_output.group": (
+        "jest", build_annotations("jest", True)
+    ),
+    "pytest.from_file": ("pytest", parse_junit("pytest", False)),
+    "pytest.from_file.stream": ("pytest", parse_junit("pytest", True)),
+    "pytest.create_check_run_output": (
+        "pytest", build_annotations("pytest", False)
+    ),
+    "coverage.parse": ("coverage", parse_coverage),
+    "badges.render": (None, render_badges),
+}
+
+
+def measure(name: str, path: Optional[Path]) -> Tuple[float, int]:
+    """Run a benchmark, meant to be called in a fresh process so peak memory
+    is not shared between benchmarks.
+
+    Args:
+        name (str): name of the benchmark
+        path (Optional[Path]): fixture file
+
+    Returns:
+        Tuple[float, int]: seconds and peak resident set size in KiB
+    """
+    run = BENCHMARKS[name][1](path)
+    start = perf_counter()
+    run()
+    seconds = perf_counter() - start
+    return seconds, getrusage(RUSAGE_SELF).ru_maxrss
+
+
+def generate(directory: Path, fixture: str, size: int) -> Path:
+    filename, write = FIXTURES[fixture]
+    path = directory / f"{size}-{filename}"
+    if not path.exists():
+        with path.open("w") as file_handler:
+            write(file_handler, size)
+    return path
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return check_output(
+            ["git", "rev-parse", "HEAD"], text=True
+        ).strip()
+    except (CalledProcessError, FileNotFoundError):
+        return None
+
+
+def run_benchmarks(
+    sizes: List[int], names: List[str], repeat: int = 1
+) -> List[Dict[str, Any]]:
+    """Run benchmarks for every size, each in its own process.
+
+    Args:
+        sizes (List[int]): number of testcases or files of the fixtures
+        names (List[str]): benchmarks to run
+        repeat (int, optional): runs per benchmark, the fastest is kept.
+            Defaults to 1.
+
+    Returns:
+        List[Dict[str, Any]]: results
+    """
+    results = []
+    context = get_context("spawn")
+    with TemporaryDirectory() as directory:
+        for name in names:
+            fixture = BENCHMARKS[name][0]
+            for size in sizes if fixture is not None else [None]:
+                path = None if fixture is None \
+                    else generate(Path(directory), fixture, size)
+                runs = []
+                for _ in range(repeat):
+                    with ProcessPoolExecutor(1, mp_context=context) as pool:
+                        runs.append(pool.submit(measure, name, path).result())
+                seconds, peak_rss = min(runs)
+                results.append({
+                    "name": name,
+                    "size": size,
+                    "seconds": round(seconds, 6),
+                    "peak_rss_kb": peak_rss,
+                })
+                print(
+                    f"{name:<40} {size or '-':>8} {seconds:>10.4f}s "
+                    f"{peak_rss / 1024:>8.1f}MiB",
+                    flush=True
+                )
+    return results
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]
+) -> None:
+    previous = {
+        (result["name"], result["size"]): result for result in baseline
+    }
+    print(f"{'benchmark':<40} {'size':>8} {'time':>8} {'memory':>8}")
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if before is None:
+            continue
+        print(
+            f"{result['name']:<40} {result['size'] or '-':>8} "
+            f"{result['seconds'] / max(before['seconds'], 1e-9):>7.2f}x "
+            f"{result['peak_rss_kb'] / before['peak_rss_kb']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Benchmark parsers, annotation building and badge "
+        "rendering on synthetic reports."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+        help="Number of testcases and measured files of the generated "
+        "reports, e.g. 1000 10000 100000 1000000."
+    )
+    parser.add_argument(
+        "--benchmarks", nargs="+", default=list(BENCHMARKS),
+        choices=list(BENCHMARKS), help="Benchmarks to run."
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1,
+        help="Runs per benchmark, the fastest one is reported."
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Write results to json file."
+    )
+    parser.add_argument(
+        "--compare", type=Path,
+        help="Compare against results of a previous run."
+    )
+    args = parser.parse_args()
+    results = run_benchmarks(args.sizes, args.benchmarks, args.repeat)
+    if args.output is not None:
+        with args.output.open("w") as file_handler:
+            dump({
+                "commit": get_commit(),
+                "python": python_version(),
+                "timestamp": datetime.now().isoformat(),
+                "results": results,
+            }, file_handler, indent=2)
+    if args.compare is not None:
+        with args.compare.open() as file_handler:
+            compare(results, load(file_handler)["results"])
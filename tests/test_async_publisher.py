@@ -0,0 +1,151 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test asynchronous publisher against a local http server
+"""
+from asyncio import run
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from pathlib import Path
+from threading import Thread
+from time import sleep
+
+from pytest import fixture, raises
+
+from action.async_publisher import AsyncPublisher
+from action.reports import JESTJunitXML
+from action.transport import GithubAPIError, PooledHTTPTransport
+import action.reports
+
+
+class GithubStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+    rate_limited = []
+    # PATCH requests being handled at the same time
+    updating = []
+    overlapping = []
+
+    def do_POST(self):
+        self.handle_request()
+
+    def do_PATCH(self):
+        self.updating.append(True)
+        if len(self.updating) > 1:
+            self.overlapping.append(True)
+        sleep(0.05)
+        self.handle_request()
+        self.updating.pop()
+
+    def handle_request(self):
+        body = loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(
+            (self.command, self.path, body, self.client_address[1])
+        )
+        if self.path.endswith("/comments") and not self.rate_limited:
+            self.rate_limited.append(True)
+            self.respond(403, {"message": "slow down"}, {"Retry-After": "0"})
+        elif self.path.startswith("/repos/org/missing"):
+            self.respond(404, {"message": "Not Found"})
+        else:
+            self.respond(201, {"id": 7})
+
+    def respond(self, status, data, headers={}):
+        raw = dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.send_header("X-RateLimit-Remaining", "100")
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *_):
+        pass
+
+
+@fixture
+def server():
+    GithubStandIn.requests = []
+    GithubStandIn.rate_limited = []
+    GithubStandIn.updating = []
+    GithubStandIn.overlapping = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), GithubStandIn)
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def create_check_run():
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/stolen-api-services/"
+    )
+    with open("data/test/junit-jest.xml") as file_handler:
+        junit = JESTJunitXML.from_file(file_handler, stream=True)
+    return junit.create_check_run("abc")
+
+
+def test_publish(server):
+    check_run = create_check_run()
+    waits = []
+
+    async def wait(delay):
+        waits.append(delay)
+
+    async def publish():
+        async with PooledHTTPTransport("token", server, 2) as transport:
+            publisher = AsyncPublisher(transport, "org/repo", wait=wait)
+            return await publisher.publish([check_run], 3, "coverage")
+
+    assert run(publish()) == [{"id": 7}, {"id": 7}]
+    requests = GithubStandIn.requests
+    assert waits == [0.0]
+    comments = [
+        body for _, path, body, _ in requests
+        if path == "/repos/org/repo/issues/3/comments"
+    ]
+    assert comments == [{"body": "coverage"}] * 2
+    created = [
+        body for method, path, body, _ in requests
+        if method == "POST" and path == "/repos/org/repo/check-runs"
+    ]
+    assert len(created) == 1
+    assert created[0]["head_sha"] == "abc"
+    updates = [
+        body["output"] for method, path, body, _ in requests
+        if method == "PATCH" and path == "/repos/org/repo/check-runs/7"
+    ]
+    assert len(updates) == 12
+    assert all(
+        update["summary"] == check_run.output["summary"]
+        for update in updates
+    )
+    annotations = created[0]["output"]["annotations"] + [
+        annotation for update in updates
+        for annotation in update["annotations"]
+    ]
+    # batches of one check run are sent one by one and in order
+    assert annotations == check_run.output["annotations"]
+    assert GithubStandIn.overlapping == []
+    # keep-alive: all requests share the two pooled connections
+    assert len({port for _, _, _, port in requests}) <= 2
+
+
+def test_api_error(server):
+    async def publish():
+        async with PooledHTTPTransport(None, server) as transport:
+            await AsyncPublisher(transport, "org/missing").publish(
+                [create_check_run()]
+            )
+
+    with raises(GithubAPIError) as error:
+        run(publish())
+    assert error.value.status == 404
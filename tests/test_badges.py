@@ -9,7 +9,12 @@ Copyright (c) 2021 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
 
 test badge classes
 """
-from action import CoverageBadge
+from pytest import raises
+
+from action import CoverageBadge, ShieldIO6Color
+from action.badges import (
+    NEUTRAL_COLOR, get_text_width, render_badges, write_badges
+)
 
 
 def test_constructor():
@@ -27,3 +32,53 @@ def test_constructor():
 class ColorMock():
     def get_color(self, _: int):
         return ("adskl", "lkdgnlk")
+
+
+def test_content_hash():
+    color = ShieldIO6Color("90,80,70,60,50")
+    badge = CoverageBadge(83, color)
+    table = CoverageBadge.get_table(color)
+    assert len(table) == 101
+    assert table[83] is badge.svg
+    assert CoverageBadge.get_table(ShieldIO6Color("90,80,70,60,50")) \
+        is table
+    assert badge.svg == CoverageBadge.template.format(
+        relative_coverage=83, color="#97ca00"
+    )
+    assert badge.content_hash == CoverageBadge(83, color).content_hash
+    assert badge.content_hash != CoverageBadge(84, color).content_hash
+    # other thresholds change the color of the badge
+    assert badge.content_hash != CoverageBadge(
+        83, ShieldIO6Color("95,90,85,80,50")
+    ).content_hash
+    assert len(badge.content_hash) == 64
+
+
+def test_text_width():
+    assert get_text_width("") == 0
+    # matches the fixed width of the coverage badge
+    assert get_text_width("coverage") == 51
+    assert get_text_width("iii") < get_text_width("WWW")
+
+
+def test_badge_set(tmp_path):
+    badges = render_badges(
+        {"statements": 83, "tests": 1234, "pass-rate": 45},
+        ShieldIO6Color("90,80,70,60,50"), {"tests": "unit <tests>"}
+    )
+    assert list(badges) == ["statements", "tests", "pass-rate"]
+    assert badges["statements"].color_code == "#97ca00"
+    assert badges["tests"].color_code == NEUTRAL_COLOR
+    assert badges["pass-rate"].color_code == "#e05d44"
+    assert 'aria-label="coverage: 83%"' in badges["statements"].svg
+    assert "unit &lt;tests&gt;: 1234" in badges["tests"].svg
+    # the longer label widens the badge
+    assert 'width="114"' in badges["tests"].svg
+    paths = write_badges(badges, tmp_path / "badges")
+    assert [path.name for path in paths] == \
+        ["statements.svg", "tests.svg", "pass-rate.svg"]
+    assert paths[1].read_text() == badges["tests"].svg
+    assert paths[1].with_suffix(".sha256").read_text().strip() == \
+        badges["tests"].content_hash
+    with raises(ValueError):
+        render_badges({"mutants": 3}, ShieldIO6Color("90,80,70,60,50"))
@@ -0,0 +1,122 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test merging of coverage reports
+"""
+from copy import deepcopy
+from json import dump, load
+
+import pytest
+
+from action.coverage import (
+    JestCoverageJsonSummaryParser, PythonCoverageParser
+)
+from action.coverage_merge import FileLines, merge_jest_reports, read_coverage
+from action.line_sets import count, from_bitset, to_bitset
+
+
+def test_line_sets():
+    lines = [1, 7, 8, 9, 64, 1000]
+    bits = to_bitset(lines)
+    assert from_bitset(bits) == lines
+    assert count(bits) == 6
+    assert to_bitset([]) == 0
+    assert from_bitset(bits & to_bitset([7, 9, 10])) == [7, 9]
+
+
+def test_file_lines():
+    summary = {
+        "covered_lines": 2, "num_statements": 4, "missing_lines": 2,
+        "excluded_lines": 0, "num_branches": 2, "num_partial_branches": 1,
+        "covered_branches": 1, "missing_branches": 1,
+    }
+    first = FileLines.from_report({
+        "executed_lines": [1, 2], "missing_lines": [3, 4],
+        "summary": summary,
+        "executed_branches": [[2, 3]], "missing_branches": [[2, 4]],
+    })
+    second = FileLines.from_report({
+        "executed_lines": [1, 2, 4], "missing_lines": [3],
+        "summary": dict(summary, covered_lines=3, missing_lines=1),
+        "executed_branches": [[2, 4]], "missing_branches": [[2, 3]],
+    })
+    report = first.merge(second).to_report()
+    assert report["executed_lines"] == [1, 2, 4]
+    assert report["missing_lines"] == [3]
+    assert report["missing_branches"] == []
+    assert report["summary"]["covered_lines"] == 3
+    assert report["summary"]["covered_branches"] == 2
+    assert report["summary"]["num_partial_branches"] == 0
+    assert report["summary"]["percent_covered"] == 500 / 6
+
+
+def test_python_shards(tmp_path):
+    with open("data/test/python-coverage.json") as file_handler:
+        report = load(file_handler)
+    # every job misses a different line of the first incomplete file
+    filename, data = next(
+        (filename, data) for filename, data in report["files"].items()
+        if len(data["missing_lines"]) > 1
+    )
+    paths = []
+    for index, line in enumerate(data["missing_lines"][:2]):
+        shard = deepcopy(report)
+        shard["files"][filename]["missing_lines"] = [line]
+        path = tmp_path / f"coverage-{index}.json"
+        with open(path, "w") as file_handler:
+            dump(shard, file_handler)
+        paths.append(str(path))
+    coverage = read_coverage(PythonCoverageParser, paths, processes=2)
+    assert coverage.files[filename]["missing_lines"] == []
+    assert coverage.files[filename]["summary"]["covered_lines"] == \
+        data["summary"]["num_statements"]
+    total = coverage.total
+    assert total["num_statements"] == report["totals"]["num_statements"]
+    assert total["covered_lines"] == report["totals"]["covered_lines"] + \
+        data["summary"]["missing_lines"]
+    assert total["covered_branches"] == report["totals"]["covered_branches"]
+    assert total["percent_covered"] == pytest.approx(
+        100 * (total["covered_lines"] + total["covered_branches"])
+        / (total["num_statements"] + total["num_branches"])
+    )
+    # a single report is parsed as is
+    single = read_coverage(PythonCoverageParser, paths[:1])
+    assert single.total == report["totals"]
+    with pytest.raises(ValueError):
+        read_coverage(PythonCoverageParser, [])
+
+
+def make_jest_report(covered):
+    coverage = JestCoverageJsonSummaryParser()
+    coverage.files = {
+        path: {
+            metric: {
+                "total": 10, "covered": number, "skipped": 0,
+                "pct": number * 10
+            }
+            for metric in ("lines", "statements", "functions", "branches")
+        }
+        for path, number in covered.items()
+    }
+    return coverage
+
+
+def test_jest_reports():
+    merged = merge_jest_reports([
+        make_jest_report({"a.ts": 3, "b.ts": 10}),
+        make_jest_report({"a.ts": 5, "c.ts": 0}),
+    ])
+    assert merged.files["a.ts"]["lines"]["covered"] == 5
+    assert list(merged.files) == ["a.ts", "b.ts", "c.ts"]
+    assert merged.total["statements"] == {
+        "total": 30, "covered": 15, "skipped": 0, "pct": 50
+    }
+    assert merged.get_relative_coverage("branches") == 50
+    assert merge_jest_reports([make_jest_report({})]) \
+        .total["lines"]["pct"] == 100
@@ -0,0 +1,95 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test diff coverage
+"""
+from io import StringIO
+
+from action.coverage import JestCoverageJsonSummaryParser, PythonCoverageParser
+from action.diff_coverage import ChangedLines, DiffCoverage, merge_lines
+
+DIFF = """diff --git a/test_action/parsers.py b/test_action/parsers.py
+index 1111111..2222222 100644
+--- a/test_action/parsers.py
++++ b/test_action/parsers.py
+@@ -22,0 +23,4 @@ class Parser(ABC):
++    a
++    b
++++ not a file header
++    d
+@@ -70,2 +74,6 @@ def parse(self):
+ context
+-removed
++    e
++    f
++    g
++    h
+ context
+diff --git a/README.md b/README.md
+--- a/README.md
++++ b/README.md
+@@ -1 +1 @@
+-old
++new
+diff --git a/gone.py b/gone.py
+--- a/gone.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+-x
+-y
+"""
+
+
+def test_merge_lines():
+    assert merge_lines([]) == []
+    assert merge_lines([1, 2, 3, 5, 7, 8]) == [(1, 3), (5, 5), (7, 8)]
+
+
+def test_changed_lines():
+    changed = ChangedLines.from_diff(StringIO(DIFF))
+    assert changed.intervals == {
+        "test_action/parsers.py": [(23, 26), (75, 78)],
+        "README.md": [(1, 1)],
+    }
+    assert ("test_action/parsers.py", 25) in changed
+    assert ("test_action/parsers.py", 74) not in changed
+    assert ("test_action/parsers.py", 80) not in changed
+    assert ("gone.py", 1) not in changed
+
+
+def test_diff_coverage():
+    changed = ChangedLines.from_diff(StringIO(DIFF))
+    coverage = PythonCoverageParser()
+    with open("data/test/python-coverage.json") as fh:
+        coverage.parse(fh)
+    diff_coverage = DiffCoverage.compute(changed, coverage)
+    # executed: 23, 24 -- missing: 25, 74, 75, 76, 77, 78
+    assert diff_coverage.covered == 2
+    assert diff_coverage.total == 7
+    assert diff_coverage.get_relative_coverage() == 28
+    assert diff_coverage.uncovered == {
+        "test_action/parsers.py": [(25, 25), (75, 78)]
+    }
+    check_run = diff_coverage.create_check_run("abc")
+    assert check_run.conclusion == "neutral"
+    annotations = check_run.output["annotations"]
+    assert [
+        (annotation["start_line"], annotation["end_line"])
+        for annotation in annotations
+    ] == [(25, 25), (75, 78)]
+    assert annotations[1]["message"] == \
+        "Lines 75-78 are not covered by tests."
+
+    # summary reports carry no line data
+    jest_coverage = JestCoverageJsonSummaryParser()
+    with open("data/test/jest-coverage-summary.json") as fh:
+        jest_coverage.parse(fh)
+    diff_coverage = DiffCoverage.compute(changed, jest_coverage)
+    assert diff_coverage.total == 0
+    assert diff_coverage.get_relative_coverage() == 100
@@ -0,0 +1,100 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test duration analysis
+"""
+from copy import deepcopy
+from pathlib import Path
+from types import SimpleNamespace
+
+from action.durations import DurationAnalysis, DurationBaseline
+from action.history import History
+from action.reports import PytestJunitXML
+from action.results import ResultStore
+import action.reports
+
+
+def make_store(durations):
+    store = ResultStore()
+    for name, duration in durations.items():
+        store.append("tests.test_durations", name, duration)
+    return store
+
+
+def test_slowest():
+    store = make_store({"a": 0.5, "b": float("nan"), "c": 2.0, "d": 1.0})
+    analysis = DurationAnalysis.analyze(store, top=2)
+    assert [record.name for record in analysis.slowest] == ["c", "d"]
+    assert analysis.total == 3.5
+    assert analysis.regressions == []
+    table = analysis.render_table()
+    assert "All tests took 3.500s." in table
+    assert "| c | 2.000s | - |" in table
+    assert "Slower than" not in table
+
+
+def test_baseline_report():
+    baseline = DurationBaseline.from_store(
+        make_store({"a": 0.2, "b": 1.0, "c": 1.0, "d": 0.1}), "junit.xml"
+    )
+    store = make_store({"a": 1.0, "b": 1.2, "c": 1.9, "d": 0.5})
+    analysis = DurationAnalysis.analyze(store, baseline)
+    # b is not slower by factor 1.5, d not by 0.5s
+    assert [regression.record.name for regression in analysis.regressions] \
+        == ["c", "a"]
+    assert analysis.regressions[1].ratio == 5
+    assert analysis.regressions[1].zscore is None
+    assert analysis.describe(analysis.regressions[1]) == \
+        "a took 1.000s, 5.0x the 0.200s of the junit.xml."
+    assert "| a | 1.000s | 0.200s | +0.800s |" in analysis.render_table()
+
+
+def test_baseline_history():
+    with History(":memory:") as history:
+        for steady, noisy in [(1.0, 0.5), (1.2, 1.5), (0.8, 0.5), (1.0, 1.5)]:
+            store = make_store({"steady": steady, "noisy": noisy})
+            history.record("a" * 40, "main", junit=SimpleNamespace(
+                store=store, ntests=2, nfailures=0, nerrors=0, nskipped=0,
+                time=steady + noisy
+            ))
+        baseline = DurationBaseline.from_history(history, branch="main")
+    assert baseline.source == "last 20 runs of main"
+    analysis = DurationAnalysis.analyze(
+        make_store({"steady": 1.7, "noisy": 2.0}), baseline
+    )
+    # noisy is twice as slow, but only two standard deviations off
+    assert len(analysis.regressions) == 1
+    regression = analysis.regressions[0]
+    assert regression.record.name == "steady"
+    assert round(regression.zscore, 3) == round(0.7 / 0.02 ** 0.5, 3)
+
+
+def test_notices():
+    action.reports.ROOTDIR = Path.cwd()
+    with open("data/test/junit-pytest.xml") as file_handler:
+        junit = PytestJunitXML.from_file(file_handler)
+    previous = deepcopy(junit.store)
+    for index in range(len(previous)):
+        previous.durations[index] /= 4
+    analysis = DurationAnalysis.analyze(
+        junit.store, DurationBaseline.from_store(previous), min_increase=0
+    )
+    assert len(analysis.regressions) == 11
+    output = junit.create_check_run_output(durations=analysis)
+    assert output.text == analysis.render_table()
+    notices = [
+        annotation for annotation in output.annotations
+        if annotation["annotation_level"] == "notice"
+    ]
+    assert len(notices) == 11
+    assert {notice["path"] for notice in notices} == {
+        "tests/test_badges.py", "tests/test_colors.py",
+        "tests/test_parsers.py", "tests/test_reports.py"
+    }
+    assert len(output.annotations) == 12
@@ -0,0 +1,130 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test flaky test detection
+"""
+from pathlib import Path
+from types import SimpleNamespace
+
+from action.flaky import FlakyAnalysis, FlakyTest, get_flip_rate
+from action.history import History
+from action.reports import JESTJunitXML, PytestJunitXML
+from action.results import ResultStore
+import action.reports
+
+
+def make_store(results):
+    store = ResultStore()
+    for name, status in results:
+        store.append(
+            "tests.test_flaky", name, 0.1, status, "tests/test_flaky.py", 1,
+            None if status == "passed" else "assert False"
+        )
+    return store
+
+
+def test_flip_rate():
+    assert get_flip_rate([]) == 0
+    assert get_flip_rate(["failure"]) == 0
+    assert get_flip_rate(["passed", "failure", "skipped", "passed"]) == 1
+    assert get_flip_rate(["passed", "passed", "error", "error", "passed"]) \
+        == 0.5
+
+
+def test_retries():
+    store = make_store([
+        ("a", "failure"), ("a", "passed"), ("b", "failure"), ("b", "error"),
+        ("c", "passed"), ("d", "skipped"), ("c", "failure"),
+    ])
+    analysis = FlakyAnalysis.analyze(store)
+    # the second c is a different test sharing the name
+    assert [record.name for record in analysis.failures] == ["b", "c"]
+    assert analysis.failures[0].status == "error"
+    assert len(analysis.flaky) == 1
+    assert analysis.flaky[0].record.name == "a"
+    assert analysis.flaky[0].reason == "passed 1 of 2 attempts"
+    assert analysis.get_conclusion() == "failure"
+
+
+def test_history():
+    with History(":memory:") as history:
+        for run in range(6):
+            history.record("a" * 40, "main", junit=SimpleNamespace(
+                store=make_store([
+                    ("flips", "passed" if run % 2 else "failure"),
+                    ("broken", "failure"),
+                    ("new", "passed"),
+                ]),
+                ntests=3, nfailures=2, nerrors=0, nskipped=0, time=0.3
+            ))
+        store = make_store([
+            ("flips", "failure"), ("broken", "failure"), ("new", "failure"),
+            ("other", "passed"),
+        ])
+        analysis = FlakyAnalysis.analyze(store, history)
+        assert [record.name for record in analysis.failures] \
+            == ["broken", "new"]
+        assert [test.record.name for test in analysis.flaky] == ["flips"]
+        assert analysis.flaky[0].flip_rate == 1
+        assert analysis.flaky[0].reason == \
+            "changed outcome in 100% of recent runs"
+        # too few stored runs
+        analysis = FlakyAnalysis.analyze(store, history, min_runs=7)
+        assert analysis.flaky == []
+        # failing every attempt of this run still fails the check run
+        analysis = FlakyAnalysis.analyze(
+            make_store([("flips", "failure")]), history
+        )
+        assert not analysis.flaky[0].confirmed
+        assert analysis.get_conclusion() == "failure"
+        # runs of other branches are not considered
+        analysis = FlakyAnalysis.analyze(store, history, branch="feature")
+        assert analysis.flaky == []
+
+
+def test_check_run():
+    action.reports.ROOTDIR = Path("/home/mmittelb/Projects/ci-action/")
+    with open("data/test/junit-pytest.xml") as file_handler:
+        junit = PytestJunitXML.from_file(file_handler)
+    failed = next(junit.store.iter_status("failure"))
+    junit.store.append_result(failed._replace(
+        status="passed", message=None, details=None
+    ))
+    flaky = FlakyAnalysis.analyze(junit.store)
+    check_run = junit.create_check_run("a" * 40, flaky=flaky)
+    assert check_run.conclusion == "neutral"
+    assert check_run.output["summary"] == junit.get_summary() + \
+        " (1 flaky tests)"
+    annotations = check_run.output["annotations"]
+    assert len(annotations) == 1
+    assert annotations[0]["annotation_level"] == "notice"
+    assert annotations[0]["path"] == "tests/test_reports.py"
+    assert annotations[0]["message"].endswith(
+        "Flaky test, passed 1 of 2 attempts."
+    )
+
+    # flagged by its flip rate only, annotated as failure
+    annotation = junit.create_flaky_annotation(FlakyTest(failed, 1, 0, 0.5))
+    assert annotation.annotation_level == "warning"
+    assert annotation.message.endswith(
+        "Possibly flaky test, changed outcome in 50% of recent runs."
+    )
+
+
+def test_jest_failures():
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/stolen-api-services/"
+    )
+    with open("data/test/junit-jest.xml") as file_handler:
+        junit = JESTJunitXML.from_file(file_handler, stream=True)
+    flaky = FlakyAnalysis.analyze(junit.store)
+    output = junit.create_check_run_output(flaky=flaky)
+    # equally named tests of different suites are no retries
+    assert flaky.flaky == []
+    assert len(output.annotations) == len(flaky.failures) == 333
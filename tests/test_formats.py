@@ -0,0 +1,123 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test detection of JUnit XML producers
+"""
+from io import StringIO
+from pathlib import Path
+
+from pytest import mark
+
+from action.action_main import main
+from action.formats import detect_format, get_junit_class, sniff_format
+from action.payloads import Payloads
+from action.reports import GenericJUnitXML, JESTJunitXML, PytestJunitXML
+import action.reports
+
+SUREFIRE = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuite xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" \
+xsi:noNamespaceSchemaLocation="https://maven.apache.org/surefire/\
+maven-surefire-plugin/xsd/surefire-test-report-3.0.xsd" \
+name="com.example.AppTest" time="1.5" tests="3" errors="0" skipped="1" \
+failures="1">
+  <properties><property name="java.version" value="17"/></properties>
+  <testcase name="testSave" classname="com.example.AppTest" time="0.5">
+    <failure message="expected: 1 but was: 2" \
+type="org.opentest4j.AssertionFailedError">
+org.opentest4j.AssertionFailedError: expected: 1 but was: 2
+	at com.example.AppTest.testSave(reports.py:30)
+</failure>
+  </testcase>
+  <testcase name="testLoad" classname="com.example.AppTest" time="1.0"/>
+  <testcase name="testSkip" classname="com.example.AppTest" time="0">
+    <skipped/>
+  </testcase>
+</testsuite>
+"""
+GO_JUNIT_REPORT = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites tests="2" failures="1">
+	<testsuite name="example.com/app" tests="2" failures="1" errors="0" \
+id="0" hostname="runner" time="0.020" timestamp="2026-10-18T10:00:00Z">
+		<properties>
+			<property name="go.version" value="go1.21.0"></property>
+		</properties>
+		<testcase name="TestSave" classname="example.com/app" time="0.010">
+			<failure message="Failed"><![CDATA[    app_test.go:12: \
+expected 1]]></failure>
+		</testcase>
+		<testcase name="TestLoad" classname="example.com/app" time="0.010">\
+</testcase>
+	</testsuite>
+</testsuites>
+"""
+
+
+@mark.parametrize("head, name", [
+    (GO_JUNIT_REPORT, "go-junit-report"),
+    (SUREFIRE, "surefire"),
+    ('<testsuites name="Mocha Tests" time="0.1" tests="2">', "mocha"),
+    ('<testsuites name="nextest-run" tests="2" failures="0">',
+     "cargo-nextest"),
+    ('<testsuites><testsuite name="unknown">', "junit"),
+])
+def test_sniff(head, name):
+    assert sniff_format(head).name == name
+
+
+def test_detect(tmp_path):
+    path = tmp_path / "report.xml"
+    path.write_text(SUREFIRE)
+    assert detect_format(str(path)).junit_class is GenericJUnitXML
+    assert detect_format("data/test/junit-pytest.xml").name == "pytest"
+    assert get_junit_class("auto", ["data/test/junit-jest.xml"]) is \
+        JESTJunitXML
+    assert get_junit_class("pytest", [str(path)]) is PytestJunitXML
+
+
+@mark.parametrize("xml", [SUREFIRE, GO_JUNIT_REPORT])
+def test_generic(xml):
+    action.reports.ROOTDIR = Path.cwd()
+    junit = GenericJUnitXML.from_file(StringIO(xml))
+    stream = GenericJUnitXML.from_file(StringIO(xml), stream=True)
+    assert list(stream.store) == list(junit.store)
+    assert stream.get_summary() == junit.get_summary()
+    assert junit.nfailures == 1
+    annotations = junit.create_check_run_output().annotations
+    if xml is SUREFIRE:
+        assert junit.title == "com.example.AppTest"
+        assert junit.get_summary() == \
+            "3 tests in 1.5s: 1 failures, 0 errors, 1 skipped"
+        # file names of java stack traces map to the tracked file
+        assert annotations[0]["path"] == "action/reports.py"
+        assert annotations[0]["start_line"] == 30
+    else:
+        assert junit.title == "unit tests"
+        assert junit.get_summary() == \
+            "2 tests in 0.02s: 1 failures, 0 errors, 0 skipped"
+        assert junit.start_time.isoformat() == "2026-10-18T10:00:00"
+        # app_test.go is not part of the repository
+        assert annotations == []
+
+
+def test_junit_only(tmp_path, monkeypatch, capsys):
+    (tmp_path / "TEST-com.example.AppTest.xml").write_text(SUREFIRE)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    monkeypatch.setenv("GITHUB_SHA", "b" * 40)
+    timer = main(
+        "other", None, junit_pattern="TEST-*.xml", dry_run="out.ndjson",
+        history="history.db"
+    )
+    outputs = capsys.readouterr().out
+    assert "::set-output name=tests::3" in outputs
+    assert "coverage" not in outputs
+    payloads = Payloads.read(tmp_path / "out.ndjson")
+    assert payloads.check_runs[0]["conclusion"] == "failure"
+    assert payloads.comment is None
+    assert "coverage" not in timer.to_dict()
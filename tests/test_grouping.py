@@ -0,0 +1,67 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test failure grouping
+"""
+from pathlib import Path
+
+from action.grouping import group_failures, normalize_message
+from action.reports import JESTJunitXML
+from action.results import ResultStore
+import action.reports
+
+
+def test_normalize_message():
+    assert normalize_message("Exceeded timeout of 5000 ms  at 0x7ffe12") \
+        == normalize_message("Exceeded timeout of 250.5 ms at 0xa1\n")
+    assert normalize_message(None) == ""
+
+
+def test_group_failures():
+    store = ResultStore()
+    for name, message, line in [
+        ("a", "timeout of 5000 ms", 10),
+        ("b", "timeout of 3000 ms", 10),
+        ("c", "timeout of 5000 ms", 11),
+        ("d", "timeout of 5000 ms", 10),
+    ]:
+        store.append(
+            "suite", name, 1.0, "failure", "spec.ts", line, message, "text"
+        )
+    groups = group_failures(store)
+    assert [
+        [test.name for test in group.tests] for group in groups
+    ] == [["a", "b", "d"], ["c"]]
+    assert groups[0].details == {"text": 3}
+
+
+def test_grouped_check_run_output():
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/stolen-api-services/"
+    )
+    with open("data/test/junit-jest.xml") as file_handler:
+        junit = JESTJunitXML.from_file(file_handler, stream=True)
+    output = junit.create_check_run_output(group=True)
+    # second failure elements of a testcase are grouped separately
+    assert len(output.annotations) == 70
+    largest = max(
+        output.annotations, key=lambda annotation: len(annotation["message"])
+    )
+    assert "279 tests failed with this message" in largest["message"]
+    assert largest["title"].endswith("(+278 more)")
+    # the body shared by all tests is sent once
+    assert len(largest["raw_details"]) < 279 * 1000
+    ungrouped = junit.create_check_run_output()
+    assert sum(
+        len(annotation.get("raw_details", "")) for annotation in
+        output.annotations
+    ) < sum(
+        len(annotation.get("raw_details", "")) for annotation in
+        ungrouped.annotations
+    ) / 2
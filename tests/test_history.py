@@ -0,0 +1,82 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test history store
+"""
+from pathlib import Path
+from types import SimpleNamespace
+from pytest import raises
+
+from action.coverage import PythonCoverageParser
+from action.history import History
+from action.reports import PytestJunitXML
+from action.summary import CoverageSummary
+import action.reports
+
+
+def read_reports():
+    action.reports.ROOTDIR = Path("/home/mmittelb/Projects/ci-action/")
+    with open("data/test/junit-pytest.xml") as file_handler:
+        junit = PytestJunitXML.from_file(file_handler)
+    coverage = PythonCoverageParser()
+    with open("data/test/python-coverage.json") as file_handler:
+        coverage.parse(file_handler)
+    return junit, coverage
+
+
+def test_history(tmp_path):
+    junit, coverage = read_reports()
+    path = tmp_path / "history.db"
+    with History(path) as history:
+        assert history.get_coverage("main") is None
+        assert history.get_slowest_tests() == []
+        history.record("a" * 40, "main", coverage, junit, created=1)
+        assert history.get_coverage("main") == 93
+        assert history.get_coverage("main", "branches") == 100
+        assert history.get_coverage_delta("main", 90) == -3
+        assert history.get_coverage_delta("develop", 90) is None
+
+    # reopened store keeps runs and test identities
+    with History(path) as history:
+        run_id = history.record("b" * 40, "feature", coverage, junit)
+        assert run_id == 2
+        assert history.connection.execute(
+            "SELECT COUNT(*) FROM tests"
+        ).fetchone()[0] == 11
+        assert history.get_run_ids(10) == [2, 1]
+        assert history.get_run_ids(10, "main") == [1]
+        slowest = history.get_slowest_tests(last=2, limit=3)
+        assert len(slowest) == 3
+        assert slowest[0].mean >= slowest[1].mean >= slowest[2].mean
+        assert slowest[0].nruns == 2
+        failed = next(junit.store.iter_status("failure"))
+        outcomes = history.get_test_history(failed.classname, failed.name)
+        assert [outcome.run_id for outcome in outcomes] == [2, 1]
+        assert {outcome.status for outcome in outcomes} == {"failure"}
+
+
+def test_rollback():
+    junit, coverage = read_reports()
+    with History(":memory:") as history:
+        history.record("a" * 40, "main", junit=junit)
+        broken = SimpleNamespace(**vars(junit))
+        broken.store = None
+        with raises(TypeError):
+            history.record("b" * 40, "main", coverage, broken)
+        assert history.get_run_ids(10) == [1]
+        assert history.get_coverage("main") is None
+
+
+def test_comment_note():
+    _, coverage = read_reports()
+    comment = CoverageSummary.from_reporter(coverage).render_comment(
+        note="Statement coverage changed by +1.00 percentage points."
+    )
+    assert "| **TOTAL** | 166 | 13 | 93.56% |  |\n\nStatement coverage " \
+        "changed by +1.00 percentage points.\n\n<details>" in comment
@@ -0,0 +1,96 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test selection of the tests affected by changed files
+"""
+from os import environ
+from pathlib import Path
+from subprocess import run
+from sys import executable
+
+from action.coverage import PythonCoverageParser
+from action.impact import ImpactIndex
+
+ACTION_PATH = str(Path(__file__).parents[1])
+
+
+def make_project(path):
+    (path / "package").mkdir()
+    (path / "package" / "__init__.py").touch()
+    (path / "package" / "first.py").write_text(
+        "def double(value):\n    return 2 * value\n"
+    )
+    (path / "package" / "second.py").write_text(
+        "def negate(value):\n    return -value\n"
+    )
+    (path / "tests").mkdir()
+    (path / "tests" / "__init__.py").touch()
+    (path / "tests" / "test_first.py").write_text(
+        "from package.first import double\n\n\n"
+        "def test_double():\n    assert double(2) == 4\n"
+    )
+    (path / "tests" / "test_second.py").write_text(
+        "from package.second import negate\n\n\n"
+        "def test_negate():\n    assert negate(2) == -2\n"
+    )
+
+
+def test_index(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    env = dict(environ, PYTHONPATH=ACTION_PATH)
+    run([
+        executable, "-m", "coverage", "run", "--source", "package,tests",
+        "-m", "pytest", "-p", "action.pytest_contexts",
+        "-p", "no:cacheprovider",
+    ], env=env, check=True)
+    run(
+        [executable, "-m", "coverage", "json", "--show-contexts"],
+        env=env, check=True
+    )
+    coverage = PythonCoverageParser()
+    with open("coverage.json") as file_handler:
+        coverage.parse(file_handler)
+    index = ImpactIndex.from_coverage(coverage, "abc")
+    assert index.tests["package/first.py"] == ["tests/test_first.py"]
+    assert index.tests["package/second.py"] == ["tests/test_second.py"]
+    assert index.test_modules == [
+        "tests/test_first.py", "tests/test_second.py"
+    ]
+    # module level code runs in the empty context during collection
+    assert "package/__init__.py" not in index.tests
+
+
+def test_select(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    index = ImpactIndex({
+        "package/first.py": ["tests/test_first.py"],
+        "package/second.py": ["tests/test_second.py"],
+        "tests/test_first.py": ["tests/test_first.py"],
+        "package/removed.py": ["tests/test_removed.py"],
+    })
+    assert index.select(["package/first.py", "README.md"]) == [
+        "tests/test_first.py"
+    ]
+    # new test module, deleted test modules are skipped
+    assert index.select(
+        ["tests/test_new.py", "tests/test_second.py", "package/removed.py"]
+    ) == ["tests/test_second.py"]
+    assert index.select(["setup.cfg", "package/first.py"]) is None
+    assert index.select(["package/unknown.py"]) is None
+    assert index.select(["docs/index.rst"]) is None
+    index.runs_since_full = 9
+    assert index.select(["package/first.py"], full_run_every=10) is None
+
+
+def test_round_trip(tmp_path):
+    index = ImpactIndex({"a.py": ["tests/test_a.py"]}, "abc", 3)
+    index.write(tmp_path / "index.json")
+    assert ImpactIndex.read(tmp_path / "index.json") == index
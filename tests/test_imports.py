@@ -0,0 +1,63 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test import time of the entry points
+"""
+from subprocess import run
+from sys import executable
+
+from pytest import mark
+
+# budgets in microseconds for the time spent in the modules of the action
+# itself, the standard library modules they need are checked by name, as
+# their import time depends too much on the machine
+BUDGETS = {
+    "action.create_badge": 30_000,
+    "action.action_main": 60_000,
+}
+NETWORK_MODULES = {"github", "asyncio", "http.client"}
+
+
+def import_times(module):
+    # -S keeps modules imported by site-packages out of the measurement
+    process = run(
+        [executable, "-S", "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(own)
+    return times
+
+
+@mark.parametrize("module, budget", list(BUDGETS.items()))
+def test_budget(module, budget):
+    own_times = []
+    for _ in range(3):
+        times = import_times(module)
+        assert not NETWORK_MODULES & set(times)
+        own_times.append(sum(
+            time for name, time in times.items()
+            if name == "action" or name.startswith("action.")
+        ))
+    assert min(own_times) < budget
+
+
+def test_lazy_package():
+    times = import_times("action.create_badge")
+    assert "action.coverage" not in times
+    assert "concurrent.futures.process" not in import_times(
+        "action.action_main"
+    )
+    import action
+    assert action.CoverageBadge.__name__ == "CoverageBadge"
+    assert "ShieldIO6Color" in dir(action)
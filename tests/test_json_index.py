@@ -0,0 +1,61 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test lazy json objects
+"""
+from io import StringIO
+from json import dumps, load
+from pytest import raises
+
+from action.coverage import PythonCoverageParser
+from action.json_index import JSONIndexError, LazyJSONObject, read_buffer
+
+
+def test_lazy_json_object():
+    report = {
+        "meta": {"version": "6.2"},
+        "files": {
+            "a.py": {"lines": [1, 2, 3], "text": "} { \" ] ["},
+            "b/ä.py": {"a": {"b": {"c": {"d": {"e": [{"f": None}]}}}}},
+            "c.py": [[], [1, [2]], {"x": "]"}],
+        },
+        "totals": 1.5,
+        "empty": {},
+    }
+    data = read_buffer(StringIO(dumps(report, indent=1)))
+    lazy = LazyJSONObject.from_buffer(data, expand=("files",))
+    assert list(lazy) == list(report)
+    assert lazy["totals"] == 1.5
+    assert lazy["empty"] == {}
+    assert isinstance(lazy["files"], LazyJSONObject)
+    assert "b/ä.py" in lazy["files"]
+    assert dict(lazy["files"]) == report["files"]
+    with raises(KeyError):
+        lazy["files"]["d.py"]
+
+
+def test_malformed():
+    for text in ['[1, 2]', '{"a": 1', '{"a" 1}', '{"a": {"b": [}']:
+        with raises(JSONIndexError):
+            LazyJSONObject.from_buffer(text.encode())
+
+
+def test_python_coverage_files():
+    parser = PythonCoverageParser()
+    with open("data/test/python-coverage.json") as fh:
+        parser.parse(fh)
+    with open("data/test/python-coverage.json") as fh:
+        report = load(fh)
+    assert len(parser.files) == len(report["files"])
+    assert dict(parser.files) == report["files"]
+    assert parser.get_file_lines("test_action/badges.py") == (
+        report["files"]["test_action/badges.py"]["executed_lines"],
+        report["files"]["test_action/badges.py"]["missing_lines"],
+    )
+    assert parser.get_file_lines("missing.py") is None
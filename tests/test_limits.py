@@ -0,0 +1,90 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test size limits of check run output
+"""
+from action.git_data import CheckRunAnnotation, iter_batches
+from action.limits import (
+    encoded_size, MAX_DETAILS_BYTES, MAX_OUTPUT_LENGTH, MAX_TITLE_LENGTH,
+    OutputBuilder, share_budget, truncate_bytes, truncate_length,
+    truncate_traceback
+)
+
+
+def test_truncate():
+    assert truncate_length("short", 10) == "short"
+    assert len(truncate_length("x" * 100, 20)) == 20
+    assert truncate_length("x" * 100, 20).endswith("[truncated]")
+    text = "ä" * 100
+    assert truncate_bytes(text, 200) == text
+    truncated = truncate_bytes(text, 51)
+    assert encoded_size(truncated) <= 51
+    assert truncated.startswith("ä" * 19)
+    assert truncate_bytes(text, 5) == "ää"
+
+
+def test_truncate_traceback():
+    lines = [f"head {index}" for index in range(10)]
+    lines += [f"library frame {index} " + "x" * 50 for index in range(100)]
+    lines += ["src/app.py:12: in save", "    json.dumps(value)"]
+    lines += [f"library frame {index}" for index in range(100)]
+    lines += ["E   TypeError: not serializable"]
+    text = "\n".join(lines)
+    truncated = truncate_traceback(
+        text, 1200, lambda line: line.startswith("src/")
+    )
+    assert encoded_size(truncated) <= 1200
+    kept = truncated.split("\n")
+    assert kept[:10] == lines[:10]
+    assert kept[10] == "[... 99 lines omitted ...]"
+    assert "src/app.py:12: in save" in kept
+    assert "    json.dumps(value)" in kept
+    assert kept[-1] == "E   TypeError: not serializable"
+    assert truncate_traceback(text, len(text)) == text
+    # single line longer than the budget
+    assert encoded_size(truncate_traceback("x" * 500, 100)) <= 100
+
+
+def test_share_budget():
+    assert share_budget([10, 500, 1000], 600) == [10, 295, 295]
+    assert share_budget([10, 20], 600) == [10, 20]
+    assert share_budget([10, 20], -5) == [0, 0]
+    assert share_budget([], 100) == []
+
+
+def test_output_builder():
+    builder = OutputBuilder("pytest tests", "x" * (MAX_OUTPUT_LENGTH + 1))
+    assert builder.append_text("table")
+    assert not builder.append_text("y" * MAX_OUTPUT_LENGTH)
+    traceback = "\n".join(f"frame {index}" for index in range(20000))
+    for index in range(60):
+        builder.add_annotation(CheckRunAnnotation(
+            path="tests/test_app.py", start_line=1, end_line=1,
+            annotation_level="failure", title="t" * 300,
+            message="m" * (MAX_DETAILS_BYTES + 1 if index == 0 else 10),
+            raw_details=traceback if index % 2 else "short details"
+        ))
+    output = builder.build()
+    assert len(output.summary) == MAX_OUTPUT_LENGTH
+    assert len(output.text) == MAX_OUTPUT_LENGTH
+    assert output.text.startswith("table\n")
+    assert len(output.annotations) == 60
+    for batch in iter_batches(output.annotations, 50):
+        assert sum(
+            encoded_size(annotation["message"])
+            + encoded_size(annotation.get("raw_details"))
+            for annotation in batch
+        ) <= builder.request_budget
+    for annotation in output.annotations:
+        assert len(annotation["title"]) == MAX_TITLE_LENGTH
+        assert encoded_size(annotation["message"]) <= MAX_DETAILS_BYTES
+        assert encoded_size(annotation["raw_details"]) <= MAX_DETAILS_BYTES
+    assert output.annotations[0]["raw_details"] == "short details"
+    assert output.annotations[1]["raw_details"].startswith("frame 0\n")
+    assert output.annotations[1]["raw_details"].endswith("frame 19999")
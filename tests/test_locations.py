@@ -0,0 +1,107 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test traceback location resolvers
+"""
+from pathlib import Path
+
+from action.locations import (
+    build_suffix_index, get_tracked_files, JestLocationResolver,
+    PytestLocationResolver
+)
+
+ROOTDIR = Path("/home/mmittelb/Projects/stolen-api-services/")
+
+
+def test_jest_location_resolver():
+    assert JestLocationResolver.for_rootdir(ROOTDIR) is \
+        JestLocationResolver.for_rootdir(ROOTDIR)
+    resolver = JestLocationResolver(ROOTDIR)
+    text = (
+        "Error: thrown\n"
+        "    at Object.<anonymous> (/usr/lib/node/internal.js:3:1)\n"
+        "    at x (/home/mmittelb/Projects/stolen-api-services/node_modules"
+        "/jest-circus/build/index.js:97:26)\n"
+        "    at /home/mmittelb/Projects/stolen-api-services/apps/auth/test/"
+        "app.e2e-spec.ts:10:3\n"
+        "    at /home/mmittelb/Projects/stolen-api-services/apps/auth/test/"
+        "other.ts:7:1\n"
+    )
+    assert resolver.resolve(text) == ("apps/auth/test/app.e2e-spec.ts", 10)
+    assert resolver.resolve(text) == ("apps/auth/test/app.e2e-spec.ts", 10)
+    assert resolver.relative_path.cache_info().hits == 1
+    assert resolver.resolve("Error: no frames") is None
+    assert resolver.resolve(
+        "    at /home/mmittelb/Projects/other/app.ts:1:1"
+    ) is None
+
+
+PYTEST_ROOTDIR = Path("/home/runner/work/app/app")
+TRACKED = ("", frozenset({
+    "src/app/models.py", "src/app/__init__.py", "tests/test_models.py",
+    "tests/__init__.py",
+}))
+LONG_TRACEBACK = """def test_save():
+>       models.save(1)
+
+tests/test_models.py:12:
+_ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _
+
+    def save(value):
+>       json.dumps(object())
+
+/opt/venv/lib/python3.9/site-packages/app/models.py:30:
+_ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _
+
+E       TypeError: Object of type object is not JSON serializable
+
+/usr/lib/python3.9/json/encoder.py:179: TypeError"""
+SHORT_TRACEBACK = """tests/test_models.py:12: in test_save
+    models.save(1)
+../../../../../opt/venv/lib/python3.9/site-packages/app/models.py:30: in save
+    json.dumps(object())
+/usr/lib/python3.9/json/encoder.py:179: in default
+    raise TypeError
+E   TypeError: Object of type object is not JSON serializable"""
+NATIVE_TRACEBACK = """Traceback (most recent call last):
+  File "/home/runner/work/app/app/tests/test_models.py", line 12, in test_save
+    models.save(1)
+  File "/home/runner/work/app/app/src/app/models.py", line 31, in save
+    json.dumps(object())
+  File "/usr/lib/python3.9/json/encoder.py", line 179, in default
+    raise TypeError
+TypeError: Object of type object is not JSON serializable"""
+
+
+def test_pytest_location_resolver():
+    resolver = PytestLocationResolver(PYTEST_ROOTDIR, TRACKED)
+    assert resolver.resolve(LONG_TRACEBACK) == ("src/app/models.py", 30)
+    assert resolver.resolve(SHORT_TRACEBACK) == ("src/app/models.py", 30)
+    assert resolver.resolve(NATIVE_TRACEBACK) == ("src/app/models.py", 31)
+    assert resolver.resolve(
+        "/usr/lib/python3.9/json/encoder.py:179: TypeError"
+    ) is None
+    # untracked files inside the root directory
+    assert resolver.resolve("build/generated.py:3: in f") is None
+    # without tracked files, paths below the root directory are accepted
+    resolver = PytestLocationResolver(PYTEST_ROOTDIR)
+    assert resolver.resolve(LONG_TRACEBACK) == ("tests/test_models.py", 12)
+    assert resolver.resolve("build/generated.py:3: in f") == \
+        ("build/generated.py", 3)
+
+
+def test_suffix_index():
+    index = build_suffix_index(["src/app/models.py", "lib/models.py"])
+    assert index["app/models.py"] == "src/app/models.py"
+    assert index["lib/models.py"] == "lib/models.py"
+    assert index["models.py"] is None
+    prefix, tracked = get_tracked_files(Path(__file__).parent)
+    assert prefix == "tests/"
+    assert "action/locations.py" in tracked
+    assert get_tracked_files(Path("/")) is None
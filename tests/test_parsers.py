@@ -10,10 +10,17 @@ Copyright (c) 2021 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
 test parsers
 """
 from argparse import ArgumentTypeError
+from io import StringIO
+from json import dump as json_dump, dumps as json_dumps, load as json_load
+from shutil import copy
 from pytest import raises
 from pytest import mark
 
-from action.coverage import JestCoverageJsonSummaryParser, Parser, PythonCoverageParser
+from action.action_main import main
+from action.coverage import (
+    JestCoverageJsonSummaryParser, Parser, PythonCoverageParser,
+    UnmeasuredMetricException
+)
 
 
 def test_base_class():
@@ -66,3 +73,43 @@ def test_python_coverage_parser(metric, expected_cov):
     with open("data/test/python-coverage.json") as fh:
         parser.parse(fh)
     assert parser.get_relative_coverage(metric) == expected_cov
+
+
+def test_main_without_branches(tmp_path, monkeypatch, capsys):
+    copy("data/test/junit-pytest.xml", tmp_path / "junit.xml")
+    with open("data/test/python-coverage.json") as file_handler:
+        report = json_load(file_handler)
+    # coverage run without --branch
+    report["meta"]["branch_coverage"] = False
+    for key in (
+        "num_branches", "num_partial_branches", "covered_branches",
+        "missing_branches"
+    ):
+        del report["totals"][key]
+    with open(tmp_path / "coverage.json", "w") as file_handler:
+        json_dump(report, file_handler)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    monkeypatch.setenv("GITHUB_SHA", "b" * 40)
+    main("python", None, dry_run="out.ndjson", history="history.db")
+    outputs = capsys.readouterr().out
+    assert "::set-output name=coverage::93" in outputs
+    assert "::set-output name=lines-coverage::92" in outputs
+    assert "branches-coverage" not in outputs
+
+
+def test_unmeasured_metrics():
+    with open("data/test/python-coverage.json") as file_handler:
+        report = json_load(file_handler)
+    del report["totals"]["num_branches"]
+    parser = PythonCoverageParser()
+    parser.parse(StringIO(json_dumps(report)))
+    with raises(UnmeasuredMetricException):
+        parser.get_relative_coverage("branches")
+    assert [metric for metric, _ in parser.iter_relative_coverage()] == \
+        ["statements", "lines"]
+    # truncated reports are no unmeasured metrics
+    del report["totals"]["percent_covered"]
+    parser.parse(StringIO(json_dumps(report)))
+    with raises(KeyError):
+        list(parser.iter_relative_coverage())
@@ -0,0 +1,119 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test dry runs and stored payloads
+"""
+from io import StringIO
+from json import dumps
+from os import environ
+from pathlib import Path
+from shutil import copy
+from subprocess import run
+from sys import executable
+
+from pytest import mark
+
+from action.action_main import main
+from action.diff_coverage import ChangedLines
+from action.history import History
+from action.payloads import Payloads
+from action.reports import PytestJunitXML
+import action.reports
+
+
+@mark.parametrize("filename", ["payloads.json", "payloads.ndjson"])
+def test_round_trip(tmp_path, filename):
+    action.reports.ROOTDIR = Path("/home/mmittelb/Projects/ci-action/")
+    with open("data/test/junit-pytest.xml") as file_handler:
+        junit = PytestJunitXML.from_file(file_handler)
+    payloads = Payloads.create(
+        [junit.create_check_run("a" * 40)], 3, "coverage", {"junit": 0.5}
+    )
+    assert payloads.check_runs[0]["started_at"] == "2021-12-14T14:55:13Z"
+    payloads.write(tmp_path / filename)
+    assert Payloads.read(tmp_path / filename) == payloads
+
+
+def test_dry_run(tmp_path, monkeypatch):
+    copy("data/test/junit-pytest.xml", tmp_path / "junit.xml")
+    copy("data/test/python-coverage.json", tmp_path / "coverage.json")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    monkeypatch.setenv("GITHUB_SHA", "b" * 40)
+    timer = main("python", None, dry_run="out.ndjson")
+    lines = (tmp_path / "out.ndjson").read_text().splitlines()
+    assert [line[:20] for line in lines] == [
+        '{"type": "check_run"', '{"type": "comment", ',
+        '{"type": "timings", '
+    ]
+    payloads = Payloads.read(tmp_path / "out.ndjson")
+    assert payloads.check_runs[0]["head_sha"] == "b" * 40
+    assert payloads.check_runs[0]["conclusion"] == "failure"
+    assert payloads.issue_number is None
+    assert "| **TOTAL** |" in payloads.comment
+    assert set(payloads.timings) == {
+        "junit", "coverage", "flaky", "durations", "check run",
+        "diff coverage", "comment", "total"
+    }
+    assert payloads.timings["total"] == timer.total
+
+
+def test_dry_run_partial(tmp_path, monkeypatch, capsys):
+    copy("data/test/junit-pytest.xml", tmp_path / "junit.xml")
+    copy("data/test/python-coverage.json", tmp_path / "coverage.json")
+    (tmp_path / "event.json").write_text(dumps({"pull_request": {
+        "number": 3, "head": {"sha": "b" * 40, "ref": "feature"},
+        "base": {"sha": "a" * 40, "ref": "main"}
+    }}))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(tmp_path / "event.json"))
+    compared = []
+
+    def from_git(base, head):
+        compared.append((base, head))
+        return ChangedLines.from_diff(StringIO(
+            "--- a/test_action/parsers.py\n+++ b/test_action/parsers.py\n"
+            "@@ -22,0 +23,1 @@\n+    a\n"
+        ))
+    monkeypatch.setattr(ChangedLines, "from_git", from_git)
+    with History(tmp_path / "history.db") as history:
+        history.record("a" * 40, "main")
+    main(
+        "python", None, dry_run="out.ndjson", history="history.db",
+        partial=True
+    )
+    outputs = capsys.readouterr().out
+    assert "name=coverage::" not in outputs
+    assert "::set-output name=tests::" in outputs
+    # coverage of the changed lines without --diff-coverage
+    assert compared == [("a" * 40, "b" * 40)]
+    assert "::set-output name=patch-coverage::" in outputs
+    payloads = Payloads.read(tmp_path / "out.ndjson")
+    assert payloads.comment is None
+    assert [check_run["name"] for check_run in payloads.check_runs] == \
+        ["unit-tests", "diff-coverage"]
+    with History(tmp_path / "history.db") as history:
+        assert [row[0] for row in history.connection.execute(
+            "SELECT commit_hash FROM runs"
+        )] == ["a" * 40]
+
+
+def test_command_line(tmp_path):
+    copy("data/test/junit-pytest.xml", tmp_path / "results.xml")
+    copy("data/test/python-coverage.json", tmp_path / "report.json")
+    env = dict(environ, PYTHONPATH=str(Path.cwd()), GITHUB_SHA="b" * 40)
+    env.pop("GITHUB_EVENT_PATH", None)
+    # options are passed to main by name
+    result = run([
+        executable, "-m", "action.action_main", "python",
+        "--junit", "results.xml", "--format", "auto",
+        "--coverage", "report.json", "--dry-run", "out.ndjson"
+    ], cwd=tmp_path, env=env, capture_output=True, text=True, check=True)
+    assert "::set-output name=coverage::93" in result.stdout
+    assert Payloads.read(tmp_path / "out.ndjson").comment is not None
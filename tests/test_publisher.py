@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test check run publisher
+"""
+from pathlib import Path
+from github.GithubException import RateLimitExceededException
+from pytest import raises
+
+from action.publisher import CheckRunPublisher, iter_batches
+from action.reports import JESTJunitXML
+import action.reports
+
+
+def test_iter_batches():
+    assert list(iter_batches(list(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(iter_batches([], 2)) == []
+
+
+def test_publish_all_annotations():
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/stolen-api-services/"
+    )
+    with open("data/test/junit-jest.xml") as file_handler:
+        junit = JESTJunitXML.from_file(file_handler, stream=True)
+    check_run = junit.create_check_run("abc")
+    repo = RepoMock()
+    waits = []
+    publisher = CheckRunPublisher(GithubMock(), repo, wait=waits.append)
+    publisher.publish(check_run)
+
+    batches = [repo.created["output"]["annotations"]] + \
+        repo.check_run.edits
+    assert [len(batch) for batch in batches] == [50] * 12 + [17]
+    assert [
+        annotation for batch in batches for annotation in batch
+    ] == check_run.output["annotations"]
+    assert repo.created["head_sha"] == "abc"
+    assert repo.created["output"]["summary"] == junit.get_summary()
+    # rate limit exhausted before third request, exceeded on sixth edit
+    assert waits == [1, 30.0]
+    with raises(ValueError):
+        CheckRunPublisher(GithubMock(), repo, batch_size=51)
+
+
+class GithubMock():
+    rate_limiting_resettime = 0
+
+    def __init__(self):
+        self.calls = 0
+
+    @property
+    def rate_limiting(self):
+        self.calls += 1
+        return (0 if self.calls == 3 else 100, 5000)
+
+
+class CheckRunMock():
+    def __init__(self):
+        self.edits = []
+        self.failed = False
+
+    def edit(self, output):
+        if len(self.edits) == 5 and not self.failed:
+            self.failed = True
+            raise RateLimitExceededException(
+                403, headers={"retry-after": "30"}
+            )
+        self.edits.append(output["annotations"])
+
+
+class RepoMock():
+    def __init__(self):
+        self.check_run = CheckRunMock()
+
+    def create_check_run(self, **kwargs):
+        self.created = dict(kwargs, output=dict(kwargs["output"]))
+        return self.check_run
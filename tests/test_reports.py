@@ -9,11 +9,14 @@ Copyright (c) 2021 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
 
 {module docstring goes here}
 """
+from io import StringIO
 from pathlib import Path
+from pytest import mark, raises
 try:
     from xml.etree.cElementTree import parse as parse_xml
 except ModuleNotFoundError:
     from xml.etree.ElementTree import parse as parse_xml
+from action.flaky import FlakyAnalysis
 from action.reports import JESTJunitXML, PytestJunitXML
 import action.reports
 
@@ -29,10 +32,11 @@ def test_junit():
     assert junit.start_time != junit.end_time
     assert junit.get_summary() == \
         '655 tests in 230.708s: 333 failures, 0 errors, 0 skipped'
+    assert junit.get_pass_rate() == 49
     assert junit.title == 'jest tests'
     check_run_output = junit.create_check_run_output()
     assert check_run_output.summary == junit.get_summary()
-    assert len(check_run_output.annotations) == 50
+    assert len(check_run_output.annotations) == 617
 
 
 def test_pytest():
@@ -44,9 +48,151 @@ def test_pytest():
     assert junit.start_time != junit.end_time
     assert junit.get_summary() == \
         '11 tests in 0.075s: 1 failures, 0 errors, 0 skipped'
+    assert junit.get_pass_rate() == 90
     assert junit.title == 'pytest tests'
     check_run_output = junit.create_check_run_output()
     assert check_run_output.summary == junit.get_summary()
     assert len(check_run_output.annotations) == 1
     assert check_run_output.annotations[0]["path"] == "tests/test_reports.py"
     assert check_run_output.annotations[0]["start_line"] == 16
+
+
+@mark.parametrize(
+    "junit_cls, filename, rootdir",
+    [
+        (
+            JESTJunitXML, "data/test/junit-jest.xml",
+            "/home/mmittelb/Projects/stolen-api-services/"
+        ),
+        (
+            PytestJunitXML, "data/test/junit-pytest.xml",
+            "/home/mmittelb/Projects/ci-action/"
+        ),
+    ]
+)
+def test_stream(junit_cls, filename, rootdir):
+    action.reports.ROOTDIR = Path(rootdir)
+    with open(filename) as file_handler:
+        tree = junit_cls.from_file(file_handler)
+    with open(filename) as file_handler:
+        stream = junit_cls.from_file(file_handler, stream=True)
+    assert stream.root is None
+    for attr in [
+        "title", "ntests", "nfailures", "nerrors", "nskipped", "time",
+        "start_time"
+    ]:
+        assert getattr(stream, attr) == getattr(tree, attr)
+    assert list(stream.store) == list(tree.store)
+    assert stream.create_check_run_output() == \
+        tree.create_check_run_output()
+
+
+def test_merge_shards(tmp_path):
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/ci-action/"
+    )
+    with open("data/test/junit-pytest.xml") as file_handler:
+        xml = file_handler.read()
+    first, second, retry = [
+        tmp_path / f"junit-{index}.xml" for index in range(3)
+    ]
+    first.write_text(xml)
+    second.write_text(
+        xml.replace('classname="tests.', 'classname="other.')
+        .replace("2021-12-14T14:55:13", "2021-12-14T14:50:13")
+    )
+    # retried test passed in the last shard
+    retry.write_text(
+        '<?xml version="1.0" encoding="utf-8"?><testsuites>'
+        '<testsuite name="pytest" errors="0" failures="0" skipped="0" '
+        'tests="1" time="0.5" timestamp="2021-12-14T15:00:00">'
+        '<testcase classname="tests.test_reports" name="test_failed" '
+        'time="0.001" /></testsuite></testsuites>'
+    )
+
+    junit = PytestJunitXML.from_files([str(first), str(second)], 2)
+    assert junit.get_summary() == \
+        '22 tests in 0.15s: 2 failures, 0 errors, 0 skipped'
+    assert junit.start_time.minute == 50
+    assert len(junit.create_check_run_output().annotations) == 2
+
+    junit = PytestJunitXML.from_files([str(first), str(second), str(retry)])
+    assert junit.get_summary() == \
+        '22 tests in 0.65s: 1 failures, 0 errors, 0 skipped'
+    assert junit.end_time.hour == 15
+    annotations = junit.create_check_run_output().annotations
+    assert len(annotations) == 1
+    assert annotations[0]["path"] == "tests/test_reports.py"
+    # the failed attempt of the first shard makes the test flaky
+    assert len(junit.retried) == 1
+    flaky = FlakyAnalysis.analyze(junit.store, retried=junit.retried)
+    assert flaky.failures[0].classname == "other.test_reports"
+    assert flaky.flaky[0].record.classname == "tests.test_reports"
+    assert flaky.flaky[0].attempts == 2
+    assert flaky.flaky[0].passed == 1
+
+    with raises(ValueError):
+        PytestJunitXML.from_files([])
+
+
+def test_merge_occurences(tmp_path):
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/ci-action/"
+    )
+    head = '<?xml version="1.0" encoding="utf-8"?><testsuites>' \
+        '<testsuite name="pytest" errors="0" failures="{}" skipped="0" ' \
+        'tests="{}" time="0.5" timestamp="2021-12-14T15:00:00">'
+    passed = '<testcase classname="tests.test_a" name="test_x" ' \
+        'time="0.1" />'
+    failed = '<testcase classname="tests.test_a" name="test_x" ' \
+        'time="0.1"><failure message="assert False">' \
+        'tests/test_reports.py:3: AssertionError</failure></testcase>'
+    other = '<testcase classname="tests.test_b" name="test_y" ' \
+        'time="0.1" />'
+    tail = '</testsuite></testsuites>'
+    first, retry = tmp_path / "junit-0.xml", tmp_path / "junit-1.xml"
+    # equally named testcases, the second one failed and passed on retry
+    first.write_text(head.format(1, 3) + passed + other + failed + tail)
+    retry.write_text(head.format(0, 2) + passed + passed + tail)
+    junit = PytestJunitXML.from_files([str(first), str(retry)])
+    assert junit.get_summary() == \
+        '3 tests in 1.0s: 0 failures, 0 errors, 0 skipped'
+    assert [record.name for record in junit.store] == \
+        ["test_x", "test_y", "test_x"]
+    flaky = FlakyAnalysis.analyze(junit.store, retried=junit.retried)
+    assert flaky.failures == []
+    assert len(flaky.flaky) == 1
+    assert flaky.flaky[0].record.message == "assert False"
+    # the attempts of the first testcase are not credited to the second
+    assert flaky.flaky[0].attempts == 2
+    assert flaky.flaky[0].passed == 1
+
+
+def test_merge_single_shard():
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/stolen-api-services/"
+    )
+    junit = JESTJunitXML.from_file("data/test/junit-jest.xml")
+    merged = JESTJunitXML.from_files(["data/test/junit-jest.xml"])
+    # jest repeats testcase names across suites, these are no retries
+    assert merged.get_summary() == junit.get_summary()
+    assert merged.nfailures == junit.nfailures == 333
+    assert len(merged.store) == len(junit.store)
+    assert len(merged.retried) == 0
+
+
+def test_drop_unlocated():
+    action.reports.ROOTDIR = Path(
+        "/home/mmittelb/Projects/ci-action/"
+    )
+    with open("data/test/junit-pytest.xml") as file_handler:
+        xml = file_handler.read().replace(
+            "tests/test_reports.py:16: TypeError",
+            "/usr/lib/python3.9/json/encoder.py:179: TypeError"
+        )
+    with StringIO(xml) as file_handler:
+        junit = PytestJunitXML.from_file(file_handler)
+    record, = junit.store.iter_status("failure")
+    assert record.path == "nofilematched"
+    assert junit.nfailures == 1
+    assert junit.create_check_run_output().annotations == []
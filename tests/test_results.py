@@ -0,0 +1,68 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test result store
+"""
+from math import isnan
+from pickle import dumps, loads
+
+from action.results import STATUS_CODES, ResultStore
+
+
+def test_result_store():
+    store = ResultStore()
+    store.append("tests.test_a", "test_1", 0.5)
+    store.append(
+        "tests.test_a", "test_2", 2.0, "failure", "tests/test_a.py", 12,
+        "AssertionError", "details"
+    )
+    store.append("tests.test_b", "test_3", status="skipped")
+    store.append(
+        "tests.test_b", "test_4", 1.0, "error", "tests/test_b.py", 3,
+        "AssertionError", "details"
+    )
+    assert len(store) == 4
+    # classnames, paths, messages and details are interned
+    assert store.strings == [
+        None, "tests.test_a", "tests/test_a.py", "AssertionError",
+        "details", "tests.test_b", "tests/test_b.py"
+    ]
+    assert store.key(1) == ("tests.test_a", "test_2")
+    assert store[1].path == "tests/test_a.py"
+    assert store[1].line == 12
+    assert store[0].message is None
+    assert isnan(store[2].duration)
+    assert store.count("failure") == store.count("error") == 1
+    assert [
+        record.name for record in store.iter_status("failure", "error")
+    ] == ["test_2", "test_4"]
+    assert store.total_duration() == 3.5
+    assert store.sorted_by_duration() == [1, 3, 0, 2]
+    copy = loads(dumps(store))
+    assert [record[:2] + record[3:] for record in copy] == \
+        [record[:2] + record[3:] for record in store]
+
+
+def test_failure_elements():
+    store = ResultStore()
+    store.append("tests.test_a", "test_1", 0.5, time="0.50")
+    store.append(
+        "tests.test_a", "test_2", 2.0, "failure", "tests/test_a.py", 12,
+        "AssertionError", "first", "2.0"
+    )
+    store.append(
+        "tests.test_a", "test_2", 2.0, "error", "tests/test_a.py", 14,
+        "TypeError", "second", "2.0", 1
+    )
+    assert list(store.iter_testcases()) == [(0, 1), (1, 3)]
+    assert store.get_testcase_status(1, 3) == STATUS_CODES["error"]
+    assert store[0].time == "0.50"
+    # the duration of a testcase counts once
+    assert store.total_duration() == 2.5
+    assert store.sorted_by_duration() == [1, 0, 2]
@@ -0,0 +1,81 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test shard balancing and the parallel pytest runner
+"""
+from pathlib import Path
+
+from pytest import raises
+
+from action.coverage import PythonCoverageParser
+from action.durations import BaselineDuration, DurationBaseline
+from action.reports import PytestJunitXML
+from action.shards import (
+    balance_shards, collect_test_files, get_file_durations, run_pytest_shards
+)
+
+
+def test_balance():
+    durations = {"a": 5, "b": 4, "c": 3, "d": 3, "e": 3}
+    shards = balance_shards(durations, 2)
+    # longest processing time first: a, b, c on b, d on a, e on c's shard
+    assert shards == [["a", "d"], ["b", "c", "e"]]
+    assert balance_shards(durations, 10) == [["a"], ["b"], ["c"], ["d"], ["e"]]
+    assert balance_shards({}, 3) == []
+    with raises(ValueError):
+        balance_shards(durations, 0)
+
+
+def test_file_durations():
+    baseline = DurationBaseline({
+        ("tests.test_shards", "test_balance"): BaselineDuration(1.0, 0, 1),
+        ("tests.test_shards", "test_run"): BaselineDuration(2.0, 0, 1),
+        ("tests.test_colors", "test_shields_color"):
+            BaselineDuration(1.0, 0, 1),
+        ("tests.removed", "test_gone"): BaselineDuration(9.0, 0, 1),
+    }, "junit.xml")
+    files = ["tests/test_shards.py", "tests/test_colors.py",
+             "tests/test_badges.py"]
+    assert get_file_durations(files, baseline, Path.cwd()) == {
+        "tests/test_shards.py": 3.0,
+        "tests/test_colors.py": 1.0,
+        "tests/test_badges.py": 2.0,
+    }
+    assert set(get_file_durations(files, None, Path.cwd()).values()) == {1.0}
+
+
+def test_run(tmp_path, monkeypatch):
+    tests = tmp_path / "tests"
+    tests.mkdir()
+    (tests / "__init__.py").touch()
+    for index in range(3):
+        (tests / f"test_module{index}.py").write_text(
+            f"def test_{index}():\n    assert {index} != 1\n"
+        )
+    monkeypatch.chdir(tmp_path)
+    files = collect_test_files(["-p", "no:cacheprovider"])
+    assert sorted(files) == [
+        "tests/test_module0.py", "tests/test_module1.py",
+        "tests/test_module2.py",
+    ]
+    shards = balance_shards(dict.fromkeys(files, 1.0), 2)
+    exit_code = run_pytest_shards(
+        shards, tmp_path / "shards", ["-p", "no:cacheprovider"]
+    )
+    assert exit_code == 1
+    junit = PytestJunitXML.from_files(
+        sorted(str(path) for path in (tmp_path / "shards").glob("*.xml"))
+    )
+    assert junit.ntests == 3
+    assert junit.nfailures == 1
+    coverage = PythonCoverageParser()
+    with open(tmp_path / "coverage.json") as file_handler:
+        coverage.parse(file_handler)
+    assert "tests/test_module2.py" in coverage.files
+    assert run_pytest_shards([], tmp_path / "shards") == 5
@@ -0,0 +1,88 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test coverage comment rendering
+"""
+from pathlib import Path
+from pytest import mark, raises
+
+from action.coverage import JestCoverageJsonSummaryParser, PythonCoverageParser
+from action.summary import CoverageSummary, format_ranges
+
+
+def read_python_coverage():
+    coverage = PythonCoverageParser()
+    with open("data/test/python-coverage.json") as fh:
+        coverage.parse(fh)
+    return coverage
+
+
+def test_format_ranges():
+    assert format_ranges([]) == ""
+    assert format_ranges([3, 5, 6, 7, 9]) == "3, 5-7, 9"
+
+
+@mark.parametrize(
+    "sort, expected",
+    [
+        ("missing", ["test_action/parsers.py", "test_action/badges.py"]),
+        ("coverage", ["test_action/badges.py", "test_action/parsers.py"]),
+        ("name", ["test_action/__init__.py", "test_action/badges.py"]),
+    ]
+)
+def test_python_summary(sort, expected):
+    summary = CoverageSummary.from_reporter(
+        read_python_coverage(), sort=sort, limit=2
+    )
+    assert [row.path for row in summary.files] == expected
+    assert summary.nfiles == 8
+    comment = summary.render_comment()
+    assert "| **TOTAL** | 166 | 13 | 93.56% |  |" in comment
+    assert f"2 of 8 files shown, sorted by {sort}." in comment
+    if sort == "missing":
+        assert "| `test_action/parsers.py` | 47 | 8 | 85.96% | " \
+            "25, 40, 74-78, 81 |" in comment
+
+
+def test_jest_summary():
+    coverage = JestCoverageJsonSummaryParser()
+    with open("data/test/jest-coverage-summary.json") as fh:
+        coverage.parse(fh)
+    summary = CoverageSummary.from_reporter(
+        coverage, rootdir=Path("/home/mmittelb/Projects/stolen-api-services")
+    )
+    comment = summary.render_comment()
+    assert "| Name | Stmts | Miss | % Stmts | % Branch | % Funcs | " \
+        "% Lines |" in comment
+    assert "| **TOTAL** | 6078 | 2589 | 57.40% | 17% | 30.81% | 56.62% |" \
+        in comment
+    assert "| `apps/asset/src/app.module.ts` | 30 | 30 |" in comment
+    assert "Missing" not in comment
+
+
+def test_truncation():
+    summary = CoverageSummary.from_reporter(read_python_coverage())
+    full = summary.render_comment()
+    assert "8 of 8 files shown" in full
+    truncated = summary.render_comment(len(full) - 1)
+    assert len(truncated) <= len(full) - 1
+    assert "7 of 8 files shown" in truncated
+    assert truncated.endswith("</details>\n")
+
+
+def test_errors():
+    with raises(ValueError):
+        CoverageSummary.from_reporter(read_python_coverage(), sort="size")
+
+    class NoTotals(PythonCoverageParser):
+        def get_total_coverage(self):
+            return None
+
+    with raises(ValueError):
+        CoverageSummary.from_reporter(NoTotals())
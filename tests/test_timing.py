@@ -0,0 +1,78 @@
+#! /usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 2026
+
+Copyright (c) 2026 Deutsche Gesellschaft für Cybersicherheit mbH & Co. KG
+
+@author Merlin Mittelbach
+
+test stage timing
+"""
+from json import load, loads
+from pstats import Stats
+from time import sleep
+from tracemalloc import is_tracing
+
+from pytest import raises
+
+from action.action_main import main
+from action.timing import StageTimer, run_profiled
+
+
+def test_stages(capsys):
+    timer = StageTimer()
+    for _ in range(2):
+        with timer.stage("sleep"):
+            sleep(0.01)
+    assert timer.durations["sleep"] >= 0.02
+    assert timer.to_dict() == {
+        "sleep": timer.durations["sleep"], "total": timer.total
+    }
+    timer.print_outputs()
+    output = capsys.readouterr().out.splitlines()
+    assert len(output) == 1
+    assert loads(output[0][len("::set-output name=timings::"):]) == \
+        timer.to_dict()
+
+
+def test_memory(tmp_path, capsys):
+    timer = StageTimer(trace_memory=True)
+    with timer.stage("allocate"):
+        data = bytearray(10**7)
+    del data
+    # the peak of a stage restarts from the memory in use
+    with timer.stage("small"):
+        data = bytearray(10**3)
+    timer.stop()
+    assert timer.peaks["allocate"] >= 10**7
+    assert timer.peaks["small"] < 10**6
+    timer.print_outputs()
+    assert "::set-output name=memory-peaks::" in capsys.readouterr().out
+    timer.write_trace(tmp_path / "trace.json")
+    with open(tmp_path / "trace.json") as file_handler:
+        trace = load(file_handler)
+    assert [stage["name"] for stage in trace["stages"]] == \
+        ["allocate", "small"]
+    assert trace["stages"][0]["peak_bytes"] == timer.peaks["allocate"]
+    assert trace["total_seconds"] == timer.total
+
+
+def test_profile(tmp_path):
+    assert run_profiled(tmp_path / "profile", sorted, [3, 1, 2]) == [1, 2, 3]
+    assert run_profiled(
+        tmp_path / "profile", sorted, [3, 1, 2], reverse=True
+    ) == [3, 2, 1]
+    assert Stats(str(tmp_path / "profile")).total_calls > 0
+
+
+def test_stop_on_error(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    monkeypatch.setenv("GITHUB_SHA", "b" * 40)
+    with raises(FileNotFoundError):
+        main(
+            "python", None, dry_run="out.ndjson",
+            trace=str(tmp_path / "trace.json")
+        )
+    assert not is_tracing()